@@ -27,15 +27,25 @@ class File(Atom):
     def assign(self, value: FileVal, wait: bool = False) -> None:
         verify_type("value", value, FileVal)
 
-        operation = UploadFile.of_file(
+        deferred_operations = self._container._deferred_operations
+        if value._rendered is not None or deferred_operations.is_pending(self._path):
+            # uploaded once rendered, after the previously deferred uploads
+            deferred_operations.add(self._path, value._rendered, lambda: self._get_upload_operation(value))
+            if wait:
+                self._container.wait()
+            return
+
+        operation = self._get_upload_operation(value)
+        with self._container.lock():
+            self._enqueue_operation(operation, wait)
+
+    def _get_upload_operation(self, value: FileVal) -> UploadFile:
+        return UploadFile.of_file(
             value=value,
             attribute_path=self._path,
             upload_path=self._container._op_processor._operation_storage.upload_path,
         )
 
-        with self._container.lock():
-            self._enqueue_operation(operation, wait)
-
     def upload(self, value, wait: bool = False) -> None:
         self.assign(FileVal.create_from(value), wait)
 
@@ -0,0 +1,214 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "SeriesAggregation",
+    "SeriesAggregator",
+]
+
+import os
+import time
+from dataclasses import dataclass
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from neptune.new.internal.operation import LogFloats
+from neptune.new.internal.utils import verify_type
+from neptune.new.internal.utils.iteration import get_batches
+
+Point = Tuple[float, Optional[float], float]
+"""value, step, timestamp"""
+
+AGGREGATION_METHODS = ("mean", "min", "max", "last", "lttb")
+
+
+@dataclass(frozen=True)
+class SeriesAggregation:
+    """Client-side aggregation of a float series.
+
+    Instead of every logged point, one point per window of `window` points (or of points logged within
+    `interval` seconds, whichever is reached first) is sent. It holds the `method` statistic of the window values,
+    with the step and timestamp of the last point in the window. With the "lttb" method, the point preserving the
+    shape of the curve best is picked from each window (Largest-Triangle-Three-Buckets downsampling).
+
+    If `raw_path` is given, all logged points are also appended to that local CSV file.
+    """
+
+    method: str = "mean"
+    window: int = 100
+    interval: Optional[float] = None
+    raw_path: Optional[str] = None
+
+    def __post_init__(self):
+        verify_type("method", self.method, str)
+        verify_type("window", self.window, int)
+        verify_type("interval", self.interval, (float, int, type(None)))
+        verify_type("raw_path", self.raw_path, (str, type(None)))
+        if self.method not in AGGREGATION_METHODS:
+            raise ValueError(f"Unknown aggregation method {self.method}, expected one of {AGGREGATION_METHODS}")
+        if self.window < 1:
+            raise ValueError("Aggregation window must be a positive number of points")
+        if self.interval is not None and self.interval <= 0:
+            raise ValueError("Aggregation interval must be a positive number of seconds")
+
+    @staticmethod
+    def create(aggregate: Union[str, "SeriesAggregation"]) -> "SeriesAggregation":
+        if isinstance(aggregate, SeriesAggregation):
+            return aggregate
+        verify_type("aggregate", aggregate, (str, SeriesAggregation))
+        return SeriesAggregation(method=aggregate)
+
+
+def _x(point: Point) -> float:
+    return point[1] if point[1] is not None else point[2]
+
+
+def _triangle_area(a: Point, b: Point, c: Tuple[float, float]) -> float:
+    return abs((_x(a) - c[0]) * (b[0] - a[0]) - (_x(a) - _x(b)) * (c[1] - a[0]))
+
+
+class SeriesAggregator:
+    """Rolling window of points logged to a single float series, turned into `LogFloats` operations"""
+
+    def __init__(self, path: List[str], aggregation: SeriesAggregation, max_batch_size: int = 100):
+        self._path = path
+        self._aggregation = aggregation
+        self._max_batch_size = max_batch_size
+        self._window: List[Point] = []
+        self._window_started: Optional[float] = None
+        # lttb: last emitted point and the window waiting for the next one to be selected from
+        self._selected: Optional[Point] = None
+        self._pending: List[Point] = []
+        self._raw_file = None
+
+    @property
+    def aggregation(self) -> SeriesAggregation:
+        return self._aggregation
+
+    def add(self, points: Iterable[Point]) -> List[LogFloats]:
+        points = list(points)
+        self._write_raw(points)
+
+        emitted = []
+        for point in points:
+            if not self._window:
+                self._window_started = time.monotonic()
+            self._window.append(point)
+            if len(self._window) >= self._aggregation.window:
+                emitted.extend(self._complete_window())
+
+        interval = self._aggregation.interval
+        if self._window and interval is not None and time.monotonic() - self._window_started >= interval:
+            emitted.extend(self._complete_window())
+        return self._to_operations(emitted)
+
+    def flush(self) -> List[LogFloats]:
+        """Emits everything that is buffered, including the last logged point with the "lttb" method"""
+        if self._raw_file is not None:
+            self._raw_file.flush()
+        return self._to_operations(self._drain())
+
+    def close(self) -> List[LogFloats]:
+        """Emits everything that is left, including the last point of the series"""
+        emitted = self._drain()
+        self._close_raw_file()
+        return self._to_operations(emitted)
+
+    def _drain(self) -> List[Point]:
+        emitted = self._complete_window() if self._window else []
+        if self._pending:
+            # there's no next window to select against, so the point is selected against the last logged one,
+            # which is kept too and later windows continue from it
+            pending, last = self._pending[:-1], self._pending[-1]
+            if pending:
+                emitted.append(
+                    max(pending, key=lambda point: _triangle_area(self._selected, point, (_x(last), last[0])))
+                )
+            self._selected = last
+            self._pending = []
+            emitted.append(last)
+        return emitted
+
+    def reset(self) -> None:
+        """Drops buffered points, e.g. when the series is cleared"""
+        self._window = []
+        self._selected = None
+        self._pending = []
+
+    def discard(self) -> None:
+        self.reset()
+        self._close_raw_file()
+
+    def _complete_window(self) -> List[Point]:
+        window, self._window = self._window, []
+        method = self._aggregation.method
+        _, step, ts = window[-1]
+        if method == "lttb":
+            return self._select_lttb(window)
+        elif method == "last":
+            return [window[-1]]
+
+        values = [point[0] for point in window]
+        if method == "min":
+            value = min(values)
+        elif method == "max":
+            value = max(values)
+        else:
+            value = sum(values) / len(values)
+        return [(value, step, ts)]
+
+    def _select_lttb(self, window: List[Point]) -> List[Point]:
+        emitted = []
+        if self._selected is None:
+            # the first point is always kept
+            self._selected, window = window[0], window[1:]
+            emitted.append(self._selected)
+        if not window:
+            return emitted
+
+        if self._pending:
+            next_average = (
+                sum(_x(point) for point in window) / len(window),
+                sum(point[0] for point in window) / len(window),
+            )
+            self._selected = max(self._pending, key=lambda point: _triangle_area(self._selected, point, next_average))
+            emitted.append(self._selected)
+        self._pending = window
+        return emitted
+
+    def _to_operations(self, points: List[Point]) -> List[LogFloats]:
+        values = [LogFloats.ValueType(value, step=step, ts=ts) for value, step, ts in points]
+        return [LogFloats(self._path, batch) for batch in get_batches(values, batch_size=self._max_batch_size)]
+
+    def _write_raw(self, points: List[Point]) -> None:
+        raw_path = self._aggregation.raw_path
+        if raw_path is None:
+            return
+        if self._raw_file is None:
+            new_file = not os.path.exists(raw_path) or os.path.getsize(raw_path) == 0
+            self._raw_file = open(raw_path, "a")
+            if new_file:
+                self._raw_file.write("step,timestamp,value\n")
+        self._raw_file.writelines(f"{'' if step is None else step},{ts},{value}\n" for value, step, ts in points)
+
+    def _close_raw_file(self) -> None:
+        if self._raw_file is not None:
+            self._raw_file.close()
+            self._raw_file = None
@@ -13,52 +13,190 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["FetchableSeries"]
+__all__ = [
+    "FetchableSeries",
+    "columns_to_data_frame",
+    "concatenate_columns",
+    "page_to_columns",
+    "to_local_datetimes",
+]
 
 import abc
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    datetime,
+    timezone,
+)
 from typing import (
+    TYPE_CHECKING,
     Dict,
     Generic,
+    Iterator,
+    List,
+    Optional,
     TypeVar,
-    Union,
 )
 
+import numpy
+
+from neptune.new.envs import (
+    NEPTUNE_FETCH_SERIES_PAGE_SIZE,
+    NEPTUNE_FETCH_SERIES_WORKERS,
+)
 from neptune.new.internal.backends.api_model import (
     FloatSeriesValues,
     StringSeriesValues,
 )
+from neptune.new.internal.backends.series_cache import (
+    Columns,
+    SeriesCache,
+    get_series_cache,
+)
+from neptune.new.internal.utils import verify_type
+
+if TYPE_CHECKING:
+    import pandas
 
 Row = TypeVar("Row", StringSeriesValues, FloatSeriesValues)
 
+# local time offsets are looked up once per quarter of an hour, which is the granularity of time zone changes
+_TZ_OFFSET_BUCKET_MILLIS = 15 * 60 * 1000
+
 
 class FetchableSeries(Generic[Row]):
+    _values_dtype = object
+
     @abc.abstractmethod
     def _fetch_values_from_backend(self, offset, limit) -> Row:
         pass
 
-    def fetch_values(self, include_timestamp=True):
-        import pandas as pd
+    def fetch_values(self, include_timestamp: bool = True, page_size: Optional[int] = None) -> "pandas.DataFrame":
+        page_size = self._get_page_size(page_size)
+        self._before_fetch_values()
+        cache = get_series_cache()
+        if cache is None:
+            pages = self._fetch_pages(0, page_size)
+        else:
+            pages = self._fetch_pages_with_cache(cache, page_size)
+        return self._to_data_frame(pages, include_timestamp)
+
+    def iter_values(
+        self, include_timestamp: bool = True, page_size: Optional[int] = None
+    ) -> Iterator["pandas.DataFrame"]:
+        """Yields the values page by page, fetching the next page while the current one is being processed"""
+        page_size = self._get_page_size(page_size)
+        self._before_fetch_values()
+        first_page = self._fetch_values_from_backend(0, page_size)
+        total_count = first_page.totalItemCount
+        page = self._to_columns(first_page)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for offset in range(page_size, total_count + page_size, page_size):
+                next_page = executor.submit(self._fetch_columns, offset, page_size) if offset < total_count else None
+                yield self._to_data_frame([page], include_timestamp)
+                if next_page is None:
+                    return
+                page = next_page.result()
+
+    def _before_fetch_values(self) -> None:
+        pass
+
+    @staticmethod
+    def _get_page_size(page_size: Optional[int]) -> int:
+        verify_type("page_size", page_size, (int, type(None)))
+        if page_size is None:
+            page_size = int(os.getenv(NEPTUNE_FETCH_SERIES_PAGE_SIZE, "1000"))
+        if page_size < 1:
+            raise ValueError("page_size must be a positive number")
+        return page_size
+
+    def _fetch_columns(self, offset: int, limit: int) -> Columns:
+        return self._to_columns(self._fetch_values_from_backend(offset, limit))
+
+    def _fetch_pages(self, offset: int, page_size: int) -> List[Columns]:
+        first_page = self._fetch_values_from_backend(offset, page_size)
+        pages = [self._to_columns(first_page)]
+
+        # once the number of values is known, the remaining pages are fetched concurrently
+        offsets = range(offset + page_size, first_page.totalItemCount, page_size)
+        if offsets:
+            max_workers = min(len(offsets), int(os.getenv(NEPTUNE_FETCH_SERIES_WORKERS, "8")))
+            with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+                pages.extend(executor.map(lambda page_offset: self._fetch_columns(page_offset, page_size), offsets))
+        return pages
+
+    def _fetch_pages_with_cache(self, cache: SeriesCache, page_size: int) -> List[Columns]:
+        cached = cache.get(self._container_id, self._path, self._values_dtype)
+        cached_count = len(cached[0]) if cached is not None else 0
+        if cached_count:
+            # the last cached value is fetched again to make sure the series wasn't cleared in the meantime
+            pages = self._fetch_pages(cached_count - 1, page_size)
+            steps, _, timestamps = pages[0]
+            if len(steps) and _same_step(steps[0], cached[0][-1]) and timestamps[0] == cached[2][-1]:
+                pages[0] = tuple(column[1:] for column in pages[0])
+                new_values = concatenate_columns(pages)
+                if len(new_values[0]):
+                    cache.append(self._container_id, self._path, new_values, cached_count=cached_count)
+                return [cached, new_values]
+            cache.invalidate(self._container_id, self._path)
+
+        pages = self._fetch_pages(0, page_size)
+        values = concatenate_columns(pages)
+        if len(values[0]):
+            cache.append(self._container_id, self._path, values)
+        return [values]
+
+    def _invalidate_cached_values(self) -> None:
+        cache = get_series_cache()
+        if cache is not None:
+            cache.invalidate(self._container_id, self._path)
+
+    def _to_columns(self, page: Row) -> Columns:
+        return page_to_columns(page, self._values_dtype)
+
+    @staticmethod
+    def _to_data_frame(pages: List[Columns], include_timestamp: bool) -> "pandas.DataFrame":
+        return columns_to_data_frame(pages, include_timestamp)
+
+
+def page_to_columns(page: Row, dtype) -> Columns:
+    # the point objects of a page are dropped as soon as the page is converted
+    return (
+        numpy.array([entry.step for entry in page.values], dtype=float),
+        numpy.array([entry.value for entry in page.values], dtype=dtype),
+        numpy.array([entry.timestampMillis for entry in page.values], dtype=numpy.int64),
+    )
+
+
+def columns_to_data_frame(pages: List[Columns], include_timestamp: bool) -> "pandas.DataFrame":
+    import pandas as pd
+
+    steps, values, timestamps = concatenate_columns(pages)
+    data: Dict[str, numpy.ndarray] = {"step": steps, "value": values}
+    if include_timestamp:
+        data["timestamp"] = to_local_datetimes(timestamps)
+    return pd.DataFrame(data)
+
+
+def concatenate_columns(pages: List[Columns]) -> Columns:
+    return tuple(numpy.concatenate(column) for column in zip(*pages))
+
 
-        limit = 1000
-        val = self._fetch_values_from_backend(0, limit)
-        data = val.values
-        offset = limit
+def _same_step(step: float, other: float) -> bool:
+    return step == other or (numpy.isnan(step) and numpy.isnan(other))
 
-        def make_row(entry: Row) -> Dict[str, Union[str, float, datetime]]:
-            row: Dict[str, Union[str, float, datetime]] = dict()
-            row["step"] = entry.step
-            row["value"] = entry.value
-            if include_timestamp:
-                row["timestamp"] = datetime.fromtimestamp(entry.timestampMillis / 1000)
-            return row
 
-        while offset < val.totalItemCount:
-            batch = self._fetch_values_from_backend(offset, limit)
-            data.extend(batch.values)
-            offset += limit
+def to_local_datetimes(timestamps: numpy.ndarray) -> numpy.ndarray:
+    """Converts Unix time in milliseconds to naive local time, like `datetime.fromtimestamp` does"""
+    buckets, bucket_indices = numpy.unique(timestamps // _TZ_OFFSET_BUCKET_MILLIS, return_inverse=True)
+    offsets = numpy.array(
+        [_get_utc_offset_millis(bucket * _TZ_OFFSET_BUCKET_MILLIS) for bucket in buckets], dtype=numpy.int64
+    )
+    return (timestamps + offsets[bucket_indices]).astype("datetime64[ms]").astype("datetime64[ns]")
 
-        rows = dict((n, make_row(entry)) for (n, entry) in enumerate(data))
 
-        df = pd.DataFrame.from_dict(data=rows, orient="index")
-        return df
+def _get_utc_offset_millis(timestamp_millis: int) -> int:
+    return int(
+        datetime.fromtimestamp(timestamp_millis / 1000, tz=timezone.utc).astimezone().utcoffset().total_seconds() * 1000
+    )
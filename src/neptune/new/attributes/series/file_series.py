@@ -18,13 +18,19 @@ __all__ = ["FileSeries"]
 import imghdr
 import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
+    Collection,
     Iterable,
     List,
     Optional,
+    Set,
+    Tuple,
+    Union,
 )
 
 from neptune.new.attributes.series.series import Series
+from neptune.new.envs import NEPTUNE_DOWNLOAD_WORKERS
 from neptune.new.exceptions import (
     FileNotFound,
     OperationNotSupported,
@@ -35,9 +41,19 @@ from neptune.new.internal.operation import (
     LogImages,
     Operation,
 )
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
 from neptune.new.internal.types.file_types import FileType
-from neptune.new.internal.utils import base64_encode
-from neptune.new.internal.utils.limits import image_size_exceeds_limit_for_logging
+from neptune.new.internal.utils import (
+    base64_encode,
+    is_collection,
+    verify_type,
+)
+from neptune.new.internal.utils.images import is_matplotlib_figure
+from neptune.new.internal.utils.limits import (
+    BYTES_IN_MB,
+    image_size_exceeds_limit_for_logging,
+)
+from neptune.new.internal.utils.stringify_value import extract_if_stringify_value
 from neptune.new.types import File
 from neptune.new.types.series.file_series import FileSeries as FileSeriesVal
 
@@ -46,23 +62,83 @@ Data = File
 LogOperation = LogImages
 
 
-class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cls=LogOperation):
-    @classmethod
-    def _map_series_val(cls, value: Val) -> List[ImageValue]:
+class FileSeries(Series[Val, Data, LogOperation], max_batch_size=16, operation_cls=LogOperation):
+    # images logged in a single operation are limited by their total size as well
+    max_batch_bytes = 32 * BYTES_IN_MB
+    max_encoding_workers = min(8, os.cpu_count() or 1)
+
+    def _map_series_val(self, value: Val) -> List[ImageValue]:
+        blob_storage = self._container._op_processor.blob_storage
+        if blob_storage is None:
+            return [
+                ImageValue(data=data, name=value.name, description=value.description)
+                for data in self._map_in_parallel(self._get_base64_image_content, value.values)
+            ]
         return [
-            ImageValue(
-                data=cls._get_base64_image_content(val),
-                name=value.name,
-                description=value.description,
-            )
-            for val in value.values
+            ImageValue(data=None, name=value.name, description=value.description, blob_path=blob_path)
+            for blob_path in self._put_image_blobs(value.values, blob_storage)
         ]
 
+    def _put_image_blobs(self, files: List[File], blob_storage: BlobStorage) -> List[str]:
+        def put(file: File) -> Tuple[Optional[str], Optional[Exception]]:
+            try:
+                return self._get_image_blob(file, blob_storage), None
+            except Exception as e:
+                return None, e
+
+        results = self._map_in_parallel(put, files)
+        errors = [error for _, error in results if error is not None]
+        if errors:
+            # blobs of the valid images won't be referenced by any operation
+            blob_storage.release(blob_path for blob_path, _ in results if blob_path is not None)
+            raise errors[0]
+        return [blob_path for blob_path, _ in results]
+
+    def _get_log_operations_from_value(
+        self, value: Val, *, steps: Union[None, Collection[float]], timestamps: Union[None, Collection[float]]
+    ) -> List[LogOperation]:
+        ops = super()._get_log_operations_from_value(value, steps=steps, timestamps=timestamps)
+        return [LogImages(op.path, values) for op in ops for values in self._split_by_size(op.values)]
+
+    def _split_by_size(self, values: List[LogImages.ValueType]) -> Iterable[List[LogImages.ValueType]]:
+        blob_storage = self._container._op_processor.blob_storage
+        batch, batch_bytes = [], 0
+        for value in values:
+            image = value.value
+            size = (
+                len(image.data) if image.data is not None else os.path.getsize(blob_storage.get_path(image.blob_path))
+            )
+            if batch and batch_bytes + size > self.max_batch_bytes:
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append(value)
+            batch_bytes += size
+        if batch:
+            yield batch
+
+    def _map_in_parallel(self, fun, values: List) -> List:
+        """Applies `fun` to the values in a thread pool, keeping their order.
+
+        Image encoding, hashing and writing are mostly done with the GIL released, so logging many images
+        at once doesn't encode them one by one on the calling thread.
+        """
+        if len(values) < 2 or self.max_encoding_workers < 2:
+            return [fun(value) for value in values]
+        with ThreadPoolExecutor(max_workers=min(self.max_encoding_workers, len(values))) as executor:
+            return list(executor.map(fun, values))
+
     def _get_clear_operation(self) -> Operation:
         return ClearImageLog(self._path)
 
     def _data_to_value(self, values: Iterable, **kwargs) -> Val:
-        return FileSeriesVal(values, **kwargs)
+        if not is_collection(values):
+            raise TypeError("`values` is not a collection")
+        values = [extract_if_stringify_value(value) for value in values]
+        # Matplotlib figures are drawn on the calling thread, as pyplot is not thread-safe
+        files = self._map_in_parallel(
+            lambda value: value if is_matplotlib_figure(value) else File.create_from(value), values
+        )
+        return FileSeriesVal(files, **kwargs)
 
     def _is_value_type(self, value) -> bool:
         return isinstance(value, FileSeriesVal)
@@ -88,16 +164,83 @@ class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cl
 
         return base64_encode(file_content)
 
-    def download(self, destination: Optional[str]):
+    @staticmethod
+    def _get_image_blob(file: File, blob_storage: BlobStorage) -> str:
+        if file.file_type is FileType.LOCAL_FILE:
+            if not os.path.exists(file.path):
+                raise FileNotFound(file.path)
+            if not imghdr.what(file.path):
+                raise OperationNotSupported(
+                    "FileSeries supports only image files for now. Other file types will be implemented in future."
+                )
+            if image_size_exceeds_limit_for_logging(os.path.getsize(file.path)):
+                return blob_storage.put(b"")
+            return blob_storage.put_file(file.path)
+
+        file_content = file.content
+        if not imghdr.what("", h=file_content):
+            raise OperationNotSupported(
+                "FileSeries supports only image files for now. Other file types will be implemented in future."
+            )
+        if image_size_exceeds_limit_for_logging(len(file_content)):
+            file_content = b""
+        return blob_storage.put(file_content)
+
+    def download(
+        self,
+        destination: Optional[str],
+        start: int = 0,
+        end: Optional[int] = None,
+        step: int = 1,
+        workers: Optional[int] = None,
+        skip_existing: bool = True,
+    ):
+        """Downloads the images at the indices `start:end:step` of the series as `<index>.<extension>` files.
+
+        Like slice bounds, negative indices count from the end of the series. Images already present in
+        the destination directory are skipped unless `skip_existing` is `False`, so an interrupted download
+        can be resumed. The images are downloaded in a pool of `workers` threads.
+        """
+        verify_type("start", start, int)
+        verify_type("end", end, (int, type(None)))
+        verify_type("step", step, int)
+        verify_type("workers", workers, (int, type(None)))
+        verify_type("skip_existing", skip_existing, bool)
+        if step == 0:
+            raise ValueError("step cannot be zero")
+        workers = workers or int(os.getenv(NEPTUNE_DOWNLOAD_WORKERS, "8"))
+
         target_dir = self._get_destination(destination)
         item_count = self._backend.get_image_series_values(
             self._container_id, self._container_type, self._path, 0, 1
         ).totalItemCount
-        for i in range(0, item_count):
+        indices = range(item_count)[start:end:step]
+        if skip_existing:
+            downloaded = self._get_downloaded_indices(target_dir)
+            indices = [i for i in indices if i not in downloaded]
+
+        def download_by_index(index: int) -> None:
             self._backend.download_file_series_by_index(
-                self._container_id, self._container_type, self._path, i, target_dir
+                self._container_id, self._container_type, self._path, index, target_dir
             )
 
+        if len(indices) < 2 or workers < 2:
+            for i in indices:
+                download_by_index(i)
+            return
+        with ThreadPoolExecutor(max_workers=min(workers, len(indices))) as executor:
+            for _ in executor.map(download_by_index, indices):
+                pass
+
+    @staticmethod
+    def _get_downloaded_indices(target_dir: str) -> Set[int]:
+        indices = set()
+        for name in os.listdir(target_dir):
+            stem, _, extension = name.partition(".")
+            if stem.isdigit() and extension:
+                indices.add(int(stem))
+        return indices
+
     def download_last(self, destination: Optional[str]):
         target_dir = self._get_destination(destination)
         item_count = self._backend.get_image_series_values(
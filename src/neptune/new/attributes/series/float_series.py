@@ -15,22 +15,39 @@
 #
 __all__ = ["FloatSeries"]
 
+import math
+import time
 from typing import (
+    Collection,
     Iterable,
+    List,
     Optional,
     Union,
 )
 
+import numpy
+
+from neptune.new.attributes.series.aggregation import (
+    SeriesAggregation,
+    SeriesAggregator,
+)
 from neptune.new.attributes.series.fetchable_series import FetchableSeries
 from neptune.new.attributes.series.series import Series
 from neptune.new.internal.backends.api_model import FloatSeriesValues
 from neptune.new.internal.operation import (
     ClearFloatLog,
     ConfigFloatSeries,
+    LogFloatColumns,
     LogFloats,
     Operation,
 )
 from neptune.new.internal.utils import verify_type
+from neptune.new.internal.utils.arrays import (
+    as_float_array,
+    is_array_like,
+    verify_finite,
+    verify_strictly_increasing,
+)
 from neptune.new.internal.utils.logger import logger
 from neptune.new.types.series.float_series import FloatSeries as FloatSeriesVal
 
@@ -42,19 +59,162 @@ LogOperation = LogFloats
 class FloatSeries(
     Series[Val, Data, LogOperation], FetchableSeries[FloatSeriesValues], max_batch_size=100, operation_cls=LogOperation
 ):
+    _values_dtype = float
+
     def configure(
         self,
         min: Optional[Union[float, int]] = None,
         max: Optional[Union[float, int]] = None,
         unit: Optional[str] = None,
         wait: bool = False,
+        aggregate: Union[str, SeriesAggregation, bool, None] = None,
     ) -> None:
-        verify_type("min", min, (float, int))
-        verify_type("max", max, (float, int))
-        verify_type("unit", unit, str)
+        verify_type("min", min, (float, int, type(None)))
+        verify_type("max", max, (float, int, type(None)))
+        verify_type("unit", unit, (str, type(None)))
+        verify_type("aggregate", aggregate, (str, SeriesAggregation, bool, type(None)))
         with self._container.lock():
+            if aggregate is not None:
+                self._set_aggregation(aggregate)
+                if min is None and max is None and unit is None:
+                    if wait:
+                        self._container.wait()
+                    return
             self._enqueue_operation(ConfigFloatSeries(self._path, min, max, unit), wait)
 
+    def _set_aggregation(self, aggregate: Union[str, SeriesAggregation, bool]) -> None:
+        if aggregate is False:
+            aggregator = None
+        elif aggregate is True:
+            aggregator = SeriesAggregator(self._path, SeriesAggregation(), max_batch_size=self.max_batch_size)
+        else:
+            aggregator = SeriesAggregator(
+                self._path, SeriesAggregation.create(aggregate), max_batch_size=self.max_batch_size
+            )
+        self._container._set_series_aggregator(self._path, aggregator)
+
+    def _enqueue_operation(self, operation: Operation, wait: bool):
+        if isinstance(operation, ClearFloatLog):
+            self._invalidate_cached_values()
+        aggregator = self._container._get_series_aggregator(self._path)
+        if aggregator is None:
+            super()._enqueue_operation(operation, wait)
+            return
+
+        if isinstance(operation, LogFloats):
+            ops = aggregator.add((value.value, value.step, value.ts) for value in operation.values)
+        elif isinstance(operation, LogFloatColumns):
+            steps = operation.steps if operation.steps is not None else [None] * len(operation.values)
+            ops = aggregator.add(zip(operation.values, steps, operation.timestamps))
+        else:
+            if isinstance(operation, ClearFloatLog):
+                aggregator.reset()
+            super()._enqueue_operation(operation, wait)
+            return
+
+        for op in ops:
+            super()._enqueue_operation(op, False)
+        if wait:
+            self._container.wait()
+
+    def extend(
+        self,
+        values: Collection[Data],
+        steps: Optional[Collection[float]] = None,
+        timestamps: Optional[Collection[float]] = None,
+        wait: bool = False,
+        **kwargs,
+    ) -> None:
+        if not any(is_array_like(column) for column in (values, steps, timestamps)):
+            super().extend(values, steps=steps, timestamps=timestamps, wait=wait, **kwargs)
+            return
+
+        if kwargs:
+            logger.warning("Warning: unexpected arguments (%s) in FloatSeries", kwargs)
+        ops = self._get_log_operations_from_arrays(values, steps=steps, timestamps=timestamps)
+
+        with self._container.lock():
+            for op in ops:
+                self._enqueue_operation(op, wait)
+
+    def _get_log_operations_from_arrays(
+        self, values, *, steps: Optional[Collection[float]], timestamps: Optional[Collection[float]]
+    ) -> List[LogFloatColumns]:
+        """Vectorized counterpart of `_get_log_operations_from_value` for NumPy arrays and pandas series"""
+        values = as_float_array("values", values)
+
+        if steps is not None:
+            steps = as_float_array("steps", steps)
+            if len(steps) != len(values):
+                raise ValueError(f"Number of steps must be equal to number of values ({len(steps)} != {len(values)}")
+            verify_finite("steps", steps)
+            verify_strictly_increasing("steps", steps)
+        if timestamps is not None:
+            timestamps = as_float_array("timestamps", timestamps)
+            if len(timestamps) != len(values):
+                raise ValueError(
+                    f"Number of timestamps must be equal to number of values ({len(timestamps)} != {len(values)}"
+                )
+            verify_finite("timestamps", timestamps)
+        else:
+            timestamps = numpy.full(len(values), time.time())
+
+        finite = numpy.isfinite(values)
+        if not finite.all():
+            self._warn_about_skipped_values(len(values) - int(finite.sum()))
+            values, timestamps = values[finite], timestamps[finite]
+            if steps is not None:
+                steps = steps[finite]
+
+        return [
+            LogFloatColumns(
+                self._path,
+                values=values[start : start + self.max_batch_size].tolist(),
+                steps=steps[start : start + self.max_batch_size].tolist() if steps is not None else None,
+                timestamps=timestamps[start : start + self.max_batch_size].tolist(),
+            )
+            for start in range(0, len(values), self.max_batch_size)
+        ]
+
+    def _get_log_operations_from_value(
+        self, value: Val, *, steps: Optional[Collection[float]], timestamps: Optional[Collection[float]]
+    ) -> List[LogOperation]:
+        """Applies the rules of `_get_log_operations_from_arrays` to values given as Python collections"""
+        if steps is not None:
+            if not all(math.isfinite(step) for step in steps):
+                raise ValueError("steps must not contain NaN or infinite values")
+            if any(previous >= step for previous, step in zip(steps, list(steps)[1:])):
+                raise ValueError("steps must be strictly increasing")
+        if timestamps is not None and not all(math.isfinite(timestamp) for timestamp in timestamps):
+            raise ValueError("timestamps must not contain NaN or infinite values")
+
+        finite = [math.isfinite(val) for val in value.values]
+        if not all(finite):
+            self._warn_about_skipped_values(finite.count(False))
+            value = FloatSeriesVal([val for val, is_finite in zip(value.values, finite) if is_finite])
+            if steps is not None:
+                steps = [step for step, is_finite in zip(steps, finite) if is_finite]
+            if timestamps is not None:
+                timestamps = [timestamp for timestamp, is_finite in zip(timestamps, finite) if is_finite]
+
+        return super()._get_log_operations_from_value(value, steps=steps, timestamps=timestamps)
+
+    def append(
+        self,
+        value: Data,
+        step: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        wait: bool = False,
+        **kwargs,
+    ) -> None:
+        if isinstance(value, (float, int)) and not math.isfinite(value):
+            self._warn_about_skipped_values(1)
+            return
+        super().append(value, step=step, timestamp=timestamp, wait=wait, **kwargs)
+
+    def _warn_about_skipped_values(self, count: int) -> None:
+        logger.warning("Warning: skipping %d NaN or infinite values logged to %s", count, "/".join(self._path))
+
     def _get_clear_operation(self) -> Operation:
         return ClearFloatLog(self._path)
 
@@ -70,8 +70,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             self.operation_cls(self._path, chunk) for chunk in get_batches(log_values, batch_size=self.max_batch_size)
         ]
 
-    @classmethod
-    def _map_series_val(cls, value: ValTV) -> List[DataTV]:
+    def _map_series_val(self, value: ValTV) -> List[DataTV]:
         return value.values
 
     def _get_config_operation_from_value(self, value: ValTV) -> Optional[LogOperationTV]:
@@ -135,6 +134,24 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             for op in ops:
                 self._enqueue_operation(op, wait)
 
+    def append(
+        self,
+        value: DataTV,
+        step: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        wait: bool = False,
+        **kwargs,
+    ) -> None:
+        """Single value counterpart of `extend`, used by `Handler.append` on existing series"""
+        value = self._data_to_value([value], **kwargs)
+        timestamp = time.time() if timestamp is None else timestamp
+
+        (mapped_value,) = self._map_series_val(value)
+        op = self.operation_cls(self._path, [self.operation_cls.ValueType(mapped_value, step=step, ts=timestamp)])
+
+        with self._container.lock():
+            self._enqueue_operation(op, wait)
+
     def extend(
         self,
         values: Collection[DataTV],
@@ -15,22 +15,23 @@
 #
 __all__ = ["StringSeries"]
 
+import time
 from typing import (
     TYPE_CHECKING,
-    Collection,
     Iterable,
     List,
-    Union,
 )
 
 from neptune.new.attributes.series.fetchable_series import FetchableSeries
 from neptune.new.attributes.series.series import Series
+from neptune.new.attributes.series.string_series_stream import StringSeriesStream
 from neptune.new.internal.backends.api_model import StringSeriesValues
 from neptune.new.internal.operation import (
     ClearStringLog,
     LogStrings,
     Operation,
 )
+from neptune.new.internal.utils import verify_type
 from neptune.new.internal.utils.logger import logger
 from neptune.new.internal.utils.paths import path_to_str
 from neptune.new.types.series.string_series import MAX_STRING_SERIES_VALUE_LENGTH
@@ -51,9 +52,7 @@ class StringSeries(
         super().__init__(container, path)
         self._value_truncation_occurred = False
 
-    def _get_log_operations_from_value(
-        self, value: Val, *, steps: Union[None, Collection[float]], timestamps: Union[None, Collection[float]]
-    ) -> List[LogOperation]:
+    def _map_series_val(self, value: Val) -> List[Data]:
         if not self._value_truncation_occurred and value.truncated:
             # the first truncation
             self._value_truncation_occurred = True
@@ -65,7 +64,52 @@ class StringSeries(
                 MAX_STRING_SERIES_VALUE_LENGTH,
             )
 
-        return super()._get_log_operations_from_value(value, steps=steps, timestamps=timestamps)
+        return super()._map_series_val(value)
+
+    def configure(self, stream: bool, wait: bool = False) -> None:
+        """Turns the streaming mode on or off.
+
+        In the streaming mode, logged values are buffered and sent in batches about once a second.
+        """
+        verify_type("stream", stream, bool)
+        with self._container.lock():
+            if not stream:
+                self._container._set_string_series_stream(self._path, None)
+            elif self._container._get_string_series_stream(self._path) is None:
+                self._container._set_string_series_stream(self._path, StringSeriesStream(self._path))
+            if wait:
+                self._container.wait()
+
+    def write(self, text: str, wait: bool = False) -> None:
+        """Logs raw text in the streaming mode, turning it on if needed. Every line of the text becomes a value."""
+        verify_type("text", text, str)
+        with self._container.lock():
+            stream = self._container._get_string_series_stream(self._path)
+            if stream is None:
+                stream = StringSeriesStream(self._path)
+                self._container._set_string_series_stream(self._path, stream)
+            for op in stream.write(text, time.time()):
+                super()._enqueue_operation(op, False)
+            if wait:
+                self._container.wait()
+
+    def _enqueue_operation(self, operation: Operation, wait: bool):
+        if isinstance(operation, ClearStringLog):
+            self._invalidate_cached_values()
+        stream = self._container._get_string_series_stream(self._path)
+        if stream is None:
+            super()._enqueue_operation(operation, wait)
+            return
+
+        if isinstance(operation, LogStrings):
+            for op in stream.add((value.value, value.step, value.ts) for value in operation.values):
+                super()._enqueue_operation(op, False)
+            if wait:
+                self._container.wait()
+        else:
+            if isinstance(operation, ClearStringLog):
+                stream.reset()
+            super()._enqueue_operation(operation, wait)
 
     def _get_clear_operation(self) -> Operation:
         return ClearStringLog(self._path)
@@ -80,6 +124,7 @@ class StringSeries(
         return isinstance(value, StringSeriesVal)
 
     def fetch_last(self) -> str:
+        self._flush_stream()
         val = self._backend.get_string_series_attribute(self._container_id, self._container_type, self._path)
         return val.last
 
@@ -87,3 +132,14 @@ class StringSeries(
         return self._backend.get_string_series_values(
             self._container_id, self._container_type, self._path, offset, limit
         )
+
+    def _before_fetch_values(self) -> None:
+        self._flush_stream()
+
+    def _flush_stream(self) -> None:
+        """Sends the buffered values, so that fetching in synchronous modes includes them"""
+        with self._container.lock():
+            stream = self._container._get_string_series_stream(self._path)
+            if stream is not None:
+                for op in stream.flush():
+                    super()._enqueue_operation(op, False)
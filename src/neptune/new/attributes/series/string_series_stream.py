@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "StringSeriesStream",
+    "StringSeriesStreamFlusher",
+]
+
+import re
+import time
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from neptune.new.internal.operation import LogStringColumns
+from neptune.new.internal.threading.daemon import Daemon
+from neptune.new.internal.utils.iteration import get_batches
+from neptune.new.types.series.string_series import MAX_STRING_SERIES_VALUE_LENGTH
+
+if TYPE_CHECKING:
+    from neptune.new.metadata_containers import MetadataContainer
+
+Line = Tuple[str, Optional[float], float]
+"""value, step, timestamp"""
+
+_LINE_END = re.compile(r"\r\n|\n|\r")
+
+
+class StringSeriesStream:
+    """Buffer of values logged to a single string series, sent as `LogStringColumns` operations.
+
+    Buffered values are sent once `interval` seconds passed since the oldest of them was logged, or once there are
+    `max_lines` of them. Raw text written with `write` is split into lines first. A line ended with a carriage
+    return (a redrawn progress bar) is replaced by the next line if it hasn't been sent yet.
+    """
+
+    def __init__(self, path: List[str], interval: float = 1.0, max_lines: int = 1000):
+        self._path = path
+        self._interval = interval
+        self._max_lines = max_lines
+        self._lines: List[Line] = []
+        self._oldest: Optional[float] = None
+        self._partial = ""
+        self._partial_ts: Optional[float] = None
+        self._last_overwritable = False
+
+    def add(self, values: Iterable[Line]) -> List[LogStringColumns]:
+        for value, step, ts in values:
+            self._append(value, step, ts, overwritable=False)
+        return self._flush_if_full()
+
+    def write(self, text: str, ts: float) -> List[LogStringColumns]:
+        if self._partial_ts is None:
+            self._partial_ts = ts
+        text = self._partial + text
+        position = 0
+        for line_end in _LINE_END.finditer(text):
+            line = text[position : line_end.start()]
+            position = line_end.end()
+            overwritable = line_end.group() == "\r"
+            if not line and self._last_overwritable and not overwritable:
+                # "\r" and "\n" written separately, the last redrawn line is final
+                self._last_overwritable = False
+            elif line or not overwritable:
+                self._append(line, None, self._partial_ts, overwritable)
+            self._partial_ts = ts
+        self._partial = text[position:]
+        if len(self._partial) >= MAX_STRING_SERIES_VALUE_LENGTH:
+            self._append(self._partial, None, self._partial_ts, overwritable=False)
+            self._partial = ""
+        if not self._partial:
+            self._partial_ts = None
+        return self._flush_if_full()
+
+    def is_due(self) -> bool:
+        return self._oldest is not None and time.monotonic() - self._oldest >= self._interval
+
+    def flush(self, final: bool = False) -> List[LogStringColumns]:
+        """Emits the buffered values, including an unfinished line if `final`"""
+        if final and self._partial:
+            self._append(self._partial, None, self._partial_ts, overwritable=False)
+            self._partial = ""
+            self._partial_ts = None
+        lines, self._lines = self._lines, []
+        self._oldest = None
+        self._last_overwritable = False
+        return self._to_operations(lines)
+
+    def reset(self) -> None:
+        """Drops buffered values, e.g. when the series is cleared"""
+        self._lines = []
+        self._oldest = None
+        self._partial = ""
+        self._partial_ts = None
+        self._last_overwritable = False
+
+    def _append(self, value: str, step: Optional[float], ts: float, overwritable: bool) -> None:
+        if self._last_overwritable:
+            self._lines.pop()
+        self._lines.append((value[:MAX_STRING_SERIES_VALUE_LENGTH], step, ts))
+        self._last_overwritable = overwritable
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+    def _flush_if_full(self) -> List[LogStringColumns]:
+        return self.flush() if len(self._lines) >= self._max_lines else []
+
+    def _to_operations(self, lines: List[Line]) -> List[LogStringColumns]:
+        operations = []
+        for batch in get_batches(lines, batch_size=self._max_lines):
+            values, steps, timestamps = (list(column) for column in zip(*batch))
+            has_steps = any(step is not None for step in steps)
+            operations.append(LogStringColumns(self._path, values, steps if has_steps else None, timestamps))
+        return operations
+
+
+class StringSeriesStreamFlusher(Daemon):
+    """Sends values buffered in the streams of a container once they are due"""
+
+    def __init__(self, container: "MetadataContainer", sleep_time: float = 0.2):
+        super().__init__(sleep_time=sleep_time, name="NeptuneStringSeriesFlusher")
+        self._container = container
+
+    def work(self) -> None:
+        with self._container.lock():
+            self._container._flush_string_series_streams(due_only=True)
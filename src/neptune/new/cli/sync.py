@@ -94,6 +94,8 @@ class SyncRunner(AbstractBackendRunner):
                     break
                 version = batch[-1].ver
                 batch = [element.obj for element in batch]
+                for op in batch:
+                    op.resolve_blob_paths(execution_path.resolve())
 
                 start_time = time.monotonic()
                 expected_count = len(batch)
@@ -26,6 +26,26 @@ __all__ = [
     "NEPTUNE_SYNC_BATCH_TIMEOUT_ENV",
     "NEPTUNE_SUBPROCESS_KILL_TIMEOUT",
     "NEPTUNE_FETCH_TABLE_STEP_SIZE",
+    "NEPTUNE_FETCH_TABLE_WORKERS",
+    "NEPTUNE_FETCH_SERIES_PAGE_SIZE",
+    "NEPTUNE_FETCH_SERIES_WORKERS",
+    "NEPTUNE_SERIES_CACHE",
+    "NEPTUNE_SERIES_CACHE_DIR",
+    "NEPTUNE_SERIES_CACHE_MAX_MB",
+    "NEPTUNE_ARTIFACT_TRACKING_WORKERS",
+    "NEPTUNE_HTTP_POOL_CONNECTIONS",
+    "NEPTUNE_HTTP_POOL_MAXSIZE",
+    "NEPTUNE_HTTP_POOL_BLOCK",
+    "NEPTUNE_HTTP_KEEP_ALIVE",
+    "NEPTUNE_API_CACHE",
+    "NEPTUNE_API_CACHE_DIR",
+    "NEPTUNE_API_CACHE_TTL",
+    "NEPTUNE_RENDER_WORKERS",
+    "NEPTUNE_RENDER_MAX_PENDING",
+    "NEPTUNE_RENDER_MAX_PENDING_MB",
+    "NEPTUNE_MONITORING_SAMPLING_PERIOD",
+    "NEPTUNE_MONITORING_AGGREGATION",
+    "NEPTUNE_DOWNLOAD_WORKERS",
 ]
 
 from neptune.common.envs import API_TOKEN_ENV_NAME
@@ -52,4 +72,44 @@ NEPTUNE_SUBPROCESS_KILL_TIMEOUT = "NEPTUNE_SUBPROCESS_KILL_TIMEOUT"
 
 NEPTUNE_FETCH_TABLE_STEP_SIZE = "NEPTUNE_FETCH_TABLE_STEP_SIZE"
 
+NEPTUNE_FETCH_TABLE_WORKERS = "NEPTUNE_FETCH_TABLE_WORKERS"
+
+NEPTUNE_FETCH_SERIES_PAGE_SIZE = "NEPTUNE_FETCH_SERIES_PAGE_SIZE"
+
+NEPTUNE_FETCH_SERIES_WORKERS = "NEPTUNE_FETCH_SERIES_WORKERS"
+
+NEPTUNE_SERIES_CACHE = "NEPTUNE_SERIES_CACHE"
+
+NEPTUNE_SERIES_CACHE_DIR = "NEPTUNE_SERIES_CACHE_DIR"
+
+NEPTUNE_SERIES_CACHE_MAX_MB = "NEPTUNE_SERIES_CACHE_MAX_MB"
+
+NEPTUNE_ARTIFACT_TRACKING_WORKERS = "NEPTUNE_ARTIFACT_TRACKING_WORKERS"
+
+NEPTUNE_HTTP_POOL_CONNECTIONS = "NEPTUNE_HTTP_POOL_CONNECTIONS"
+
+NEPTUNE_HTTP_POOL_MAXSIZE = "NEPTUNE_HTTP_POOL_MAXSIZE"
+
+NEPTUNE_HTTP_POOL_BLOCK = "NEPTUNE_HTTP_POOL_BLOCK"
+
+NEPTUNE_HTTP_KEEP_ALIVE = "NEPTUNE_HTTP_KEEP_ALIVE"
+
+NEPTUNE_API_CACHE = "NEPTUNE_API_CACHE"
+
+NEPTUNE_API_CACHE_DIR = "NEPTUNE_API_CACHE_DIR"
+
+NEPTUNE_API_CACHE_TTL = "NEPTUNE_API_CACHE_TTL"
+
+NEPTUNE_RENDER_WORKERS = "NEPTUNE_RENDER_WORKERS"
+
+NEPTUNE_RENDER_MAX_PENDING = "NEPTUNE_RENDER_MAX_PENDING"
+
+NEPTUNE_RENDER_MAX_PENDING_MB = "NEPTUNE_RENDER_MAX_PENDING_MB"
+
+NEPTUNE_MONITORING_SAMPLING_PERIOD = "NEPTUNE_MONITORING_SAMPLING_PERIOD"
+
+NEPTUNE_MONITORING_AGGREGATION = "NEPTUNE_MONITORING_AGGREGATION"
+
+NEPTUNE_DOWNLOAD_WORKERS = "NEPTUNE_DOWNLOAD_WORKERS"
+
 S3_ENDPOINT_URL = "S3_ENDPOINT_URL"
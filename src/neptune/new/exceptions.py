@@ -68,6 +68,7 @@ __all__ = [
     "NeptuneLegacyProjectException",
     "NeptuneUninitializedException",
     "NeptuneIntegrationNotInstalledException",
+    "NeptuneMissingRequirementException",
     "NeptuneLimitExceedException",
     "NeptuneFieldCountLimitExceedException",
     "NeptuneStorageLimitException",
@@ -996,6 +997,27 @@ You may also want to check the following docs page:
         )
 
 
+class NeptuneMissingRequirementException(NeptuneException):
+    def __init__(self, package_name: str, feature_name: str):
+        message = """
+{h1}
+----NeptuneMissingRequirementException-----------------------------------------
+{end}
+{feature_name} requires {package_name}, which wasn't installed.
+To install, run:
+    {bash}pip install {package_name}{end}
+
+{correct}Need help?{end}-> https://docs.neptune.ai/getting_help
+"""
+        super().__init__(
+            message.format(
+                package_name=package_name,
+                feature_name=feature_name,
+                **STYLES,
+            )
+        )
+
+
 class NeptuneLimitExceedException(NeptuneException):
     def __init__(self, reason: str):
         message = """
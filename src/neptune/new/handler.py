@@ -15,6 +15,7 @@
 #
 __all__ = ["Handler"]
 
+import time
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
@@ -39,7 +40,9 @@ from neptune.new.attributes.constants import SYSTEM_STAGE_ATTRIBUTE_PATH
 from neptune.new.attributes.file_set import FileSet
 from neptune.new.attributes.namespace import Namespace
 from neptune.new.attributes.series import FileSeries
+from neptune.new.attributes.series.aggregation import SeriesAggregation
 from neptune.new.attributes.series.float_series import FloatSeries
+from neptune.new.attributes.series.series import Series
 from neptune.new.attributes.series.string_series import StringSeries
 from neptune.new.attributes.sets.string_set import StringSet
 from neptune.new.exceptions import (
@@ -48,6 +51,7 @@ from neptune.new.exceptions import (
     NeptuneUserApiInputException,
 )
 from neptune.new.internal.artifacts.types import ArtifactFileData
+from neptune.new.internal.operation import LogMultipleFloats
 from neptune.new.internal.utils import (
     is_collection,
     is_dict_like,
@@ -59,6 +63,7 @@ from neptune.new.internal.utils import (
     verify_collection_type,
     verify_type,
 )
+from neptune.new.internal.utils.arrays import is_array_like
 from neptune.new.internal.utils.paths import (
     join_paths,
     parse_path,
@@ -385,6 +390,14 @@ class Handler:
         """
         verify_type("step", step, (int, float, type(None)))
         verify_type("timestamp", timestamp, (int, float, type(None)))
+
+        if not (isinstance(value, Namespace) or is_dict_like(value) or is_collection(value)):
+            # fast path for logging in a loop: single value appended to an existing series
+            attr = self._container.get_attribute(self._path)
+            if isinstance(attr, Series):
+                attr.append(value, step=step, timestamp=timestamp, wait=wait, **kwargs)
+                return
+
         if step is not None:
             step = [step]
         if timestamp is not None:
@@ -443,6 +456,119 @@ class Handler:
 
             attr.extend(values, steps=steps, timestamps=timestamps, wait=wait, **kwargs)
 
+    @check_protected_paths
+    def log_metrics(
+        self,
+        metrics: Dict[str, Any],
+        step: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        wait: bool = False,
+    ) -> None:
+        """Appends one value to each of many float series at once, such as all metrics of a training step.
+
+        Compared to `append` with a dictionary, the container lock is taken once and all the values
+        are sent to the queue as a single operation.
+
+        Args:
+            metrics: Dictionary of values, possibly nested, keyed by paths relative to this field.
+            step: Optional index of the entries being appended, shared by all the series. Must be strictly increasing.
+            timestamp: Optional time index of the entries being appended, in Unix time format.
+                If None, the current time (obtained with `time.time()`) is used.
+            wait: If True, the client sends all tracked metadata to the server before executing the call.
+                For details, see https://docs.neptune.ai/api/universal/#wait
+
+        Example:
+            >>> import neptune.new as neptune
+            >>> run = neptune.init_run()
+            >>> for step, batch in enumerate(loader):
+            ...     ... # Your training loop
+            ...     run["train"].log_metrics({"loss": loss, "lr": lr, "grad_norm": grad_norms}, step=step)
+        """
+        verify_type("step", step, (int, float, type(None)))
+        verify_type("timestamp", timestamp, (int, float, type(None)))
+        if not is_dict_like(metrics):
+            raise TypeError("metrics must be a dict (was {})".format(type(metrics)))
+        values = ExtendUtils.flatten_metrics(metrics)
+        timestamp = time.time() if timestamp is None else timestamp
+
+        with self._container.lock():
+            attributes = dict()
+            for relative_path in values:
+                path = join_paths(self._path, relative_path)
+                validate_path_not_protected(path, self)
+                attr = self._container.get_attribute(path)
+                if attr is not None and not isinstance(attr, FloatSeries):
+                    raise NeptuneUserApiInputException(
+                        f"Cannot log metrics to '{path}', which is a {type(attr).__name__}, not a FloatSeries"
+                    )
+                attributes[relative_path] = (path, attr)
+
+            batched_values = dict()
+            for relative_path, (path, attr) in attributes.items():
+                if attr is None:
+                    attr = FloatSeries(self._container, parse_path(path))
+                    self._container.set_attribute(path, attr)
+                if self._container._get_series_aggregator(attr._path) is not None:
+                    attr.append(values[relative_path], step=step, timestamp=timestamp)
+                else:
+                    batched_values[relative_path] = values[relative_path]
+
+            if batched_values:
+                self._container._op_processor.enqueue_operation(
+                    LogMultipleFloats(parse_path(self._path), batched_values, step, timestamp), False
+                )
+            if wait:
+                self._container.wait()
+
+    @check_protected_paths
+    def configure(
+        self,
+        min: Optional[Union[float, int]] = None,
+        max: Optional[Union[float, int]] = None,
+        unit: Optional[str] = None,
+        aggregate: Union[str, SeriesAggregation, bool, None] = None,
+        stream: Optional[bool] = None,
+        wait: bool = False,
+    ) -> None:
+        """Configures a `FloatSeries` or a `StringSeries` field, creating it if it doesn't exist yet.
+
+        Args:
+            min: Lower bound of the values shown on charts.
+            max: Upper bound of the values shown on charts.
+            unit: Unit of the values.
+            aggregate: Aggregates logged values on the client side, so that only one point per window is sent.
+                One of "mean", "min", "max", "last", "lttb", or `SeriesAggregation` to also set the window size,
+                the time interval or a local file the raw values are saved to. `False` turns aggregation off.
+            stream: String series only. If True, logged values are buffered and sent in batches about once a second,
+                which is much cheaper for series logged to very often, e.g. with progress output.
+            wait: If True, the client sends all tracked metadata to the server before executing the call.
+                For details, see https://docs.neptune.ai/api/universal/#wait
+
+        Example:
+            >>> import neptune.new as neptune
+            >>> from neptune.new.attributes.series.aggregation import SeriesAggregation
+            >>> run = neptune.init_run()
+            >>> run["train/loss"].configure(aggregate=SeriesAggregation("mean", window=1000, interval=10))
+            >>> for loss in losses:
+            ...     run["train/loss"].append(loss)
+            >>> run["train/progress"].configure(stream=True)
+        """
+        with self._container.lock():
+            attr = self._container.get_attribute(self._path)
+            if attr is None:
+                attr_type = StringSeries if stream is not None else FloatSeries
+                attr = attr_type(self._container, parse_path(self._path))
+                self._container.set_attribute(self._path, attr)
+            if isinstance(attr, StringSeries):
+                if min is not None or max is not None or unit is not None or aggregate is not None:
+                    raise NeptuneUserApiInputException("Only `stream` can be configured for a string series")
+                if stream is not None:
+                    attr.configure(stream=stream, wait=wait)
+            elif stream is not None:
+                raise NeptuneUserApiInputException("`stream` can be configured only for a string series")
+            else:
+                attr.configure(min=min, max=max, unit=unit, aggregate=aggregate, wait=wait)
+
     @check_protected_paths
     def add(self, values: Union[str, Iterable[str]], wait: bool = False) -> None:
         """Adds the provided tag or tags to the run's tags.
@@ -556,7 +682,7 @@ class Handler:
         """
         return self._pass_call_to_attr(function_name="fetch_last")
 
-    def fetch_values(self, include_timestamp: Optional[bool] = True):
+    def fetch_values(self, include_timestamp: Optional[bool] = True, page_size: Optional[int] = None):
         """Fetches all values stored in the series from Neptune servers.
 
         Available for following field types (`Field types docs page`_):
@@ -566,6 +692,12 @@ class Handler:
         Args:
             include_timestamp (bool, optional): Whether the fetched data should include the timestamp field.
                 Defaults to `True`.
+            page_size (int, optional): Number of values fetched in a single request. Pages after the first one
+                are fetched concurrently. Defaults to `None`, which means 1000 or the value of
+                the `NEPTUNE_FETCH_SERIES_PAGE_SIZE` environment variable.
+
+        If the `NEPTUNE_SERIES_CACHE` environment variable is set to `True`, the fetched values are kept
+        in a local cache, and subsequent calls only fetch the values logged since then.
 
         Returns:
             ``Pandas.DataFrame``: containing all the values and their indexes stored in the series field.
@@ -573,7 +705,41 @@ class Handler:
         .. _Field types docs page:
            https://docs.neptune.ai/api-reference/field-types
         """
-        return self._pass_call_to_attr(function_name="fetch_values", include_timestamp=include_timestamp)
+        return self._pass_call_to_attr(
+            function_name="fetch_values", include_timestamp=include_timestamp, page_size=page_size
+        )
+
+    def iter_values(self, include_timestamp: Optional[bool] = True, page_size: Optional[int] = None):
+        """Fetches the values stored in the series from Neptune servers page by page.
+
+        Unlike `fetch_values`, the series doesn't have to fit in memory at once. The next page is fetched
+        while the current one is being processed.
+
+        Available for following field types (`Field types docs page`_):
+            * `FloatSeries`
+            * `StringSeries`
+
+        Args:
+            include_timestamp (bool, optional): Whether the fetched data should include the timestamp field.
+                Defaults to `True`.
+            page_size (int, optional): Number of values in a page. Defaults to `None`, which means 1000
+                or the value of the `NEPTUNE_FETCH_SERIES_PAGE_SIZE` environment variable.
+
+        Returns:
+            Iterator of ``Pandas.DataFrame``, each containing one page of the values and their indexes.
+
+        Example:
+            >>> import neptune.new as neptune
+            >>> run = neptune.init_run(with_id="NER-2", mode="read-only")
+            >>> for page in run["train/loss"].iter_values(page_size=10000):
+            ...     print(page["value"].max())
+
+        .. _Field types docs page:
+           https://docs.neptune.ai/api-reference/field-types
+        """
+        return self._pass_call_to_attr(
+            function_name="iter_values", include_timestamp=include_timestamp, page_size=page_size
+        )
 
     @check_protected_paths
     def delete_files(self, paths: Union[str, Iterable[str]], wait: bool = False) -> None:
@@ -596,7 +762,14 @@ class Handler:
         return self._pass_call_to_attr(function_name="delete_files", paths=paths, wait=wait)
 
     @check_protected_paths
-    def download(self, destination: str = None) -> None:
+    def download(
+        self,
+        destination: str = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        step: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> None:
         """Downloads the stored file or files to the working directory or specified destination.
 
         Available for following field types (`Field types docs page`_):
@@ -612,11 +785,35 @@ class Handler:
                 composed from field name and extension (if present).
                 If `destination` is a path to a file, the file will be downloaded under the specified name.
                 Defaults to `None`.
+            start (int, optional): `FileSeries` only. Index of the first image to download. Defaults to `None`,
+                which means the first image of the series.
+            end (int, optional): `FileSeries` only. Index past the last image to download; negative values count
+                from the end of the series. Defaults to `None`, which means the end of the series.
+            step (int, optional): `FileSeries` only. Step between indices of the downloaded images.
+                Defaults to `None`, which means every image.
+            workers (int, optional): `FileSeries` only. Number of concurrent downloads. Defaults to `None`,
+                which means 8 or the value of the `NEPTUNE_DOWNLOAD_WORKERS` environment variable.
+
+        Images of a `FileSeries` are stored as `<index>.<extension>` files; the ones already present
+        in the destination directory are not downloaded again.
+
+        Example:
+            >>> import neptune.new as neptune
+            >>> run = neptune.init_run(with_id="NER-2", mode="read-only")
+            >>> # Download every tenth of the last 1000 images
+            >>> run["train/predictions"].download("predictions", start=-1000, step=10)
 
         .. _Field types docs page:
            https://docs.neptune.ai/api-reference/field-types
         """
-        return self._pass_call_to_attr(function_name="download", destination=destination)
+        series_args = {"start": start, "end": end, "step": step, "workers": workers}
+        series_args = {name: value for name, value in series_args.items() if value is not None}
+        attr = self._get_attribute()
+        if series_args and not isinstance(attr, FileSeries):
+            raise NeptuneUserApiInputException(
+                f"{', '.join(f'`{name}`' for name in series_args)} can be passed only when downloading a file series"
+            )
+        return attr.download(destination=destination, **series_args)
 
     def download_last(self, destination: str = None) -> None:
         """Downloads the stored file or files to the working directory or specified destination.
@@ -697,6 +894,21 @@ class ExtendUtils:
         else:
             return [value]
 
+    @staticmethod
+    def flatten_metrics(metrics, prefix: str = "") -> Dict[str, float]:
+        """Flattens nested dictionaries of metrics into float values keyed by relative paths"""
+        result = dict()
+        for key, value in metrics.items():
+            verify_type("metrics key", key, str)
+            path = join_paths(prefix, key)
+            if is_dict_like(value):
+                result.update(ExtendUtils.flatten_metrics(value, path))
+            elif is_float(value) or (not is_string(value) and is_float_like(value)):
+                result[path] = float(value)
+            else:
+                raise TypeError("Value of '{}' must be a float or int (was {})".format(path, type(value)))
+        return result
+
     @staticmethod
     def validate_values_for_extend(values, steps, timestamps):
         """Validates if input data is a collection or Namespace with collections leafs.
@@ -720,7 +932,7 @@ class ExtendUtils:
         if isinstance(values, Namespace) or is_dict_like(values):
             for val in values.values():
                 yield from ExtendUtils.generate_leaf_collection_lengths(val)
-        elif is_collection(values):
+        elif is_collection(values) or is_array_like(values):
             yield len(values)
         else:
             raise NeptuneUserApiInputException("Values must be a collection or Namespace leafs must be collections")
@@ -64,7 +64,7 @@ class NeptuneHandler(logging.Handler):
 
         super().__init__(level=level)
         self._run = run
-        self._logger = Logger(run, path)
+        self._logger = Logger(run, path, stream=True)
         self._thread_local = threading.local()
 
         self._run[INTEGRATION_VERSION_KEY] = neptune_client_version
@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "ApiCache",
+    "ApiCacheEntry",
+    "get_api_cache",
+]
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Optional,
+)
+
+from neptune.new.envs import (
+    NEPTUNE_API_CACHE,
+    NEPTUNE_API_CACHE_DIR,
+    NEPTUNE_API_CACHE_TTL,
+)
+from neptune.new.internal.utils.logger import logger
+from neptune.new.version import version as neptune_client_version
+
+DEFAULT_API_CACHE_TTL = 3600
+
+
+@dataclass
+class ApiCacheEntry:
+    data: Any
+    etag: Optional[str]
+    fetched_at: float
+    fresh: bool
+
+
+class ApiCache:
+    """Small on-disk cache of API responses which rarely change, like swagger specs and client config.
+
+    Entries are keyed by the requested url and the version of this library. They are considered fresh
+    for `ttl` seconds after being fetched or revalidated; stale entries should be revalidated with the server
+    (using their ETag, if known) before use.
+    """
+
+    def __init__(self, dir_path: Path, ttl: float):
+        self._dir_path = Path(dir_path)
+        self._ttl = ttl
+
+    @property
+    def dir_path(self) -> Path:
+        return self._dir_path
+
+    def get(self, kind: str, url: str) -> Optional[ApiCacheEntry]:
+        try:
+            with open(self._entry_path(kind, url), "r") as entry_file:
+                entry = json.load(entry_file)
+            fetched_at = float(entry["fetched_at"])
+            return ApiCacheEntry(
+                data=entry["data"],
+                etag=entry.get("etag"),
+                fetched_at=fetched_at,
+                fresh=time.time() - fetched_at < self._ttl,
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.debug("Ignoring unreadable API cache entry for %s", url)
+            return None
+
+    def put(self, kind: str, url: str, data: Any, etag: Optional[str] = None) -> None:
+        entry_path = self._entry_path(kind, url)
+        tmp_path = self._dir_path / f".tmp-{uuid.uuid4().hex}"
+        try:
+            os.makedirs(self._dir_path, exist_ok=True)
+            with open(tmp_path, "w") as entry_file:
+                json.dump(
+                    {"url": url, "etag": etag, "fetched_at": time.time(), "data": data},
+                    entry_file,
+                )
+            os.replace(tmp_path, entry_path)
+        except (OSError, TypeError, ValueError):
+            logger.debug("Cannot store API cache entry for %s", url)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _entry_path(self, kind: str, url: str) -> Path:
+        key = hashlib.sha1(f"{url}@{neptune_client_version}".encode("utf-8")).hexdigest()
+        return self._dir_path / f"{kind}-{key}.json"
+
+
+def get_api_cache() -> Optional[ApiCache]:
+    if os.getenv(NEPTUNE_API_CACHE, "True").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    dir_path = os.getenv(NEPTUNE_API_CACHE_DIR) or Path.home() / ".neptune" / "api-cache"
+    ttl = float(os.getenv(NEPTUNE_API_CACHE_TTL, str(DEFAULT_API_CACHE_TTL)))
+    return ApiCache(dir_path=Path(dir_path), ttl=ttl)
@@ -42,7 +42,10 @@ __all__ = [
     "StringSetAttribute",
 ]
 
-from dataclasses import dataclass
+from dataclasses import (
+    asdict,
+    dataclass,
+)
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -134,6 +137,33 @@ class ClientConfig:
     def has_feature(self, feature_name: str) -> bool:
         return feature_name not in self._missing_features
 
+    def to_dict(self) -> dict:
+        def version_str(ver: Optional[version.Version]) -> Optional[str]:
+            return str(ver) if ver is not None else None
+
+        return {
+            "api_url": self.api_url,
+            "display_url": self.display_url,
+            "missing_features": sorted(self._missing_features),
+            "version_info": {
+                "min_recommended": version_str(self.version_info.min_recommended),
+                "min_compatible": version_str(self.version_info.min_compatible),
+                "max_compatible": version_str(self.version_info.max_compatible),
+            },
+            "multipart_config": asdict(self.multipart_config) if self.multipart_config else None,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "ClientConfig":
+        multipart_config = data["multipart_config"]
+        return ClientConfig(
+            api_url=data["api_url"],
+            display_url=data["display_url"],
+            _missing_features=frozenset(data["missing_features"]),
+            version_info=VersionInfo.build(**data["version_info"]),
+            multipart_config=MultipartConfig(**multipart_config) if multipart_config else None,
+        )
+
     @staticmethod
     def from_api_response(config) -> "ClientConfig":
         missing_features = []
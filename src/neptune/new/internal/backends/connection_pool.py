@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "ConnectionPoolConfig",
+    "ConnectionStats",
+    "PooledHTTPAdapter",
+    "mount_connection_pool",
+]
+
+import os
+import socket
+import threading
+from dataclasses import dataclass
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+)
+
+from neptune.new.envs import (
+    NEPTUNE_HTTP_KEEP_ALIVE,
+    NEPTUNE_HTTP_POOL_BLOCK,
+    NEPTUNE_HTTP_POOL_CONNECTIONS,
+    NEPTUNE_HTTP_POOL_MAXSIZE,
+)
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    pool_connections: int = 10
+    """Number of hosts for which connection pools are kept"""
+    pool_maxsize: int = 32
+    """Maximum number of connections kept open to a single host"""
+    pool_block: bool = False
+    """Whether to wait for a free connection instead of opening one that won't be kept in the pool"""
+    keep_alive: bool = True
+    """Whether TCP keep-alive probes are enabled on idle connections"""
+
+    @staticmethod
+    def from_env() -> "ConnectionPoolConfig":
+        default = ConnectionPoolConfig()
+        return ConnectionPoolConfig(
+            pool_connections=int(os.getenv(NEPTUNE_HTTP_POOL_CONNECTIONS, str(default.pool_connections))),
+            pool_maxsize=int(os.getenv(NEPTUNE_HTTP_POOL_MAXSIZE, str(default.pool_maxsize))),
+            pool_block=_env_flag(NEPTUNE_HTTP_POOL_BLOCK, default.pool_block),
+            keep_alive=_env_flag(NEPTUNE_HTTP_KEEP_ALIVE, default.keep_alive),
+        )
+
+
+@dataclass
+class ConnectionStats:
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+
+class _StatsCounter:
+    def __init__(self):
+        self._stats = ConnectionStats()
+        self._lock = threading.Lock()
+
+    def count_request(self) -> None:
+        with self._lock:
+            self._stats.requests += 1
+
+    def count_new_connection(self) -> None:
+        with self._lock:
+            self._stats.new_connections += 1
+
+    def snapshot(self) -> ConnectionStats:
+        with self._lock:
+            return ConnectionStats(requests=self._stats.requests, new_connections=self._stats.new_connections)
+
+
+def _counting_pool_class(pool_class, counter: _StatsCounter):
+    class CountingConnectionPool(pool_class):
+        def _new_conn(self):
+            counter.count_new_connection()
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """`HTTPAdapter` with a configurable connection pool, counting how many connections were actually opened."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_pool_config"]
+
+    def __init__(self, config: ConnectionPoolConfig):
+        self._pool_config = config
+        self._counter = _StatsCounter()
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def __setstate__(self, state):
+        self._counter = _StatsCounter()
+        super().__setstate__(state)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._pool_config.keep_alive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._counter),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._counter),
+        }
+
+    def send(self, request, **kwargs):
+        self._counter.count_request()
+        return super().send(request, **kwargs)
+
+    @property
+    def pool_config(self) -> ConnectionPoolConfig:
+        return self._pool_config
+
+    @property
+    def stats(self) -> ConnectionStats:
+        return self._counter.snapshot()
+
+
+def mount_connection_pool(session: Session, config: ConnectionPoolConfig) -> PooledHTTPAdapter:
+    adapter = PooledHTTPAdapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
@@ -19,11 +19,13 @@ __all__ = [
     "create_backend_client",
     "create_leaderboard_client",
     "create_artifacts_client",
+    "get_connection_stats",
 ]
 
 import platform
 from typing import (
     Dict,
+    Optional,
     Tuple,
 )
 
@@ -32,7 +34,14 @@ from bravado.requests_client import RequestsClient
 
 from neptune.common.oauth import NeptuneAuthenticator
 from neptune.new.exceptions import NeptuneClientUpgradeRequiredError
+from neptune.new.internal.backends.api_cache import get_api_cache
 from neptune.new.internal.backends.api_model import ClientConfig
+from neptune.new.internal.backends.connection_pool import (
+    ConnectionPoolConfig,
+    ConnectionStats,
+    PooledHTTPAdapter,
+    mount_connection_pool,
+)
 from neptune.new.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
 from neptune.new.internal.backends.utils import (
     NeptuneResponseAdapter,
@@ -63,10 +72,15 @@ DEFAULT_REQUEST_KWARGS = {
 }
 
 
-def create_http_client(ssl_verify: bool, proxies: Dict[str, str]) -> RequestsClient:
+def create_http_client(
+    ssl_verify: bool, proxies: Dict[str, str], pool_config: Optional[ConnectionPoolConfig] = None
+) -> RequestsClient:
     http_client = RequestsClient(ssl_verify=ssl_verify, response_adapter_class=NeptuneResponseAdapter)
     http_client.session.verify = ssl_verify
 
+    # swagger clients and raw uploads/downloads all go through this session, so they share its connections
+    mount_connection_pool(http_client.session, pool_config or ConnectionPoolConfig.from_env())
+
     update_session_proxies(http_client.session, proxies)
 
     user_agent = "neptune-client/{lib_version} ({system}, python {python_version})".format(
@@ -79,6 +93,13 @@ def create_http_client(ssl_verify: bool, proxies: Dict[str, str]) -> RequestsCli
     return http_client
 
 
+def get_connection_stats(http_client: RequestsClient) -> Optional[ConnectionStats]:
+    adapter = http_client.session.get_adapter("https://")
+    if isinstance(adapter, PooledHTTPAdapter):
+        return adapter.stats
+    return None
+
+
 @cache
 def _get_token_client(
     credentials: Credentials,
@@ -100,9 +121,30 @@ def _get_token_client(
     )
 
 
+CLIENT_CONFIG_CACHE_KIND = "client-config"
+
+
 @cache
-@with_api_exceptions_handler
 def get_client_config(credentials: Credentials, ssl_verify: bool, proxies: Dict[str, str]) -> ClientConfig:
+    config_api_url = credentials.api_url_opt or credentials.token_origin_address
+    api_cache = get_api_cache()
+
+    if api_cache is not None:
+        cached = api_cache.get(CLIENT_CONFIG_CACHE_KIND, config_api_url)
+        if cached is not None and cached.fresh:
+            try:
+                return ClientConfig.from_dict(cached.data)
+            except (KeyError, TypeError, ValueError):
+                pass
+
+    client_config = _fetch_client_config(credentials=credentials, ssl_verify=ssl_verify, proxies=proxies)
+    if api_cache is not None:
+        api_cache.put(CLIENT_CONFIG_CACHE_KIND, config_api_url, client_config.to_dict())
+    return client_config
+
+
+@with_api_exceptions_handler
+def _fetch_client_config(credentials: Credentials, ssl_verify: bool, proxies: Dict[str, str]) -> ClientConfig:
     backend_client = _get_token_client(credentials=credentials, ssl_verify=ssl_verify, proxies=proxies)
 
     config = (
@@ -466,11 +466,18 @@ def _store_response_as_file(response: Response, destination: Optional[str] = Non
         target_file = os.path.join(destination, _get_content_disposition_filename(response))
     else:
         target_file = destination
+    # the file is written under a hidden name first, so an interrupted download doesn't leave a truncated file
+    part_file = os.path.join(os.path.dirname(target_file), "." + os.path.basename(target_file) + ".part")
     with response:
-        with open(target_file, "wb") as f:
-            for chunk in response.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
+        try:
+            with open(part_file, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if chunk:
+                        f.write(chunk)
+            os.replace(part_file, target_file)
+        finally:
+            if os.path.exists(part_file):
+                os.remove(part_file)
 
 
 def _get_content_disposition_filename(response: Response) -> str:
@@ -20,11 +20,16 @@ import logging
 import os
 import re
 import typing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import GeneratorType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -44,7 +49,11 @@ from neptune.common.exceptions import (
 )
 from neptune.common.patterns import PROJECT_QUALIFIED_NAME_PATTERN
 from neptune.management.exceptions import ObjectNotFound
-from neptune.new.envs import NEPTUNE_FETCH_TABLE_STEP_SIZE
+from neptune.new.envs import (
+    NEPTUNE_ARTIFACT_TRACKING_WORKERS,
+    NEPTUNE_FETCH_TABLE_STEP_SIZE,
+    NEPTUNE_FETCH_TABLE_WORKERS,
+)
 from neptune.new.exceptions import (
     AmbiguousProjectName,
     ArtifactNotFoundException,
@@ -86,6 +95,7 @@ from neptune.new.internal.backends.api_model import (
     StringSetAttribute,
     Workspace,
 )
+from neptune.new.internal.backends.connection_pool import ConnectionStats
 from neptune.new.internal.backends.hosted_artifact_operations import (
     track_to_existing_artifact,
     track_to_new_artifact,
@@ -96,6 +106,7 @@ from neptune.new.internal.backends.hosted_client import (
     create_backend_client,
     create_http_client_with_auth,
     create_leaderboard_client,
+    get_connection_stats,
 )
 from neptune.new.internal.backends.hosted_file_operations import (
     download_file_attribute,
@@ -105,10 +116,21 @@ from neptune.new.internal.backends.hosted_file_operations import (
     upload_file_set_attribute,
 )
 from neptune.new.internal.backends.neptune_backend import NeptuneBackend
-from neptune.new.internal.backends.nql import NQLQuery
+from neptune.new.internal.backends.nql import (
+    NQLAggregator,
+    NQLAttributeOperator,
+    NQLAttributeType,
+    NQLQuery,
+    NQLQueryAggregate,
+    NQLQueryAttribute,
+)
 from neptune.new.internal.backends.operation_api_name_visitor import OperationApiNameVisitor
 from neptune.new.internal.backends.operation_api_object_converter import OperationApiObjectConverter
 from neptune.new.internal.backends.operations_preprocessor import OperationsPreprocessor
+from neptune.new.internal.backends.upload_cache import (
+    FileFingerprint,
+    UploadCache,
+)
 from neptune.new.internal.backends.utils import (
     ExecuteOperationsBatchingManager,
     MissingApiClient,
@@ -140,11 +162,15 @@ from neptune.new.version import version as neptune_client_version
 if TYPE_CHECKING:
     from bravado.requests_client import RequestsClient
 
+    from neptune.common.backends.api_model import MultipartConfig
     from neptune.new.internal.backends.api_model import ClientConfig
 
 
 _logger = logging.getLogger(__name__)
 
+# the server does not serve entries beyond this offset of the search results
+MAX_SERVER_OFFSET = 10000
+
 
 class HostedNeptuneBackend(NeptuneBackend):
     def __init__(self, credentials: Credentials, proxies: Optional[Dict[str, str]] = None):
@@ -165,6 +191,28 @@ class HostedNeptuneBackend(NeptuneBackend):
             # create a stub
             self.artifacts_client = MissingApiClient(OptionalFeatures.ARTIFACTS)
 
+        self._upload_cache = UploadCache()
+
+    def close(self) -> None:
+        stats = self._upload_cache.stats
+        if stats.skipped_uploads:
+            _logger.info(
+                "Skipped %d uploads of unchanged files (%d bytes not transferred).",
+                stats.skipped_uploads,
+                stats.saved_bytes,
+            )
+        connection_stats = self.connection_stats
+        if connection_stats is not None:
+            _logger.debug(
+                "Sent %d requests over %d connections.",
+                connection_stats.requests,
+                connection_stats.new_connections,
+            )
+
+    @property
+    def connection_stats(self) -> Optional[ConnectionStats]:
+        return get_connection_stats(self._http_client)
+
     def verify_feature_available(self, feature_name: str):
         if not self._client_config.has_feature(feature_name):
             raise NeptuneFeatureNotAvailableException(feature_name)
@@ -477,6 +525,9 @@ class HostedNeptuneBackend(NeptuneBackend):
 
         errors.extend(artifact_operations_errors)
 
+        for op in itertools.chain(assign_artifact_operations, preprocessed_operations.other_operations):
+            self._upload_cache.invalidate(container_id, path_to_str(op.path))
+
         errors.extend(
             self._execute_operations(
                 container_id,
@@ -518,23 +569,24 @@ class HostedNeptuneBackend(NeptuneBackend):
 
         for op in upload_operations:
             if isinstance(op, UploadFile):
-                upload_errors = upload_file_attribute(
-                    swagger_client=self.leaderboard_client,
+                upload_errors = self._upload_file_attribute_if_changed(
                     container_id=container_id,
                     attribute=path_to_str(op.path),
                     source=op.file_path,
                     ext=op.ext,
+                    fingerprint=FileFingerprint.of_file(op.file_path, op.ext, persistent=not op.clean_after_upload),
                     multipart_config=multipart_config,
                 )
                 if upload_errors:
                     errors.extend(upload_errors)
             elif isinstance(op, UploadFileContent):
-                upload_errors = upload_file_attribute(
-                    swagger_client=self.leaderboard_client,
+                source = base64_decode(op.file_content)
+                upload_errors = self._upload_file_attribute_if_changed(
                     container_id=container_id,
                     attribute=path_to_str(op.path),
-                    source=base64_decode(op.file_content),
+                    source=source,
                     ext=op.ext,
+                    fingerprint=FileFingerprint.of_content(source, op.ext),
                     multipart_config=multipart_config,
                 )
                 if upload_errors:
@@ -555,6 +607,35 @@ class HostedNeptuneBackend(NeptuneBackend):
 
         return errors
 
+    def _upload_file_attribute_if_changed(
+        self,
+        container_id: str,
+        attribute: str,
+        source: Union[str, bytes],
+        ext: str,
+        fingerprint: Optional[FileFingerprint],
+        multipart_config: Optional["MultipartConfig"],
+    ) -> Optional[List[NeptuneException]]:
+        if fingerprint is not None and self._upload_cache.is_uploaded(container_id, attribute, fingerprint):
+            _logger.debug("Skipping upload of unchanged file to %s (%d bytes).", attribute, fingerprint.size)
+            return None
+
+        if fingerprint is not None:
+            # the attribute content is unknown until the upload below succeeds
+            self._upload_cache.invalidate(container_id, attribute)
+
+        upload_errors = upload_file_attribute(
+            swagger_client=self.leaderboard_client,
+            container_id=container_id,
+            attribute=attribute,
+            source=source,
+            ext=ext,
+            multipart_config=multipart_config,
+        )
+        if not upload_errors and fingerprint is not None:
+            self._upload_cache.register(container_id, attribute, fingerprint)
+        return upload_errors
+
     def _execute_upload_operations_with_400_retry(
         self,
         container_id: str,
@@ -578,40 +659,62 @@ class HostedNeptuneBackend(NeptuneBackend):
         errors = list()
         assign_operations = list()
 
-        for op in artifact_operations:
-            try:
-                artifact_hash = self.get_artifact_attribute(container_id, container_type, op.path).hash
-            except FetchAttributeNotFoundException:
-                artifact_hash = None
-
-            try:
-                if artifact_hash is None:
-                    assign_operation = track_to_new_artifact(
-                        swagger_client=self.artifacts_client,
-                        project_id=op.project_id,
-                        path=op.path,
-                        parent_identifier=container_id,
-                        entries=op.entries,
-                        default_request_params=DEFAULT_REQUEST_KWARGS,
-                    )
-                else:
-                    assign_operation = track_to_existing_artifact(
-                        swagger_client=self.artifacts_client,
-                        project_id=op.project_id,
-                        path=op.path,
-                        artifact_hash=artifact_hash,
-                        parent_identifier=container_id,
-                        entries=op.entries,
-                        default_request_params=DEFAULT_REQUEST_KWARGS,
-                    )
+        if not artifact_operations:
+            return errors, assign_operations
+
+        artifact_hashes = self._get_artifact_hashes(container_id, container_type)
+
+        def track_files(op: TrackFilesToArtifact) -> Optional[Operation]:
+            artifact_hash = artifact_hashes.get(path_to_str(op.path))
+            if artifact_hash is None:
+                return track_to_new_artifact(
+                    swagger_client=self.artifacts_client,
+                    project_id=op.project_id,
+                    path=op.path,
+                    parent_identifier=container_id,
+                    entries=op.entries,
+                    default_request_params=DEFAULT_REQUEST_KWARGS,
+                )
+            else:
+                return track_to_existing_artifact(
+                    swagger_client=self.artifacts_client,
+                    project_id=op.project_id,
+                    path=op.path,
+                    artifact_hash=artifact_hash,
+                    parent_identifier=container_id,
+                    entries=op.entries,
+                    default_request_params=DEFAULT_REQUEST_KWARGS,
+                )
 
-                if assign_operation:
-                    assign_operations.append(assign_operation)
-            except NeptuneException as error:
-                errors.append(error)
+        max_workers = min(len(artifact_operations), int(os.getenv(NEPTUNE_ARTIFACT_TRACKING_WORKERS, "8")))
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            # artifacts under different paths are independent, results are still collected in operations order
+            futures = [executor.submit(track_files, op) for op in artifact_operations]
+            for future in futures:
+                try:
+                    assign_operation = future.result()
+                    if assign_operation:
+                        assign_operations.append(assign_operation)
+                except NeptuneException as error:
+                    errors.append(error)
 
         return errors, assign_operations
 
+    def _get_artifact_hashes(self, container_id: str, container_type: ContainerType) -> Dict[str, str]:
+        params = {
+            "experimentId": container_id,
+            **DEFAULT_REQUEST_KWARGS,
+        }
+        try:
+            result = self.leaderboard_client.api.getExperimentAttributes(**params).response().result
+            return {
+                attr.name: attr.artifactProperties.hash
+                for attr in result.attributes
+                if attr.type == AttributeType.ARTIFACT.value
+            }
+        except HTTPNotFound as e:
+            raise ContainerUUIDNotFound(container_id, container_type) from e
+
     @with_api_exceptions_handler
     def _execute_operations(
         self,
@@ -993,38 +1096,84 @@ class HostedNeptuneBackend(NeptuneBackend):
         except HTTPNotFound:
             raise FetchAttributeNotFoundException(path_to_str(path))
 
-    @with_api_exceptions_handler
     def search_leaderboard_entries(
         self,
         project_id: UniqueId,
         types: Optional[Iterable[ContainerType]] = None,
         query: Optional[NQLQuery] = None,
         columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> List[LeaderboardEntry]:
-        if query:
-            query_params = {"query": {"query": str(query)}}
-        else:
-            query_params = {}
+        pages = self.iter_leaderboard_entries(
+            project_id=project_id,
+            types=types,
+            query=query,
+            columns=columns,
+            progress_callback=progress_callback,
+        )
+        return [entry for page in pages for entry in page]
+
+    def iter_leaderboard_entries(
+        self,
+        project_id: UniqueId,
+        types: Optional[Iterable[ContainerType]] = None,
+        query: Optional[NQLQuery] = None,
+        columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Iterator[List[LeaderboardEntry]]:
         if columns:
-            attributes_filter = {"attributeFilters": [{"path": column} for column in columns]}
+            # `sys/id` is the pagination key
+            attributes_filter = {
+                "attributeFilters": [{"path": column} for column in dict.fromkeys(["sys/id", *columns])]
+            }
         else:
             attributes_filter = {}
 
-        def get_portion(limit, offset):
-            return (
-                self.leaderboard_client.api.searchLeaderboardEntries(
-                    projectIdentifier=project_id,
-                    type=list(map(lambda container_type: container_type.to_api(), types)),
-                    params={
-                        **query_params,
-                        **attributes_filter,
-                        "pagination": {"limit": limit, "offset": offset},
-                    },
-                    **DEFAULT_REQUEST_KWARGS,
+        # tables of more than `MAX_SERVER_OFFSET` entries are paginated on `sys/id`
+        sort_by_key = {
+            "sorting": {
+                "dir": "ascending",
+                "aggregationMode": "none",
+                "sortBy": {"name": "sys/id", "type": "string"},
+            }
+        }
+
+        @with_api_exceptions_handler
+        def get_portion(
+            limit: int, offset: int, search_after: Optional[str], by_key: bool
+        ) -> Tuple[list, Optional[int]]:
+            portion_query = query
+            if search_after is not None:
+                after_query = NQLQueryAttribute(
+                    name="sys/id",
+                    type=NQLAttributeType.STRING,
+                    operator=NQLAttributeOperator.GREATER_THAN,
+                    value=search_after,
                 )
-                .response()
-                .result.entries
-            )
+                portion_query = (
+                    NQLQueryAggregate(items=[query, after_query], aggregator=NQLAggregator.AND)
+                    if query and str(query)
+                    else after_query
+                )
+            try:
+                result = (
+                    self.leaderboard_client.api.searchLeaderboardEntries(
+                        projectIdentifier=project_id,
+                        type=list(map(lambda container_type: container_type.to_api(), types)),
+                        params={
+                            **({"query": {"query": str(portion_query)}} if portion_query else {}),
+                            **attributes_filter,
+                            **(sort_by_key if by_key else {}),
+                            "pagination": {"limit": limit, "offset": offset},
+                        },
+                        **DEFAULT_REQUEST_KWARGS,
+                    )
+                    .response()
+                    .result
+                )
+            except HTTPNotFound:
+                raise ProjectNotFound(project_id)
+            return [to_leaderboard_entry(entry) for entry in result.entries], getattr(result, "matchingItemCount", None)
 
         def to_leaderboard_entry(entry) -> LeaderboardEntry:
             supported_attribute_types = {item.value for item in AttributeType}
@@ -1035,11 +1184,21 @@ class HostedNeptuneBackend(NeptuneBackend):
                     attributes.append(AttributeWithProperties(attr.name, AttributeType(attr.type), properties))
             return LeaderboardEntry(entry.experimentId, attributes)
 
-        try:
-            step_size = int(os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE, "100"))
-            return [to_leaderboard_entry(e) for e in self._get_all_items(get_portion, step=step_size)]
-        except HTTPNotFound:
-            raise ProjectNotFound(project_id)
+        def get_sys_id(entry: LeaderboardEntry) -> Optional[str]:
+            for attr in entry.attributes:
+                if attr.path == "sys/id":
+                    return attr.properties.value
+            return None
+
+        step_size = int(os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE, "100"))
+        max_workers = int(os.getenv(NEPTUNE_FETCH_TABLE_WORKERS, "2"))
+        return self._iter_all_items(
+            get_portion,
+            step=step_size,
+            get_key=get_sys_id,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
 
     def get_run_url(self, run_id: str, workspace: str, project_name: str, sys_id: str) -> str:
         base_url = self.get_display_address()
@@ -1065,11 +1224,116 @@ class HostedNeptuneBackend(NeptuneBackend):
         return f"{base_url}/{workspace}/{project_name}/m/{model_id}/v/{sys_id}"
 
     @staticmethod
-    def _get_all_items(get_portion, step):
-        max_server_offset = 10000
-        items = []
-        previous_items = None
-        while (previous_items is None or len(previous_items) >= step) and len(items) < max_server_offset:
-            previous_items = get_portion(limit=step, offset=len(items))
-            items += previous_items
-        return items
+    def _get_all_items(
+        get_portion: Callable[[int, int, Optional[str], bool], Tuple[list, Optional[int]]],
+        step: int,
+        get_key: Callable[[Any], Optional[str]],
+        max_workers: int = 1,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> list:
+        portions = HostedNeptuneBackend._iter_all_items(get_portion, step, get_key, max_workers, progress_callback)
+        return [item for portion in portions for item in portion]
+
+    @staticmethod
+    def _iter_all_items(
+        get_portion: Callable[[int, int, Optional[str], bool], Tuple[list, Optional[int]]],
+        step: int,
+        get_key: Callable[[Any], Optional[str]],
+        max_workers: int = 1,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Iterator[list]:
+        """Yields portions of all the items matching a query, in order.
+
+        `get_portion(limit, offset, search_after, by_key)` returns items in the server's default order, or sorted
+        by a unique key and following `search_after` if `by_key` is set, and the number of matching items.
+        The server serves items up to an offset of `MAX_SERVER_OFFSET`, so its default order is kept only when
+        all the items fit in this window. Otherwise, the items are sorted by the key and fetched in windows:
+        each window is fetched with offsets relative to the key of the last item of the previous window.
+        Once the number of matching items is known, up to `max_workers` pages following the consumed one are
+        fetched concurrently, so that a consumer that stops early doesn't wait for a whole window to be fetched.
+        """
+        window_offsets = range(0, MAX_SERVER_OFFSET, step)
+        window_size = len(window_offsets) * step
+        fetched_count = 0
+        search_after = None
+
+        first_portion, total_count = get_portion(step, 0, None, False)
+        matching_count = total_count
+        if total_count is not None:
+            by_key = total_count > window_size
+        else:
+            by_key = len(first_portion) >= step
+        if by_key:
+            first_portion, matching_count = get_portion(step, 0, None, True)
+
+        executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+        portions = iter(())
+        try:
+            while True:
+                if matching_count is not None:
+                    offsets = [offset for offset in window_offsets[1:] if offset < matching_count]
+                    portions = HostedNeptuneBackend._get_portions_concurrently(
+                        executor,
+                        lambda offset, after=search_after: get_portion(step, offset, after, by_key)[0],
+                        offsets,
+                        prefetch=max(max_workers, 1),
+                    )
+                elif len(first_portion) >= step:
+                    portions = HostedNeptuneBackend._get_portions_sequentially(
+                        get_portion, step, window_offsets[1:], search_after
+                    )
+                else:
+                    portions = iter(())
+
+                window_count = 0
+                last_item = None
+                for portion in itertools.chain([first_portion], portions):
+                    fetched_count += len(portion)
+                    window_count += len(portion)
+                    if progress_callback:
+                        progress_callback(fetched_count, total_count)
+                    if portion:
+                        last_item = portion[-1]
+                        yield portion
+
+                if (
+                    not by_key
+                    or window_count < window_size
+                    or (matching_count is not None and matching_count <= window_count)
+                ):
+                    return
+                search_after = get_key(last_item)
+                if search_after is None:
+                    _logger.warning("Only the first %d entries are fetched", fetched_count)
+                    return
+                first_portion, matching_count = get_portion(step, 0, search_after, True)
+        finally:
+            # runs once all the items are consumed, or the consumer drops the iterator
+            if isinstance(portions, GeneratorType):
+                portions.close()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _get_portions_concurrently(
+        executor: ThreadPoolExecutor, fetch: Callable[[int], list], offsets: Iterable[int], prefetch: int
+    ) -> Iterator[list]:
+        """Yields portions at `offsets` in order, while the following `prefetch` ones are being fetched"""
+        offsets = iter(offsets)
+        pending = deque(executor.submit(fetch, offset) for offset in itertools.islice(offsets, prefetch))
+        try:
+            while pending:
+                portion = pending.popleft().result()
+                pending.extend(executor.submit(fetch, offset) for offset in itertools.islice(offsets, 1))
+                yield portion
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _get_portions_sequentially(get_portion, step: int, offsets: Iterable[int], search_after: Optional[str]):
+        # only used in the key order, as any order is consistent within a window that holds all the items
+        for offset in offsets:
+            portion, _ = get_portion(step, offset, search_after, True)
+            yield portion
+            if len(portion) < step:
+                return
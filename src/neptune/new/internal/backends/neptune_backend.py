@@ -18,7 +18,9 @@ __all__ = ["NeptuneBackend"]
 import abc
 from typing import (
     Any,
+    Callable,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -301,5 +303,25 @@ class NeptuneBackend:
         types: Optional[Iterable[ContainerType]] = None,
         query: Optional[NQLQuery] = None,
         columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> List[LeaderboardEntry]:
         pass
+
+    def iter_leaderboard_entries(
+        self,
+        project_id: UniqueId,
+        types: Optional[Iterable[ContainerType]] = None,
+        query: Optional[NQLQuery] = None,
+        columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Iterator[List[LeaderboardEntry]]:
+        """Yields pages of the entries matching the query as they are fetched"""
+        entries = self.search_leaderboard_entries(
+            project_id=project_id,
+            types=types,
+            query=query,
+            columns=columns,
+            progress_callback=progress_callback,
+        )
+        if entries:
+            yield entries
@@ -22,6 +22,7 @@ from datetime import datetime
 from shutil import copyfile
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -97,6 +98,7 @@ from neptune.new.internal.operation import (
     DeleteFiles,
     LogFloats,
     LogImages,
+    LogMultipleFloats,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -285,10 +287,11 @@ class NeptuneBackendMock(NeptuneBackend):
     ) -> Tuple[int, List[NeptuneException]]:
         result = []
         for op in operations:
-            try:
-                self._execute_operation(container_id, container_type, op)
-            except NeptuneException as e:
-                result.append(e)
+            for executed_op in op.split() if isinstance(op, LogMultipleFloats) else [op]:
+                try:
+                    self._execute_operation(container_id, container_type, executed_op)
+                except NeptuneException as e:
+                    result.append(e)
         return len(operations), result
 
     def _execute_operation(self, container_id: UniqueId, container_type: ContainerType, op: Operation) -> None:
@@ -330,7 +333,13 @@ class NeptuneBackendMock(NeptuneBackend):
     ):
         run = self._get_container(container_id, container_type)
         value: File = run.get(path)
-        target_path = os.path.abspath(destination or (path[-1] + ("." + value.extension if value.extension else "")))
+        file_name = path[-1] + ("." + value.extension if value.extension else "")
+        if destination is None:
+            target_path = os.path.abspath(file_name)
+        elif os.path.isdir(destination):
+            target_path = os.path.abspath(os.path.join(destination, file_name))
+        else:
+            target_path = os.path.abspath(destination)
         if value.file_type is FileType.IN_MEMORY:
             with open(target_path, "wb") as target_file:
                 target_file.write(value.content)
@@ -449,7 +458,10 @@ class NeptuneBackendMock(NeptuneBackend):
         val = self._get_attribute(container_id, container_type, path, StringSeries)
         return StringSeriesValues(
             len(val.values),
-            [StringPointValue(timestampMillis=42342, step=idx, value=v) for idx, v in enumerate(val.values)],
+            [
+                StringPointValue(timestampMillis=42342, step=idx, value=v)
+                for idx, v in enumerate(val.values[offset : offset + limit], start=offset)
+            ],
         )
 
     def get_float_series_values(
@@ -463,7 +475,10 @@ class NeptuneBackendMock(NeptuneBackend):
         val = self._get_attribute(container_id, container_type, path, FloatSeries)
         return FloatSeriesValues(
             len(val.values),
-            [FloatPointValue(timestampMillis=42342, step=idx, value=v) for idx, v in enumerate(val.values)],
+            [
+                FloatPointValue(timestampMillis=42342, step=idx, value=v)
+                for idx, v in enumerate(val.values[offset : offset + limit], start=offset)
+            ],
         )
 
     def get_image_series_values(
@@ -539,6 +554,7 @@ class NeptuneBackendMock(NeptuneBackend):
         types: Optional[Iterable[ContainerType]] = None,
         query: Optional[NQLQuery] = None,
         columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> List[LeaderboardEntry]:
         """Non relevant for mock"""
 
@@ -676,7 +692,7 @@ class NeptuneBackendMock(NeptuneBackend):
             return StringSeries(self._current_value.values + raw_values)
 
         def visit_log_images(self, op: LogImages) -> Optional[Value]:
-            raw_values = [File.from_content(base64_decode(x.value.data)) for x in op.values]
+            raw_values = [File.from_content(base64_decode(x.value.get_data())) for x in op.values]
             if self._current_value is None:
                 return FileSeries(raw_values)
             if not isinstance(self._current_value, FileSeries):
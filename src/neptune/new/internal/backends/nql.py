@@ -20,10 +20,16 @@ __all__ = [
     "NQLAttributeOperator",
     "NQLAttributeType",
     "NQLQueryAttribute",
+    "build_filter_queries",
+    "build_filter_query",
 ]
 
 import typing
 from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timezone,
+)
 from enum import Enum
 from typing import Iterable
 
@@ -56,7 +62,13 @@ class NQLQueryAggregate(NQLQuery):
 
 class NQLAttributeOperator(str, Enum):
     EQUALS = "="
+    NOT_EQUALS = "!="
     CONTAINS = "CONTAINS"
+    GREATER_THAN = ">"
+    GREATER_THAN_OR_EQUAL = ">="
+    LESS_THAN = "<"
+    LESS_THAN_OR_EQUAL = "<="
+    EXISTS = "EXISTS"
 
 
 class NQLAttributeType(str, Enum):
@@ -64,6 +76,9 @@ class NQLAttributeType(str, Enum):
     STRING_SET = "stringSet"
     EXPERIMENT_STATE = "experimentState"
     BOOLEAN = "bool"
+    DATETIME = "datetime"
+    INTEGER = "integer"
+    FLOAT = "float"
 
 
 @dataclass
@@ -71,12 +86,116 @@ class NQLQueryAttribute(NQLQuery):
     name: str
     type: NQLAttributeType
     operator: NQLAttributeOperator
-    value: typing.Union[str, bool]
+    value: typing.Union[str, bool, int, float, datetime, None] = None
 
     def __str__(self) -> str:
+        if self.operator == NQLAttributeOperator.EXISTS:
+            return f"(`{self.name}`:{self.type.value} {self.operator.value})"
+
         if isinstance(self.value, bool):
             value = str(self.value).lower()
+        elif isinstance(self.value, (int, float)):
+            value = repr(self.value)
+        elif isinstance(self.value, datetime):
+            value = f'"{_format_datetime(self.value)}"'
         else:
-            value = f'"{self.value}"'
+            value = f'"{_escape_string(self.value)}"'
 
         return f"(`{self.name}`:{self.type.value} {self.operator.value} {value})"
+
+
+def _escape_string(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _format_datetime(value: datetime) -> str:
+    # naive datetimes are in local time, as everywhere in Python
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+_FILTER_OPERATORS = {
+    "=": NQLAttributeOperator.EQUALS,
+    "==": NQLAttributeOperator.EQUALS,
+    "!=": NQLAttributeOperator.NOT_EQUALS,
+    ">": NQLAttributeOperator.GREATER_THAN,
+    ">=": NQLAttributeOperator.GREATER_THAN_OR_EQUAL,
+    "<": NQLAttributeOperator.LESS_THAN,
+    "<=": NQLAttributeOperator.LESS_THAN_OR_EQUAL,
+}
+
+FILTER_OPERATORS = (*_FILTER_OPERATORS, "between", "exists")
+
+
+def _infer_attribute_type(value: typing.Any) -> NQLAttributeType:
+    if isinstance(value, bool):
+        return NQLAttributeType.BOOLEAN
+    if isinstance(value, (int, float)):
+        # numbers are logged as floats in the vast majority of cases, integers must be requested explicitly
+        return NQLAttributeType.FLOAT
+    if isinstance(value, datetime):
+        return NQLAttributeType.DATETIME
+    if isinstance(value, str):
+        return NQLAttributeType.STRING
+    raise TypeError(f"Cannot filter by a value of type {type(value).__name__}")
+
+
+def _get_attribute_type(attribute_type: str) -> NQLAttributeType:
+    try:
+        return NQLAttributeType(attribute_type)
+    except ValueError:
+        raise ValueError(
+            f"Unknown attribute type {attribute_type}, expected one of: "
+            f"{', '.join(item.value for item in NQLAttributeType)}"
+        ) from None
+
+
+def build_filter_query(
+    path: str, operator: str, value: typing.Any = None, attribute_type: typing.Optional[str] = None
+) -> NQLQuery:
+    """Builds a query matching entries whose attribute at `path` satisfies `operator`.
+
+    Comparison operators ("=", "!=", ">", ">=", "<", "<=") compare with `value`. The attribute type is named by
+    `attribute_type`, e.g. "integer", or inferred from the Python type of `value`: bool, float (for int and float),
+    datetime or str. Naive datetimes are interpreted as local time. "between" matches values in the inclusive range
+    given as a `(lower, upper)` pair, where either bound may be `None`. "exists" matches entries having the attribute
+    of the type named by `value`, e.g. "float".
+    """
+    if operator in _FILTER_OPERATORS:
+        attribute_type = _get_attribute_type(attribute_type) if attribute_type else _infer_attribute_type(value)
+        if attribute_type == NQLAttributeType.FLOAT and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        return NQLQueryAttribute(
+            name=path,
+            type=attribute_type,
+            operator=_FILTER_OPERATORS[operator],
+            value=value,
+        )
+    if operator == "between":
+        if not isinstance(value, (tuple, list)) or len(value) != 2 or all(bound is None for bound in value):
+            raise ValueError(f"Range of {path} must be a (lower, upper) pair with at least one bound")
+        lower, upper = value
+        items = []
+        if lower is not None:
+            items.append(build_filter_query(path, ">=", lower, attribute_type))
+        if upper is not None:
+            items.append(build_filter_query(path, "<=", upper, attribute_type))
+        return items[0] if len(items) == 1 else NQLQueryAggregate(items=items, aggregator=NQLAggregator.AND)
+    if operator == "exists":
+        return NQLQueryAttribute(name=path, type=_get_attribute_type(value), operator=NQLAttributeOperator.EXISTS)
+    raise ValueError(f"Unknown filter operator {operator}, expected one of {FILTER_OPERATORS}")
+
+
+def build_filter_queries(filters: typing.Iterable[typing.Tuple[typing.Any, ...]]) -> typing.List[NQLQuery]:
+    """Builds queries of `(path, operator, value)` or `(path, operator, value, type)` filters,
+    see `build_filter_query`"""
+    queries = []
+    for item in filters:
+        if isinstance(item, NQLQuery):
+            queries.append(item)
+        elif isinstance(item, (tuple, list)) and len(item) in (3, 4):
+            queries.append(build_filter_query(*item))
+        else:
+            raise ValueError(
+                f"Filters must be (path, operator, value) or (path, operator, value, type) tuples, got {item!r}"
+            )
+    return queries
@@ -109,7 +109,7 @@ class OperationApiObjectConverter(OperationVisitor[dict]):
             "entries": [
                 {
                     "value": {
-                        "data": value.value.data,
+                        "data": value.value.get_data(),
                         "name": value.value.name,
                         "description": value.value.description,
                     },
@@ -44,6 +44,7 @@ from neptune.new.internal.operation import (
     DeleteFiles,
     LogFloats,
     LogImages,
+    LogMultipleFloats,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -84,11 +85,14 @@ class OperationsPreprocessor:
             except RequiresPreviousCompleted:
                 return
 
-    def _process_op(self, op: Operation) -> "_OperationsAccumulator":
+    def _process_op(self, op: Operation) -> None:
+        if isinstance(op, LogMultipleFloats):
+            for log_op in op.split():
+                self._process_op(log_op)
+            return
         path_str = path_to_str(op.path)
         target_acc = self._accumulators.setdefault(path_str, _OperationsAccumulator(op.path))
         target_acc.visit(op)
-        return target_acc
 
     @staticmethod
     def is_file_op(op: Operation):
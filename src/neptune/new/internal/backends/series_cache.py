@@ -0,0 +1,258 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "SeriesCache",
+    "get_series_cache",
+]
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy
+
+from neptune.new.envs import (
+    NEPTUNE_SERIES_CACHE,
+    NEPTUNE_SERIES_CACHE_DIR,
+    NEPTUNE_SERIES_CACHE_MAX_MB,
+)
+from neptune.new.internal.utils.logger import logger
+
+Columns = Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+"""steps, values, timestamps in milliseconds"""
+
+DEFAULT_SERIES_CACHE_MAX_MB = 512
+
+_META_FILE = "meta.json"
+_STEPS_FILE = "steps.bin"
+_TIMESTAMPS_FILE = "timestamps.bin"
+_VALUES_FILE = "values.bin"
+_STRING_VALUES_FILE = "values.jsonl"
+_LOCK_SUFFIX = ".lock"
+# locks of processes that died while writing an entry are broken after this time
+_STALE_LOCK_SECONDS = 60
+
+
+class SeriesCache:
+    """On-disk cache of the values of float and string series fetched from Neptune servers.
+
+    Entries are keyed by the container id and the path of the series. The columns of an entry are kept
+    in files which only grow, so that the values fetched later are appended instead of rewriting the entry;
+    the number of cached values and the sizes of the files are recorded in a metadata file, which is replaced
+    atomically after the columns are written. Least recently used entries are removed once the cache
+    takes more than `max_bytes`.
+
+    The cache directory may be shared by many processes, so entries are changed only under a lock file
+    created next to them; an entry locked by another process is neither written nor removed.
+    """
+
+    def __init__(self, dir_path: Path, max_bytes: int):
+        self._dir_path = Path(dir_path)
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+
+    @property
+    def dir_path(self) -> Path:
+        return self._dir_path
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get(self, container_id: str, path: List[str], dtype) -> Optional[Columns]:
+        entry_path = self._entry_path(container_id, path)
+        with self._lock:
+            meta = self._read_meta(entry_path)
+            if meta is None:
+                return None
+            try:
+                count = meta["count"]
+                columns = (
+                    numpy.fromfile(entry_path / _STEPS_FILE, dtype=numpy.float64, count=count),
+                    self._read_values(entry_path, dtype, count),
+                    numpy.fromfile(entry_path / _TIMESTAMPS_FILE, dtype=numpy.int64, count=count),
+                )
+                if any(len(column) != count for column in columns):
+                    raise ValueError("Truncated series cache entry")
+                # the modification time of the metadata file is the time of the last use
+                os.utime(entry_path / _META_FILE)
+                return columns
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.debug("Ignoring unreadable series cache entry for %s", "/".join(path))
+                with self._entry_lock(entry_path) as locked:
+                    if locked:
+                        self._remove_entry(entry_path)
+                return None
+
+    def append(self, container_id: str, path: List[str], columns: Columns, cached_count: int = 0) -> None:
+        """Appends `columns` to the entry holding `cached_count` values, or creates it if `cached_count` is 0"""
+        entry_path = self._entry_path(container_id, path)
+        with self._lock, self._entry_lock(entry_path) as locked:
+            if not locked:
+                return
+            try:
+                if cached_count == 0:
+                    self._remove_entry(entry_path)
+                    os.makedirs(entry_path)
+                    meta = {"path": "/".join(path), "count": 0, "sizes": {}}
+                else:
+                    meta = self._read_meta(entry_path)
+                    if meta is None or meta["count"] != cached_count:
+                        return
+
+                steps, values, timestamps = columns
+                sizes = meta["sizes"]
+                self._append_to_file(entry_path / _STEPS_FILE, sizes, steps.astype(numpy.float64).tobytes())
+                self._append_to_file(entry_path / _TIMESTAMPS_FILE, sizes, timestamps.astype(numpy.int64).tobytes())
+                if values.dtype == object:
+                    data = "".join(json.dumps(value) + "\n" for value in values).encode("utf-8")
+                    self._append_to_file(entry_path / _STRING_VALUES_FILE, sizes, data)
+                else:
+                    self._append_to_file(entry_path / _VALUES_FILE, sizes, values.astype(numpy.float64).tobytes())
+                meta["count"] = cached_count + len(steps)
+                self._write_meta(entry_path, meta)
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.debug("Cannot store series cache entry for %s", "/".join(path))
+                self._remove_entry(entry_path)
+                return
+        with self._lock:
+            self._evict()
+
+    def invalidate(self, container_id: str, path: List[str]) -> None:
+        entry_path = self._entry_path(container_id, path)
+        with self._lock, self._entry_lock(entry_path) as locked:
+            if locked:
+                self._remove_entry(entry_path)
+
+    @staticmethod
+    @contextmanager
+    def _entry_lock(entry_path: Path) -> Iterator[bool]:
+        """Takes the lock of an entry without waiting for other processes, yields whether it was taken"""
+        lock_path = entry_path.with_name(entry_path.name + _LOCK_SUFFIX)
+        try:
+            if time.time() - lock_path.stat().st_mtime > _STALE_LOCK_SECONDS:
+                os.remove(lock_path)
+        except OSError:
+            pass
+        try:
+            os.makedirs(entry_path.parent, exist_ok=True)
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except OSError:
+            # locked by another process
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+    def _entry_path(self, container_id: str, path: List[str]) -> Path:
+        key = hashlib.sha1(f"{container_id}/{'/'.join(path)}".encode("utf-8")).hexdigest()
+        return self._dir_path / key
+
+    @staticmethod
+    def _read_meta(entry_path: Path) -> Optional[dict]:
+        try:
+            with open(entry_path / _META_FILE, "r") as meta_file:
+                return json.load(meta_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry_path: Path, meta: dict) -> None:
+        tmp_path = entry_path / f".tmp-{uuid.uuid4().hex}"
+        with open(tmp_path, "w") as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(tmp_path, entry_path / _META_FILE)
+
+    @staticmethod
+    def _append_to_file(file_path: Path, sizes: dict, data: bytes) -> None:
+        # whatever was written after the last metadata update, e.g. by an interrupted append, is dropped
+        size = sizes.get(file_path.name, 0)
+        with open(file_path, "ab") as column_file:
+            column_file.truncate(size)
+            column_file.write(data)
+        sizes[file_path.name] = size + len(data)
+
+    @staticmethod
+    def _read_values(entry_path: Path, dtype, count: int) -> numpy.ndarray:
+        if dtype != object:
+            return numpy.fromfile(entry_path / _VALUES_FILE, dtype=numpy.float64, count=count)
+        values = numpy.empty(count, dtype=object)
+        with open(entry_path / _STRING_VALUES_FILE, "r", encoding="utf-8") as values_file:
+            for index, line in zip(range(count), values_file):
+                values[index] = json.loads(line)
+        return values
+
+    def _evict(self) -> None:
+        entries = []
+        for entry_path in self._dir_path.iterdir():
+            if entry_path.name.endswith(_LOCK_SUFFIX):
+                continue
+            meta = self._read_meta(entry_path)
+            if meta is None:
+                continue
+            try:
+                last_used = (entry_path / _META_FILE).stat().st_mtime
+            except OSError:
+                continue
+            entries.append((last_used, sum(meta.get("sizes", {}).values()), entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_bytes:
+                break
+            with self._entry_lock(entry_path) as locked:
+                if not locked:
+                    continue
+                self._remove_entry(entry_path)
+            total_size -= size
+
+    @staticmethod
+    def _remove_entry(entry_path: Path) -> None:
+        shutil.rmtree(entry_path, ignore_errors=True)
+
+
+_series_cache: Optional[SeriesCache] = None
+
+
+def get_series_cache() -> Optional[SeriesCache]:
+    """Returns the series cache if it's enabled with the `NEPTUNE_SERIES_CACHE` environment variable"""
+    global _series_cache
+    if os.getenv(NEPTUNE_SERIES_CACHE, "False").strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    dir_path = Path(os.getenv(NEPTUNE_SERIES_CACHE_DIR) or Path.home() / ".neptune" / "series-cache")
+    max_bytes = int(float(os.getenv(NEPTUNE_SERIES_CACHE_MAX_MB, str(DEFAULT_SERIES_CACHE_MAX_MB))) * 1024 * 1024)
+    if _series_cache is None or _series_cache.dir_path != dir_path or _series_cache.max_bytes != max_bytes:
+        _series_cache = SeriesCache(dir_path=dir_path, max_bytes=max_bytes)
+    return _series_cache
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["FileFingerprint", "UploadCache", "UploadStats"]
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from neptune.new.internal.artifacts.file_hasher import FileHasher
+from neptune.new.internal.artifacts.utils import sha1
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    file_hash: str
+    size: int
+    ext: str
+
+    @staticmethod
+    def of_file(file_path: str, ext: str, persistent: bool = True) -> Optional["FileFingerprint"]:
+        """Fingerprint of a file on disk.
+
+        Hashes of `persistent` files are cached by modification date in `LocalFileHashStorage`, so unchanged
+        files are not re-read. Temporary files, which are never uploaded twice, are hashed directly.
+        """
+        if not os.path.isfile(file_path):
+            return None
+        file_hash = FileHasher.get_local_file_hash(file_path) if persistent else sha1(file_path)
+        return FileFingerprint(file_hash=file_hash, size=os.path.getsize(file_path), ext=ext)
+
+    @staticmethod
+    def of_content(content: bytes, ext: str) -> "FileFingerprint":
+        return FileFingerprint(file_hash=hashlib.sha1(content).hexdigest(), size=len(content), ext=ext)
+
+
+@dataclass
+class UploadStats:
+    skipped_uploads: int = 0
+    saved_bytes: int = 0
+
+
+class UploadCache:
+    """Remembers files successfully uploaded to file attributes of each container during this process,
+    so uploading identical content to the same attribute again can be skipped."""
+
+    def __init__(self):
+        self._uploaded: Dict[Tuple[str, str], FileFingerprint] = dict()
+        self._stats = UploadStats()
+        self._lock = threading.Lock()
+
+    def is_uploaded(self, container_id: str, attribute: str, fingerprint: FileFingerprint) -> bool:
+        with self._lock:
+            if self._uploaded.get((container_id, attribute)) != fingerprint:
+                return False
+            self._stats.skipped_uploads += 1
+            self._stats.saved_bytes += fingerprint.size
+            return True
+
+    def register(self, container_id: str, attribute: str, fingerprint: FileFingerprint) -> None:
+        with self._lock:
+            self._uploaded[(container_id, attribute)] = fingerprint
+
+    def invalidate(self, container_id: str, path: str) -> None:
+        """Forgets uploads to attribute `path` and, as it may be a namespace, to everything below it"""
+        prefix = path + "/"
+        with self._lock:
+            for key in list(self._uploaded):
+                cached_container_id, attribute = key
+                if cached_container_id == container_id and (attribute == path or attribute.startswith(prefix)):
+                    del self._uploaded[key]
+
+    @property
+    def stats(self) -> UploadStats:
+        with self._lock:
+            return UploadStats(skipped_uploads=self._stats.skipped_uploads, saved_bytes=self._stats.saved_bytes)
@@ -29,11 +29,13 @@ __all__ = [
     "ExecuteOperationsBatchingManager",
 ]
 
+import copy
 import dataclasses
 import itertools
 import logging
 import os
 import socket
+import threading
 import time
 from functools import (
     lru_cache,
@@ -72,8 +74,12 @@ from bravado.exception import (
     HTTPUnauthorized,
 )
 from bravado.http_client import HttpClient
-from bravado.requests_client import RequestsResponseAdapter
+from bravado.requests_client import (
+    RequestsClient,
+    RequestsResponseAdapter,
+)
 from bravado_core.formatter import SwaggerFormat
+from bravado_core.spec import Spec
 from packaging.version import Version
 from requests import (
     Response,
@@ -90,6 +96,7 @@ from neptune.new.exceptions import (
     CannotResolveHostname,
     ClientHttpError,
     Forbidden,
+    InternalServerError,
     MetadataInconsistency,
     NeptuneClientUpgradeRequiredError,
     NeptuneConnectionLostException,
@@ -97,6 +104,11 @@ from neptune.new.exceptions import (
     NeptuneSSLVerificationError,
     Unauthorized,
 )
+from neptune.new.internal.backends.api_cache import (
+    ApiCache,
+    ApiCacheEntry,
+    get_api_cache,
+)
 from neptune.new.internal.backends.api_model import ClientConfig
 from neptune.new.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
 from neptune.new.internal.operation import (
@@ -113,6 +125,14 @@ if TYPE_CHECKING:
 
 MAX_RETRY_TIME = 30
 retries_timeout = int(os.getenv(NEPTUNE_RETRIES_TIMEOUT_ENV, "60"))
+RETRIED_STATUS_CODES = (
+    HTTPRequestTimeout.status_code,
+    HTTPBadGateway.status_code,
+    HTTPServiceUnavailable.status_code,
+    HTTPGatewayTimeout.status_code,
+    HTTPTooManyRequests.status_code,
+    HTTPInternalServerError.status_code,
+)
 
 
 def with_api_exceptions_handler(func):
@@ -157,14 +177,7 @@ def with_api_exceptions_handler(func):
                 if e.response is None:
                     raise
                 status_code = e.response.status_code
-                if status_code in (
-                    HTTPRequestTimeout.status_code,
-                    HTTPBadGateway.status_code,
-                    HTTPServiceUnavailable.status_code,
-                    HTTPGatewayTimeout.status_code,
-                    HTTPTooManyRequests.status_code,
-                    HTTPInternalServerError.status_code,
-                ):
+                if status_code in RETRIED_STATUS_CODES:
                     time.sleep(min(2 ** min(10, retry), MAX_RETRY_TIME))
                     last_exception = e
                     continue
@@ -199,20 +212,99 @@ uuid_format = SwaggerFormat(
 )
 
 
+SWAGGER_SPEC_CACHE_KIND = "swagger"
+
+# built specs are reused by all swagger clients created in this process, regardless of the http client they use
+_swagger_specs: Dict[str, Spec] = dict()
+_swagger_specs_lock = threading.Lock()
+
+
+def _swagger_client_config() -> dict:
+    return dict(
+        validate_swagger_spec=False,
+        validate_requests=False,
+        validate_responses=False,
+        formats=[uuid_format],
+    )
+
+
 @with_api_exceptions_handler
 def create_swagger_client(url: str, http_client: HttpClient) -> SwaggerClient:
+    with _swagger_specs_lock:
+        swagger_spec = _swagger_specs.get(url)
+    if swagger_spec is not None:
+        if swagger_spec.http_client is not http_client:
+            # operations send requests with the http client of their spec, so it's replaced in a copy of the spec
+            swagger_spec = copy.deepcopy(swagger_spec, {id(swagger_spec.http_client): http_client})
+        return SwaggerClient(swagger_spec)
+
+    swagger_client = _build_swagger_client(url, http_client)
+    if isinstance(swagger_client.swagger_spec, Spec):
+        with _swagger_specs_lock:
+            _swagger_specs.setdefault(url, swagger_client.swagger_spec)
+    return swagger_client
+
+
+def _build_swagger_client(url: str, http_client: HttpClient) -> SwaggerClient:
+    spec_dict = _load_swagger_spec(url, http_client)
+    if spec_dict is not None:
+        return SwaggerClient.from_spec(
+            spec_dict,
+            origin_url=url,
+            http_client=http_client,
+            config=_swagger_client_config(),
+        )
     return SwaggerClient.from_url(
         url,
-        config=dict(
-            validate_swagger_spec=False,
-            validate_requests=False,
-            validate_responses=False,
-            formats=[uuid_format],
-        ),
+        config=_swagger_client_config(),
         http_client=http_client,
     )
 
 
+def _load_swagger_spec(url: str, http_client: HttpClient) -> Optional[dict]:
+    if not isinstance(http_client, RequestsClient):
+        return None
+
+    api_cache = get_api_cache()
+    cached = api_cache.get(SWAGGER_SPEC_CACHE_KIND, url) if api_cache is not None else None
+    if cached is not None and cached.fresh:
+        spec_dict = cached.data
+    else:
+        spec_dict = _fetch_swagger_spec(api_cache, url, http_client, cached)
+    return spec_dict if isinstance(spec_dict, dict) else None
+
+
+def _fetch_swagger_spec(
+    api_cache: Optional[ApiCache], url: str, http_client: RequestsClient, cached: Optional[ApiCacheEntry]
+) -> Optional[dict]:
+    # imported here, as the clients module depends on this one
+    from neptune.new.internal.backends.hosted_client import DEFAULT_REQUEST_KWARGS
+
+    request_options = DEFAULT_REQUEST_KWARGS["_request_options"]
+    headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else {}
+    response = http_client.session.get(
+        url,
+        headers=headers,
+        timeout=(request_options["connect_timeout"], request_options["timeout"]),
+    )
+
+    if response.status_code == 304 and cached is not None:
+        api_cache.put(SWAGGER_SPEC_CACHE_KIND, url, cached.data, etag=cached.etag)
+        return cached.data
+
+    try:
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        if response.status_code < 500 or response.status_code in RETRIED_STATUS_CODES:
+            # retried or mapped to a Neptune exception by `with_api_exceptions_handler`
+            raise
+        raise InternalServerError(response.text) from e
+    spec_dict = response.json()
+    if api_cache is not None:
+        api_cache.put(SWAGGER_SPEC_CACHE_KIND, url, spec_dict, etag=response.headers.get("ETag"))
+    return spec_dict
+
+
 def verify_client_version(client_config: ClientConfig, version: Version):
     version_with_patch_0 = Version(replace_patch_version(str(version)))
     if client_config.version_info.min_compatible and client_config.version_info.min_compatible > version:
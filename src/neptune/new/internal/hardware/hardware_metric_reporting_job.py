@@ -18,10 +18,10 @@ __all__ = ["HardwareMetricReportingJob"]
 import logging
 import os
 import time
-from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Dict,
+    List,
     Optional,
 )
 
@@ -33,9 +33,14 @@ from neptune.common.hardware.metrics.reports.metric_reporter_factory import Metr
 from neptune.common.hardware.resources.system_resource_info_factory import SystemResourceInfoFactory
 from neptune.common.hardware.system.system_monitor import SystemMonitor
 from neptune.common.utils import in_docker
+from neptune.new.envs import (
+    NEPTUNE_MONITORING_AGGREGATION,
+    NEPTUNE_MONITORING_SAMPLING_PERIOD,
+)
 from neptune.new.internal.background_job import BackgroundJob
 from neptune.new.internal.hardware.gpu.gpu_monitor import GPUMonitor
 from neptune.new.internal.threading.daemon import Daemon
+from neptune.new.internal.utils.logger import logger
 from neptune.new.types.series import FloatSeries
 
 if TYPE_CHECKING:
@@ -43,10 +48,35 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+AGGREGATION_METHODS = ("mean", "max")
+
 
 class HardwareMetricReportingJob(BackgroundJob):
-    def __init__(self, period: float = 10, attribute_namespace: str = "monitoring"):
+    """Reports hardware metrics every `period` seconds.
+
+    Gauges are read every `sampling_period` seconds (by default, once per period), and the `aggregation`
+    ("mean" or "max") of the samples taken within a period is reported. All the metrics of a period
+    are logged with a single `log_metrics` call.
+    """
+
+    def __init__(
+        self,
+        period: float = 10,
+        attribute_namespace: str = "monitoring",
+        sampling_period: Optional[float] = None,
+        aggregation: Optional[str] = None,
+    ):
+        if sampling_period is None:
+            sampling_period = _get_sampling_period_from_env(period)
+        if aggregation is None:
+            aggregation = _get_aggregation_from_env()
+        if not 0 < sampling_period <= period:
+            raise ValueError("Hardware metrics sampling period must be positive and not longer than the period")
+        if aggregation not in AGGREGATION_METHODS:
+            raise ValueError(f"Unknown aggregation method {aggregation}, expected one of {AGGREGATION_METHODS}")
         self._period = period
+        self._sampling_period = sampling_period
+        self._aggregation = aggregation
         self._thread = None
         self._started = False
         self._gauges_in_resource: Dict[str, int] = dict()
@@ -73,7 +103,13 @@ class HardwareMetricReportingJob(BackgroundJob):
                 if not container.get_attribute(path):
                     container[path] = FloatSeries([], min=metric.min_value, max=metric.max_value, unit=metric.unit)
 
-        self._thread = self.ReportingThread(self, self._period, container, metric_reporter)
+        self._thread = self.ReportingThread(
+            self,
+            self._sampling_period,
+            max(1, round(self._period / self._sampling_period)),
+            container,
+            metric_reporter,
+        )
         self._thread.start()
         self._started = True
 
@@ -97,20 +133,76 @@ class HardwareMetricReportingJob(BackgroundJob):
         def __init__(
             self,
             outer: "HardwareMetricReportingJob",
-            period: float,
+            sampling_period: float,
+            samples_per_report: int,
             container: "MetadataContainer",
             metric_reporter: MetricReporter,
         ):
-            super().__init__(sleep_time=period, name="NeptuneReporting")
+            super().__init__(sleep_time=sampling_period, name="NeptuneReporting")
             self._outer = outer
+            self._samples_per_report = samples_per_report
             self._container = container
             self._metric_reporter = metric_reporter
+            self._samples: Dict[str, List[float]] = dict()
+            self._sample_count = 0
+
+        def run(self) -> None:
+            super().run()
+            # the samples of the last, partial period are reported once the job is stopped
+            self._report(time.time())
 
         def work(self) -> None:
-            metric_reports = self._metric_reporter.report(time.time())
-            for report in metric_reports:
-                for gauge_name, metric_values in groupby(report.values, lambda value: value.gauge_name):
-                    attr = self._container[self._outer.get_attribute_name(report.metric.resource_type, gauge_name)]
-                    # TODO: Avoid loop
-                    for metric_value in metric_values:
-                        attr.log(value=metric_value.value, timestamp=metric_value.timestamp)
+            timestamp = time.time()
+            for report in self._metric_reporter.report(timestamp):
+                for metric_value in report.values:
+                    path = self._outer.get_attribute_name(report.metric.resource_type, metric_value.gauge_name)
+                    self._samples.setdefault(path, []).append(metric_value.value)
+            self._sample_count += 1
+            if self._sample_count >= self._samples_per_report:
+                self._report(timestamp)
+
+        def _report(self, timestamp: float) -> None:
+            samples, self._samples, self._sample_count = self._samples, dict(), 0
+            if samples:
+                self._container.log_metrics(
+                    {path: self._aggregate(values) for path, values in samples.items()}, timestamp=timestamp
+                )
+
+        def _aggregate(self, values: List[float]) -> float:
+            if self._outer._aggregation == "max":
+                return max(values)
+            return sum(values) / len(values)
+
+
+def _get_sampling_period_from_env(period: float) -> float:
+    value = os.getenv(NEPTUNE_MONITORING_SAMPLING_PERIOD)
+    if value is None:
+        return period
+    try:
+        sampling_period = float(value)
+    except ValueError:
+        sampling_period = None
+    if sampling_period is None or not 0 < sampling_period <= period:
+        logger.warning(
+            "Ignoring %s=%s, which is not a positive number of seconds not longer than the reporting period (%s).",
+            NEPTUNE_MONITORING_SAMPLING_PERIOD,
+            value,
+            period,
+        )
+        return period
+    return sampling_period
+
+
+def _get_aggregation_from_env() -> str:
+    value = os.getenv(NEPTUNE_MONITORING_AGGREGATION)
+    if value is None:
+        return "mean"
+    if value not in AGGREGATION_METHODS:
+        logger.warning(
+            "Ignoring %s=%s, expected one of %s. Using mean.",
+            NEPTUNE_MONITORING_AGGREGATION,
+            value,
+            AGGREGATION_METHODS,
+        )
+        return "mean"
+    return value
@@ -20,6 +20,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Generic,
     List,
     Optional,
@@ -33,6 +34,7 @@ from neptune.common.exceptions import InternalClientError
 from neptune.new.exceptions import MalformedOperation
 from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.types.file_types import FileType
+from neptune.new.internal.utils import base64_encode
 from neptune.new.types.atoms.file import File
 
 if TYPE_CHECKING:
@@ -60,6 +62,14 @@ class Operation(abc.ABC):
     def clean(self):
         pass
 
+    def blob_paths(self) -> List[str]:
+        """Blob files referenced by this operation, released once the operation is acknowledged"""
+        return []
+
+    def resolve_blob_paths(self, base_path: Path) -> None:
+        """Makes paths of the referenced blobs, stored relative to the execution directory, absolute"""
+        pass
+
     def to_dict(self) -> dict:
         return {"type": self.__class__.__name__, "path": self.path}
 
@@ -318,6 +328,84 @@ class LogFloats(LogOperation):
         )
 
 
+@dataclass
+class LogFloatColumns(LogOperation):
+    """Points of a float series stored column-wise, as produced by `extend` with NumPy arrays.
+
+    The operation is never sent as is; visitors get the equivalent `LogFloats` operation.
+    """
+
+    values: List[float]
+    steps: Optional[List[float]]
+    timestamps: List[float]
+
+    def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
+        return visitor.visit_log_floats(self.to_log_floats())
+
+    def to_log_floats(self) -> LogFloats:
+        steps = self.steps if self.steps is not None else [None] * len(self.values)
+        return LogFloats(
+            self.path,
+            [
+                LogFloats.ValueType(value, step=step, ts=ts)
+                for value, step, ts in zip(self.values, steps, self.timestamps)
+            ],
+        )
+
+    def to_dict(self) -> dict:
+        ret = super().to_dict()
+        ret["values"] = self.values
+        ret["steps"] = self.steps
+        if self.timestamps and self.timestamps.count(self.timestamps[0]) == len(self.timestamps):
+            # points logged in a single call usually share the timestamp
+            ret["timestamp"] = self.timestamps[0]
+        else:
+            ret["timestamps"] = self.timestamps
+        return ret
+
+    @staticmethod
+    def from_dict(data: dict) -> "LogFloatColumns":
+        if "timestamps" in data:
+            timestamps = data["timestamps"]
+        else:
+            timestamps = [data["timestamp"]] * len(data["values"])
+        return LogFloatColumns(data["path"], data["values"], data.get("steps"), timestamps)
+
+
+@dataclass
+class LogMultipleFloats(LogOperation):
+    """Single points of several float series under `path`, sharing the step and the timestamp.
+
+    Produced by `log_metrics`, so that all the series logged in one step take a single queue entry.
+    The operation is never sent as is; it's split into `LogFloats` operations of the individual series
+    before the operations are preprocessed or executed.
+    """
+
+    values: Dict[str, float]
+    step: Optional[float]
+    ts: float
+
+    def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
+        raise InternalClientError("LogMultipleFloats must be split into LogFloats operations before being visited")
+
+    def split(self) -> List[LogFloats]:
+        return [
+            LogFloats(self.path + relative_path.split("/"), [LogFloats.ValueType(value, step=self.step, ts=self.ts)])
+            for relative_path, value in self.values.items()
+        ]
+
+    def to_dict(self) -> dict:
+        ret = super().to_dict()
+        ret["values"] = self.values
+        ret["step"] = self.step
+        ret["ts"] = self.ts
+        return ret
+
+    @staticmethod
+    def from_dict(data: dict) -> "LogMultipleFloats":
+        return LogMultipleFloats(data["path"], data["values"], data.get("step"), data["ts"])
+
+
 @dataclass
 class LogStrings(LogOperation):
 
@@ -341,15 +429,62 @@ class LogStrings(LogOperation):
         )
 
 
+@dataclass
+class LogStringColumns(LogOperation):
+    """Values of a string series stored column-wise, as produced by streamed string series.
+
+    The operation is never sent as is; visitors get the equivalent `LogStrings` operation.
+    """
+
+    values: List[str]
+    steps: Optional[List[Optional[float]]]
+    timestamps: List[float]
+
+    def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
+        return visitor.visit_log_strings(self.to_log_strings())
+
+    def to_log_strings(self) -> LogStrings:
+        steps = self.steps if self.steps is not None else [None] * len(self.values)
+        return LogStrings(
+            self.path,
+            [
+                LogStrings.ValueType(value, step=step, ts=ts)
+                for value, step, ts in zip(self.values, steps, self.timestamps)
+            ],
+        )
+
+    def to_dict(self) -> dict:
+        ret = super().to_dict()
+        ret["values"] = self.values
+        if self.steps is not None:
+            ret["steps"] = self.steps
+        ret["timestamps"] = self.timestamps
+        return ret
+
+    @staticmethod
+    def from_dict(data: dict) -> "LogStringColumns":
+        return LogStringColumns(data["path"], data["values"], data.get("steps"), data["timestamps"])
+
+
 @dataclass
 class ImageValue:
     data: Optional[str]
     name: Optional[str]
     description: Optional[str]
+    blob_path: Optional[str] = None
+
+    def get_data(self) -> Optional[str]:
+        if self.blob_path is not None:
+            with open(self.blob_path, "rb") as blob:
+                return base64_encode(blob.read())
+        return self.data
 
     @staticmethod
     def serializer(obj: "ImageValue"):
-        return dict(data=obj.data, name=obj.name, description=obj.description)
+        ret = dict(data=obj.data, name=obj.name, description=obj.description)
+        if obj.blob_path is not None:
+            ret["blob_path"] = obj.blob_path
+        return ret
 
     @staticmethod
     def deserializer(obj) -> "ImageValue":
@@ -358,7 +493,12 @@ class ImageValue:
         if isinstance(obj, str):
             return ImageValue(data=obj, name=None, description=None)
         if isinstance(obj, dict):
-            return ImageValue(data=obj["data"], name=obj["name"], description=obj["description"])
+            return ImageValue(
+                data=obj["data"],
+                name=obj["name"],
+                description=obj["description"],
+                blob_path=obj.get("blob_path"),
+            )
         else:
             raise InternalClientError("Run data on disk is malformed or was saved by newer version of Neptune Library")
 
@@ -373,6 +513,14 @@ class LogImages(LogOperation):
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_images(self)
 
+    def blob_paths(self) -> List[str]:
+        return [value.value.blob_path for value in self.values if value.value.blob_path is not None]
+
+    def resolve_blob_paths(self, base_path: Path) -> None:
+        for value in self.values:
+            if value.value.blob_path is not None:
+                value.value.blob_path = str(base_path / value.value.blob_path)
+
     def to_dict(self) -> dict:
         ret = super().to_dict()
         ret["values"] = [value.to_dict(ImageValue.serializer) for value in self.values]
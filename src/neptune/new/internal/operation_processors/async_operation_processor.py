@@ -19,6 +19,7 @@ import logging
 import os
 import sys
 import threading
+from collections import deque
 from datetime import datetime
 from time import (
     monotonic,
@@ -39,6 +40,7 @@ from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.disk_queue import DiskQueue
 from neptune.new.internal.id_formats import UniqueId
 from neptune.new.internal.operation import Operation
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
 from neptune.new.internal.operation_processors.operation_processor import OperationProcessor
 from neptune.new.internal.operation_processors.operation_storage import OperationStorage
 from neptune.new.internal.threading.daemon import Daemon
@@ -50,6 +52,9 @@ _logger = logging.getLogger(__name__)
 class AsyncOperationProcessor(OperationProcessor):
     STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS = 30
     STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS = 300
+    WRITER_SLEEP_TIME_SECONDS = 1
+    # enqueueing blocks on writing operations to disk only when this many are waiting for the writer thread
+    MAX_PENDING_OPERATIONS = 10000
 
     def __init__(
         self,
@@ -78,6 +83,14 @@ class AsyncOperationProcessor(OperationProcessor):
         self._consumer = self.ConsumerThread(self, sleep_time, batch_size)
         self._drop_operations = False
 
+        # Enqueueing threads only append operations here.
+        # They're serialized and written to the disk queue by the writer thread, under the write lock.
+        self._pending_operations = deque()
+        self._write_lock = threading.Lock()
+        # the first error of writing to the disk queue, raised to the user on the next enqueue, wait or flush
+        self._write_error: Optional[Exception] = None
+        self._writer = self.WriterThread(self, self.WRITER_SLEEP_TIME_SECONDS)
+
         # Caller is responsible for taking this lock
         self._waiting_cond = threading.Condition(lock=lock)
 
@@ -98,15 +111,46 @@ class AsyncOperationProcessor(OperationProcessor):
     def _handle_fork_in_child(self):
         self._drop_operations = True
 
+    @property
+    def blob_storage(self) -> BlobStorage:
+        return self._operation_storage.blob_storage
+
     def enqueue_operation(self, op: Operation, wait: bool) -> None:
         if self._drop_operations:
             return
-        self._last_version = self._queue.put(op)
-        if self._queue.size() > self._batch_size / 2:
-            self._consumer.wake_up()
+        self._raise_write_error()
+        self._pending_operations.append(op)
+        if len(self._pending_operations) >= self.MAX_PENDING_OPERATIONS:
+            # the writer thread doesn't keep up, help it with writing
+            self._write_pending_operations(max_count=1)
+        else:
+            self._writer.wake_up()
         if wait:
             self.wait()
 
+    def _write_pending_operations(self, max_count: Optional[int] = None) -> None:
+        written = 0
+        while max_count is None or written < max_count:
+            # the lock is taken for each operation, so that enqueueing threads helping the writer don't wait long
+            with self._write_lock:
+                if not self._pending_operations:
+                    break
+                op = self._pending_operations.popleft()
+                try:
+                    self._last_version = self._queue.put(op)
+                    written += 1
+                except Exception as e:
+                    _logger.exception("Cannot save operation %s to the disk queue", type(op).__name__)
+                    if self._write_error is None:
+                        self._write_error = e
+        if written and self._queue.size() > self._batch_size / 2:
+            self._consumer.wake_up()
+
+    def _raise_write_error(self) -> None:
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
     def wait(self):
         self.flush()
         waiting_for_version = self._last_version
@@ -121,9 +165,16 @@ class AsyncOperationProcessor(OperationProcessor):
             raise NeptuneSynchronizationAlreadyStoppedException()
 
     def flush(self):
-        self._queue.flush()
+        self._flush()
+        self._raise_write_error()
+
+    def _flush(self):
+        self._write_pending_operations()
+        with self._write_lock:
+            self._queue.flush()
 
     def start(self):
+        self._writer.start()
         self._consumer.start()
 
     def _wait_for_queue_empty(self, initial_queue_size: int, seconds: Optional[float]):
@@ -199,7 +250,10 @@ class AsyncOperationProcessor(OperationProcessor):
 
     def stop(self, seconds: Optional[float] = None):
         ts = time()
-        self._queue.flush()
+        self._writer.interrupt()
+        self._writer.join()
+        # write errors are already logged, stopping must not be interrupted by them
+        self._flush()
         if self._consumer.is_running():
             self._consumer.disable_sleep()
             self._consumer.wake_up()
@@ -233,13 +287,16 @@ class AsyncOperationProcessor(OperationProcessor):
             ts = time()
             if ts - self._last_flush >= self._sleep_time:
                 self._last_flush = ts
-                self._processor._queue.flush()
+                self._processor._flush()
 
             while True:
                 batch = self._processor._queue.get_batch(self._batch_size)
                 if not batch:
                     return
-                self.process_batch([element.obj for element in batch], batch[-1].ver)
+                operations = [element.obj for element in batch]
+                for op in operations:
+                    op.resolve_blob_paths(self._processor.blob_storage.base_path)
+                self.process_batch(operations, batch[-1].ver)
 
         @Daemon.ConnectionRetryWrapper(
             kill_message=(
@@ -258,10 +315,13 @@ class AsyncOperationProcessor(OperationProcessor):
                     operations=batch,
                 )
                 version_to_ack += processed_count
-                batch = batch[processed_count:]
+                processed_batch, batch = batch[:processed_count], batch[processed_count:]
+                # the container lock is not held during the disk I/O, so that it doesn't block logging
+                self._processor._queue.ack(version_to_ack)
+                self._processor.blob_storage.release(
+                    blob_path for op in processed_batch for blob_path in op.blob_paths()
+                )
                 with self._processor._waiting_cond:
-                    self._processor._queue.ack(version_to_ack)
-
                     for error in errors:
                         _logger.error(
                             "Error occurred during asynchronous operation processing: %s",
@@ -273,3 +333,13 @@ class AsyncOperationProcessor(OperationProcessor):
                     if version_to_ack == version:
                         self._processor._waiting_cond.notify_all()
                         return
+
+    class WriterThread(Daemon):
+        """Serializes enqueued operations and writes them to the disk queue, off the enqueueing thread"""
+
+        def __init__(self, processor: "AsyncOperationProcessor", sleep_time: float):
+            super().__init__(sleep_time=sleep_time, name="NeptuneAsyncOpWriter")
+            self._processor = processor
+
+        def work(self) -> None:
+            self._processor._write_pending_operations()
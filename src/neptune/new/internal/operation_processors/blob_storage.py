@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "BlobStorage",
+]
+
+import hashlib
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+)
+
+from neptune.new.internal.utils.logger import logger
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class BlobStorage:
+    """Content-addressed storage of binary payloads referenced from queued operations.
+
+    Blobs are named after the SHA-1 digest of their content, so logging the same bytes many times
+    stores them once. Operations reference blobs by paths relative to the parent of `dir_path`, the execution
+    directory, so that they stay valid when the directory is moved, e.g. by `neptune sync`.
+
+    Every `put` takes a reference which has to be given back with `release` once the operation using the blob
+    has been acknowledged. References are counted in memory only: blobs which weren't put by this instance,
+    e.g. when syncing a queue left by another process, are not removed by `release`, but together with
+    the execution directory once its queue is empty.
+    """
+
+    def __init__(self, dir_path: Path):
+        self._dir_path = Path(dir_path).resolve()
+        self._references: Dict[str, int] = dict()
+        self._lock = threading.Lock()
+
+        os.makedirs(self._dir_path, exist_ok=True)
+
+    @property
+    def dir_path(self) -> Path:
+        return self._dir_path
+
+    @property
+    def base_path(self) -> Path:
+        """Directory which paths of the blobs are relative to"""
+        return self._dir_path.parent
+
+    def get_path(self, blob_path: str) -> Path:
+        return self._dir_path / Path(blob_path).name
+
+    def _get_blob_path(self, digest: str) -> str:
+        return f"{self._dir_path.name}/{digest}"
+
+    def put(self, content: bytes) -> str:
+        digest = hashlib.sha1(content).hexdigest()
+        blob_path = self._dir_path / digest
+        with self._lock:
+            if not blob_path.exists():
+                tmp_path = self._get_tmp_path()
+                with open(tmp_path, "wb") as blob_file:
+                    blob_file.write(content)
+                os.replace(tmp_path, blob_path)
+            self._references[digest] = self._references.get(digest, 0) + 1
+        return self._get_blob_path(digest)
+
+    def put_file(self, source_path: str) -> str:
+        tmp_path = self._get_tmp_path()
+        file_hash = hashlib.sha1()
+        with open(source_path, "rb") as source, open(tmp_path, "wb") as blob_file:
+            while True:
+                chunk = source.read(_COPY_BUFFER_SIZE)
+                if not chunk:
+                    break
+                file_hash.update(chunk)
+                blob_file.write(chunk)
+
+        digest = file_hash.hexdigest()
+        blob_path = self._dir_path / digest
+        with self._lock:
+            if blob_path.exists():
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, blob_path)
+            self._references[digest] = self._references.get(digest, 0) + 1
+        return self._get_blob_path(digest)
+
+    def release(self, blob_paths: Iterable[str]) -> None:
+        with self._lock:
+            for blob_path in blob_paths:
+                digest = Path(blob_path).name
+                if digest not in self._references:
+                    # referenced by operations queued by another process, which may still be waiting
+                    continue
+                references = self._references[digest] - 1
+                if references > 0:
+                    self._references[digest] = references
+                    continue
+                self._references.pop(digest, None)
+                try:
+                    os.remove(self._dir_path / digest)
+                except FileNotFoundError:
+                    # not really a problem
+                    pass
+                except OSError:
+                    logger.debug(f"Cannot remove blob: {blob_path}")
+
+    def _get_tmp_path(self) -> Path:
+        return self._dir_path / f".tmp-{uuid.uuid4().hex}"
@@ -26,6 +26,7 @@ from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.disk_queue import DiskQueue
 from neptune.new.internal.id_formats import UniqueId
 from neptune.new.internal.operation import Operation
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
 from neptune.new.internal.operation_processors.operation_processor import OperationProcessor
 from neptune.new.internal.operation_processors.operation_storage import OperationStorage
 
@@ -45,6 +46,10 @@ class OfflineOperationProcessor(OperationProcessor):
     def _init_data_path(container_id: UniqueId, container_type: ContainerType):
         return f"{NEPTUNE_DATA_DIRECTORY}/{OFFLINE_DIRECTORY}/{container_type.create_dir_name(container_id)}"
 
+    @property
+    def blob_storage(self) -> BlobStorage:
+        return self._operation_storage.blob_storage
+
     def enqueue_operation(self, op: Operation, wait: bool) -> None:
         self._queue.put(op)
 
@@ -16,10 +16,16 @@
 __all__ = ("OperationProcessor",)
 
 import abc
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
 
 from neptune.new.internal.operation import Operation
 
+if TYPE_CHECKING:
+    from neptune.new.internal.operation_processors.blob_storage import BlobStorage
+
 
 class OperationProcessor(abc.ABC):
     @abc.abstractmethod
@@ -41,3 +47,7 @@ class OperationProcessor(abc.ABC):
     @abc.abstractmethod
     def stop(self, seconds: Optional[float] = None):
         pass
+
+    @property
+    def blob_storage(self) -> Optional["BlobStorage"]:
+        return None
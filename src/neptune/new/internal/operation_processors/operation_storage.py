@@ -24,6 +24,7 @@ from pathlib import Path
 from neptune.new.constants import NEPTUNE_DATA_DIRECTORY
 from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.id_formats import UniqueId
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
 from neptune.new.internal.utils.logger import logger
 
 
@@ -34,6 +35,7 @@ class OperationStorage:
         # initialize directories
         os.makedirs(self.data_path, exist_ok=True)
         os.makedirs(self.upload_path, exist_ok=True)
+        self._blob_storage = BlobStorage(self.blob_path)
 
     @property
     def data_path(self) -> Path:
@@ -43,6 +45,14 @@ class OperationStorage:
     def upload_path(self) -> Path:
         return self.data_path / "upload_path"
 
+    @property
+    def blob_path(self) -> Path:
+        return self.data_path / "blobs"
+
+    @property
+    def blob_storage(self) -> BlobStorage:
+        return self._blob_storage
+
     @staticmethod
     def _get_container_dir(type_dir: str, container_id: UniqueId, container_type: ContainerType):
         return f"{NEPTUNE_DATA_DIRECTORY}/{type_dir}/{container_type.create_dir_name(container_id)}"
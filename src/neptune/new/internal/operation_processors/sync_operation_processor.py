@@ -26,6 +26,7 @@ from neptune.new.internal.backends.neptune_backend import NeptuneBackend
 from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.id_formats import UniqueId
 from neptune.new.internal.operation import Operation
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
 from neptune.new.internal.operation_processors.operation_processor import OperationProcessor
 from neptune.new.internal.operation_processors.operation_storage import OperationStorage
 
@@ -44,8 +45,14 @@ class SyncOperationProcessor(OperationProcessor):
         data_path = f"{container_dir}/exec-{now.timestamp()}-{now.strftime('%Y-%m-%d_%H.%M.%S.%f')}"
         return data_path
 
+    @property
+    def blob_storage(self) -> BlobStorage:
+        return self._operation_storage.blob_storage
+
     def enqueue_operation(self, op: Operation, wait: bool) -> None:
+        op.resolve_blob_paths(self.blob_storage.base_path)
         _, errors = self._backend.execute_operations(self._container_id, self._container_type, [op])
+        self.blob_storage.release(op.blob_paths())
         if errors:
             raise errors[0]
 
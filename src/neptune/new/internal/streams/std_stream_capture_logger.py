@@ -26,7 +26,7 @@ from neptune.new.metadata_containers import MetadataContainer
 
 class StdStreamCaptureLogger:
     def __init__(self, container: MetadataContainer, attribute_name: str, stream: TextIO):
-        self._logger = NeptuneLogger(container, attribute_name)
+        self._logger = NeptuneLogger(container, attribute_name, stream=True)
         self.stream = stream
         self._thread_local = threading.local()
         self.enabled = True
@@ -51,7 +51,7 @@ class StdStreamCaptureLogger:
             data = self._log_data_queue.get()
             if data is None:
                 break
-            self._logger.log(data)
+            self._logger.write(data)
 
 
 class StdoutCaptureLogger(StdStreamCaptureLogger):
@@ -19,12 +19,14 @@ __all__ = [
     "InMemoryComposite",
     "FileComposite",
     "StreamComposite",
+    "DeferredComposite",
 ]
 
 import abc
 import enum
 import io
 import os
+from concurrent.futures import Future
 from functools import wraps
 from io import IOBase
 from typing import (
@@ -166,3 +168,31 @@ class StreamComposite(FileComposite):
 
     def __str__(self):
         return f"File(stream={self._stream})"
+
+
+class DeferredComposite(FileComposite):
+    """In-memory content which is being rendered in the background, blocks on access until it's ready"""
+
+    file_type = FileType.IN_MEMORY
+
+    def __init__(self, rendered: Future, extension: str):
+        super().__init__(extension)
+        self._rendered = rendered
+
+    @property
+    def rendered(self) -> Future:
+        return self._rendered
+
+    @property
+    def content(self):
+        content = self._rendered.result()
+        if content is None:
+            return b""
+        return content.encode("utf-8") if isinstance(content, str) else content
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.content)
+
+    def __str__(self):
+        return "File(content=<deferred>)"
@@ -63,16 +63,17 @@ def replace_patch_version(version: str):
 
 
 def verify_type(var_name: str, var, expected_type: Union[type, tuple]):
-    try:
-        if isinstance(expected_type, tuple):
-            type_name = " or ".join(get_type_name(t) for t in expected_type)
-        else:
-            type_name = get_type_name(expected_type)
-    except Exception as e:
-        # Just to be sure that nothing weird will be raised here
-        raise TypeError("Incorrect type of {}".format(var_name)) from e
-
     if not isinstance(var, expected_type):
+        # type names are resolved only when needed, as this is called on every logged value
+        try:
+            if isinstance(expected_type, tuple):
+                type_name = " or ".join(get_type_name(t) for t in expected_type)
+            else:
+                type_name = get_type_name(expected_type)
+        except Exception as e:
+            # Just to be sure that nothing weird will be raised here
+            raise TypeError("Incorrect type of {}".format(var_name)) from e
+
         raise TypeError("{} must be a {} (was {})".format(var_name, type_name, type(var)))
 
     if isinstance(var, IOBase) and not hasattr(var, "read"):
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "is_array_like",
+    "as_float_array",
+    "verify_finite",
+    "verify_strictly_increasing",
+]
+
+from typing import Any
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from pandas import (
+        Index,
+        Series,
+    )
+except ImportError:
+    Index = Series = None
+
+
+def is_array_like(value) -> bool:
+    """Whether `value` is a one-dimensional NumPy array or pandas Series / Index"""
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return True
+    return Series is not None and isinstance(value, (Series, Index))
+
+
+def as_float_array(var_name: str, values: Any) -> "numpy.ndarray":
+    try:
+        array = numpy.asarray(values, dtype=numpy.float64)
+    except (TypeError, ValueError):
+        raise TypeError("{} must be a collection of floats or ints".format(var_name))
+    if array.ndim != 1:
+        raise ValueError("{} must be one-dimensional (got {} dimensions)".format(var_name, array.ndim))
+    return array
+
+
+def verify_finite(var_name: str, array: "numpy.ndarray") -> None:
+    if not numpy.isfinite(array).all():
+        raise ValueError("{} must not contain NaN or infinite values".format(var_name))
+
+
+def verify_strictly_increasing(var_name: str, array: "numpy.ndarray") -> None:
+    if len(array) > 1 and not (numpy.diff(array) > 0).all():
+        raise ValueError("{} must be strictly increasing".format(var_name))
@@ -0,0 +1,219 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "DeferredRenderer",
+    "DeferredOperations",
+    "get_deferred_renderer",
+]
+
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from neptune.new.envs import (
+    NEPTUNE_RENDER_MAX_PENDING,
+    NEPTUNE_RENDER_MAX_PENDING_MB,
+    NEPTUNE_RENDER_WORKERS,
+)
+from neptune.new.internal.threading.daemon import Daemon
+from neptune.new.internal.utils.images import is_matplotlib_figure
+from neptune.new.internal.utils.limits import BYTES_IN_MB
+from neptune.new.internal.utils.logger import logger
+
+if TYPE_CHECKING:
+    from neptune.new.internal.operation import Operation
+
+Content = Union[str, bytes, None]
+
+
+class DeferredRenderer:
+    """Bounded pool of threads converting charts and images to file content in the background.
+
+    Objects are snapshotted with pickle when they are submitted, so that changing them afterwards doesn't affect
+    what's rendered. Matplotlib figures are kept by reference instead, as unpickling them may create figure managers
+    of the interactive backend; they must not be modified until rendered.
+
+    At most `max_pending` objects, taking at most `max_pending_bytes` as snapshots, are waiting for rendering.
+    Submitting more blocks until some of them are rendered.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, max_pending_bytes: int = 256 * BYTES_IN_MB):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="NeptuneRenderer")
+        self._max_pending = max_pending
+        self._max_pending_bytes = max_pending_bytes
+        self._pending = 0
+        self._pending_bytes = 0
+        self._pending_changed = threading.Condition()
+
+    def submit(self, render: Callable[[Any], Content], obj: Any) -> Future:
+        load, size = self._snapshot(obj)
+
+        with self._pending_changed:
+            # a single object exceeding the memory limit is still rendered, just not together with others
+            self._pending_changed.wait_for(
+                lambda: self._pending == 0
+                or (self._pending < self._max_pending and self._pending_bytes + size <= self._max_pending_bytes)
+            )
+            self._pending += 1
+            self._pending_bytes += size
+
+        future = self._executor.submit(lambda: render(load()))
+        future.add_done_callback(lambda _: self._release(size))
+        return future
+
+    def _release(self, size: int) -> None:
+        with self._pending_changed:
+            self._pending -= 1
+            self._pending_bytes -= size
+            self._pending_changed.notify_all()
+
+    @staticmethod
+    def _snapshot(obj: Any) -> Tuple[Callable[[], Any], int]:
+        if not is_matplotlib_figure(obj):
+            try:
+                data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+                return lambda: pickle.loads(data), len(data)
+            except Exception as e:
+                logger.debug("Cannot snapshot %s, it will be rendered as it is: %s", type(obj), e)
+        return lambda: obj, 0
+
+
+_renderer: Optional[DeferredRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_deferred_renderer() -> DeferredRenderer:
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = DeferredRenderer(
+                workers=int(os.getenv(NEPTUNE_RENDER_WORKERS, "2")),
+                max_pending=int(os.getenv(NEPTUNE_RENDER_MAX_PENDING, "16")),
+                max_pending_bytes=int(os.getenv(NEPTUNE_RENDER_MAX_PENDING_MB, "256")) * BYTES_IN_MB,
+            )
+        return _renderer
+
+
+class DeferredOperations:
+    """Operations of a container waiting for their values to be rendered.
+
+    Operations are enqueued in the order they were added, as soon as their values and the values of all the preceding
+    ones are rendered: by a background thread, the threads adding further operations and `flush()`.
+    Render threads only signal that a value is ready. They must not wait for `container_lock`, as it's held
+    by the container while flushing, which may in turn wait for renders queued behind them.
+    `container_lock` has to be acquired before the internal lock.
+    """
+
+    def __init__(self, container_lock: threading.RLock, enqueue: Callable[["Operation"], None]):
+        self._container_lock = container_lock
+        self._enqueue = enqueue
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._pending: Deque[Tuple[List[str], Optional[Future], Callable[[], "Operation"]]] = deque()
+        self._enqueuer: Optional[_ReadyOperationsEnqueuer] = None
+
+    def add(self, path: List[str], rendered: Optional[Future], create_operation: Callable[[], "Operation"]) -> None:
+        """Adds the operation, enqueueing the ones whose values are already rendered"""
+        with self._container_lock, self._lock:
+            self._pending.append((path, rendered, create_operation))
+            self._enqueue_completed()
+            if rendered is not None and self._enqueuer is None:
+                self._enqueuer = _ReadyOperationsEnqueuer(self)
+                self._enqueuer.start()
+        if rendered is not None:
+            rendered.add_done_callback(lambda _: self._notify_ready())
+
+    def enqueue_ready(self) -> None:
+        """Enqueues the operations whose values, and the values of all the preceding ones, are rendered"""
+        with self._container_lock, self._lock:
+            self._enqueue_completed()
+
+    def stop(self) -> None:
+        """Stops the background thread; the remaining operations have to be flushed afterwards"""
+        if self._enqueuer is not None:
+            self._enqueuer.interrupt()
+            self._enqueuer.join()
+            self._enqueuer = None
+
+    def is_pending(self, path: List[str]) -> bool:
+        with self._lock:
+            return any(entry[0] == path for entry in self._pending)
+
+    def flush(self) -> None:
+        """Waits for all values and enqueues their operations"""
+        with self._container_lock, self._ready:
+            while self._pending:
+                # waiting releases the internal lock, so render threads can signal completion
+                self._ready.wait_for(self._is_first_ready)
+                self._enqueue_next()
+
+    def discard(self, path: List[str]) -> None:
+        """Drops operations of the attributes under `path`, e.g. when it's deleted"""
+        with self._container_lock, self._lock:
+            self._pending = deque(entry for entry in self._pending if entry[0][: len(path)] != path)
+            self._enqueue_completed()
+
+    def _notify_ready(self) -> None:
+        with self._ready:
+            self._ready.notify_all()
+            enqueuer = self._enqueuer
+        if enqueuer is not None:
+            enqueuer.wake_up()
+
+    def _is_first_ready(self) -> bool:
+        rendered = self._pending[0][1]
+        return rendered is None or rendered.done()
+
+    def _enqueue_completed(self) -> None:
+        while self._pending and self._is_first_ready():
+            self._enqueue_next()
+
+    def _enqueue_next(self) -> None:
+        path, rendered, create_operation = self._pending.popleft()
+        try:
+            if rendered is not None:
+                rendered.result()
+            operation = create_operation()
+        except Exception as e:
+            logger.error("Failed to render value of %s: %s", "/".join(path), e)
+            return
+        self._enqueue(operation)
+
+
+class _ReadyOperationsEnqueuer(Daemon):
+    """Enqueues deferred operations of a container as soon as their values are rendered"""
+
+    def __init__(self, operations: DeferredOperations, sleep_time: float = 1):
+        super().__init__(sleep_time=sleep_time, name="NeptuneDeferredOperations")
+        self._operations = operations
+
+    def work(self) -> None:
+        self._operations.enqueue_ready()
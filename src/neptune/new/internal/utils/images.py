@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 __all__ = [
+    "ImageOptions",
     "get_image_content",
     "get_html_content",
     "get_pickle_content",
@@ -31,41 +32,86 @@ import io
 import logging
 import pickle
 import warnings
+from dataclasses import dataclass
 from io import (
     BytesIO,
     StringIO,
 )
-from typing import Optional
+from typing import (
+    Optional,
+    Tuple,
+)
 
 from packaging import version
 from pandas import DataFrame
 
 from neptune.new.exceptions import PlotlyIncompatibilityException
+from neptune.new.internal.utils import verify_type
 from neptune.new.internal.utils.logger import logger
 
 _logger = logging.getLogger(__name__)
 
 try:
-    from numpy import array as numpy_array
+    import numpy
     from numpy import ndarray as numpy_ndarray
-    from numpy import uint8 as numpy_uint8
 except ImportError:
+    numpy = None
     numpy_ndarray = None
-    numpy_array = None
-    numpy_uint8 = None
 
 try:
     from PIL.Image import Image as PILImage
     from PIL.Image import fromarray as pilimage_fromarray
+    from PIL.Image import open as pilimage_open
 except ImportError:
     PILImage = None
 
     def pilimage_fromarray():
         pass
 
+    def pilimage_open():
+        pass
+
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
+
+
+@dataclass(frozen=True)
+class ImageOptions:
+    """Encoding of images converted with `File.as_image`.
+
+    `quality` (1-100) applies to the lossy "jpeg" and "webp" formats and `compress_level` (0-9) to "png".
+    Images larger than `max_size` pixels on their longer side are scaled down, keeping the aspect ratio.
+    """
+
+    format: str = "png"
+    quality: Optional[int] = None
+    compress_level: Optional[int] = None
+    max_size: Optional[int] = None
+
+    def __post_init__(self):
+        verify_type("format", self.format, str)
+        verify_type("quality", self.quality, (int, type(None)))
+        verify_type("compress_level", self.compress_level, (int, type(None)))
+        verify_type("max_size", self.max_size, (int, type(None)))
+        if self.format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format {self.format}, expected one of {IMAGE_FORMATS}")
+        if self.quality is not None and not 1 <= self.quality <= 100:
+            raise ValueError("Image quality must be between 1 and 100")
+        if self.compress_level is not None and not 0 <= self.compress_level <= 9:
+            raise ValueError("PNG compression level must be between 0 and 9")
+        if self.max_size is not None and self.max_size < 1:
+            raise ValueError("Maximal image size must be a positive number of pixels")
+
+    @property
+    def is_default(self) -> bool:
+        return self == _DEFAULT_IMAGE_OPTIONS
+
+
+_DEFAULT_IMAGE_OPTIONS = ImageOptions()
 
-def get_image_content(image) -> Optional[bytes]:
-    content = _image_to_bytes(image)
+
+def get_image_content(image, options: Optional[ImageOptions] = None) -> Optional[bytes]:
+    content = _image_to_bytes(image, options or _DEFAULT_IMAGE_OPTIONS)
 
     return content
 
@@ -82,24 +128,24 @@ def get_pickle_content(obj) -> Optional[bytes]:
     return content
 
 
-def _image_to_bytes(image) -> bytes:
+def _image_to_bytes(image, options: ImageOptions) -> bytes:
     if image is None:
         raise ValueError("image is None")
 
     elif is_numpy_array(image):
-        return _get_numpy_as_image(image)
+        return _get_numpy_as_image(image, options)
 
     elif is_pil_image(image):
-        return _get_pil_image_data(image)
+        return _get_pil_image_data(image, options)
 
     elif is_matplotlib_figure(image):
-        return _get_figure_image_data(image)
+        return _get_figure_image_data(image, options)
 
     elif _is_torch_tensor(image):
-        return _get_numpy_as_image(image.detach().numpy())
+        return _get_numpy_as_image(image.detach().cpu().numpy(), options)
 
     elif _is_tensorflow_tensor(image):
-        return _get_numpy_as_image(image.numpy())
+        return _get_numpy_as_image(image.numpy(), options)
 
     raise TypeError("image is {}".format(type(image)))
 
@@ -189,12 +235,29 @@ def _image_content_to_html(content: bytes) -> str:
     return "<img src='data:image/png;base64," + str_equivalent_image + "'/>"
 
 
-def _get_numpy_as_image(array):
-    array = array.copy()  # prevent original array from modifying
+def _get_numpy_as_image(array, options: ImageOptions = _DEFAULT_IMAGE_OPTIONS):
+    if array.ndim == 3 and array.shape[2] == 1:
+        array = array[:, :, 0]
+    if array.ndim not in (2, 3) or (array.ndim == 3 and array.shape[2] not in (3, 4)):
+        raise ValueError(
+            "Incorrect size of numpy.ndarray. Should be 2-dimensional or"
+            "3-dimensional with 3rd dimension of size 1, 3 or 4."
+        )
+
+    # uint8 arrays already hold pixel values, others are expected to be in the [0, 1] range
+    if array.dtype != numpy.uint8:
+        array_min, array_max = array.min(), array.max()
+        _warn_about_data_range(array_min, array_max)
+        # the original array is not modified, as the result of multiplication is a new array
+        array = numpy.multiply(array, 255, dtype=numpy.result_type(array.dtype, numpy.float32))
+        if array_min < 0 or array_max > 1:
+            numpy.clip(array, 0, 255, out=array)
+        array = array.astype(numpy.uint8)
+    return _get_pil_image_data(pilimage_fromarray(array), options)
+
 
+def _warn_about_data_range(array_min, array_max) -> None:
     data_range_warnings = []
-    array_min = array.min()
-    array_max = array.max()
     if array_min < 0:
         data_range_warnings.append(f"the smallest value in the array is {array_min}")
     if array_max > 1:
@@ -205,32 +268,50 @@ def _get_numpy_as_image(array):
             "%s To be interpreted as colors correctly values in the array need to be in the [0, 1] range.",
             data_range_warning_message,
         )
-    array *= 255
-    shape = array.shape
-    if len(shape) == 2:
-        return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8)))
-    if len(shape) == 3:
-        if shape[2] == 1:
-            array2d = numpy_array([[col[0] for col in row] for row in array])
-            return _get_pil_image_data(pilimage_fromarray(array2d.astype(numpy_uint8)))
-        if shape[2] in (3, 4):
-            return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8)))
-    raise ValueError(
-        "Incorrect size of numpy.ndarray. Should be 2-dimensional or"
-        "3-dimensional with 3rd dimension of size 1, 3 or 4."
-    )
 
 
-def _get_pil_image_data(image: PILImage) -> bytes:
+def _get_pil_image_data(image: PILImage, options: ImageOptions = _DEFAULT_IMAGE_OPTIONS) -> bytes:
+    if options.max_size is not None and max(image.size) > options.max_size:
+        image = _resize_image(image, _get_thumbnail_size(image.size, options.max_size))
+
+    save_options = {}
+    if options.format == "png":
+        if options.compress_level is not None:
+            save_options["compress_level"] = options.compress_level
+    elif options.quality is not None:
+        save_options["quality"] = options.quality
+    if options.format == "jpeg" and image.mode not in ("RGB", "L"):
+        # JPEG has no alpha channel
+        image = image.convert("RGB")
+
     with io.BytesIO() as image_buffer:
-        image.save(image_buffer, format="PNG")
+        image.save(image_buffer, format=options.format.upper(), **save_options)
         return image_buffer.getvalue()
 
 
-def _get_figure_image_data(figure) -> bytes:
+def _resize_image(image: PILImage, size: Tuple[int, int]) -> PILImage:
+    try:
+        # reduces the image by an integer factor first, which is much faster for large downscaling ratios
+        return image.resize(size, reducing_gap=3.0)
+    except TypeError:
+        # `reducing_gap` is supported since Pillow 7.0
+        return image.resize(size)
+
+
+def _get_thumbnail_size(size: Tuple[int, int], max_size: int) -> Tuple[int, int]:
+    width, height = size
+    scale = max_size / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _get_figure_image_data(figure, options: ImageOptions = _DEFAULT_IMAGE_OPTIONS) -> bytes:
     with io.BytesIO() as image_buffer:
         figure.savefig(image_buffer, format="png", bbox_inches="tight")
-        return image_buffer.getvalue()
+        if options.is_default:
+            return image_buffer.getvalue()
+        image_buffer.seek(0)
+        with pilimage_open(image_buffer) as image:
+            return _get_pil_image_data(image, options)
 
 
 def _is_torch_tensor(image):
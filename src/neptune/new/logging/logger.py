@@ -23,9 +23,33 @@ from neptune.new.metadata_containers import MetadataContainer
 
 
 class Logger(object):
-    def __init__(self, container: MetadataContainer, attribute_name: str):
+    """Logs messages to a string series.
+
+    With `stream=True` the series is in the streaming mode: messages are buffered and sent in batches,
+    and raw text can be written with `write`. It's used by the stdout/stderr capture and `NeptuneHandler`.
+    """
+
+    def __init__(self, container: MetadataContainer, attribute_name: str, stream: bool = False):
         self._container = container
         self._attribute_name = attribute_name
+        self._stream = stream
+        self._streamed_series = None
 
     def log(self, msg: str):
-        self._container[self._attribute_name].log(msg)
+        if self._stream:
+            self._get_streamed_series().log(msg)
+        else:
+            self._container[self._attribute_name].log(msg)
+
+    def write(self, text: str):
+        """Writes raw text to the series in the streaming mode; every line of the text becomes a value"""
+        self._get_streamed_series().write(text)
+
+    def _get_streamed_series(self):
+        if self._streamed_series is None:
+            handler = self._container[self._attribute_name]
+            with self._container.lock():
+                # creates the series if needed, an already streamed series keeps its buffer
+                handler.configure(stream=True)
+                self._streamed_series = self._container.get_attribute(self._attribute_name)
+        return self._streamed_series
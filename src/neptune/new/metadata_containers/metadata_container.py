@@ -25,6 +25,7 @@ from contextlib import AbstractContextManager
 from functools import wraps
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -37,6 +38,11 @@ from neptune.new.attributes import create_attribute_from_type
 from neptune.new.attributes.attribute import Attribute
 from neptune.new.attributes.namespace import Namespace as NamespaceAttr
 from neptune.new.attributes.namespace import NamespaceBuilder
+from neptune.new.attributes.series.aggregation import SeriesAggregator
+from neptune.new.attributes.series.string_series_stream import (
+    StringSeriesStream,
+    StringSeriesStreamFlusher,
+)
 from neptune.new.exceptions import (
     InactiveModelException,
     InactiveModelVersionException,
@@ -60,8 +66,12 @@ from neptune.new.internal.operation import DeleteAttribute
 from neptune.new.internal.operation_processors.operation_processor import OperationProcessor
 from neptune.new.internal.state import ContainerState
 from neptune.new.internal.utils import verify_type
+from neptune.new.internal.utils.deferred_rendering import DeferredOperations
 from neptune.new.internal.utils.logger import logger
-from neptune.new.internal.utils.paths import parse_path
+from neptune.new.internal.utils.paths import (
+    parse_path,
+    path_to_str,
+)
 from neptune.new.internal.utils.runningmode import (
     in_interactive,
     in_notebook,
@@ -123,6 +133,12 @@ class MetadataContainer(AbstractContextManager):
         self._lock = lock
         self._state = ContainerState.CREATED
         self._sys_id = sys_id
+        self._series_aggregators: Dict[str, SeriesAggregator] = dict()
+        self._string_series_streams: Dict[str, StringSeriesStream] = dict()
+        self._string_series_flusher: Optional[StringSeriesStreamFlusher] = None
+        # attributes and namespaces by the path they were looked up with, invalidated on every structure change
+        self._attribute_cache: Dict[str, Union[Attribute, NamespaceAttr]] = dict()
+        self._deferred_operations = DeferredOperations(lock, lambda op: self._op_processor.enqueue_operation(op, False))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_tb is not None:
@@ -202,6 +218,16 @@ class MetadataContainer(AbstractContextManager):
         self._bg_job.join(seconds)
         logger.info("Done!")
 
+        if self._string_series_flusher is not None:
+            self._string_series_flusher.interrupt()
+            self._string_series_flusher.join()
+        self._deferred_operations.stop()
+
+        with self._lock:
+            self._deferred_operations.flush()
+            self._flush_series_aggregators(final=True)
+            self._flush_string_series_streams(final=True)
+
         sec_left = None if seconds is None else seconds - (time.time() - ts)
         self._op_processor.stop(sec_left)
 
@@ -251,11 +277,18 @@ class MetadataContainer(AbstractContextManager):
             return attr
 
     def get_attribute(self, path: str) -> Optional[Attribute]:
+        attr = self._attribute_cache.get(path)
+        if attr is not None:
+            return attr
         with self._lock:
-            return self._structure.get(parse_path(path))
+            attr = self._structure.get(parse_path(path))
+            if attr is not None:
+                self._attribute_cache[path] = attr
+            return attr
 
     def set_attribute(self, path: str, attribute: Attribute) -> Optional[Attribute]:
         with self._lock:
+            self._attribute_cache.clear()
             return self._structure.set(parse_path(path), attribute)
 
     def exists(self, path: str) -> bool:
@@ -267,8 +300,42 @@ class MetadataContainer(AbstractContextManager):
         verify_type("path", path, str)
         self._get_root_handler().pop(path, wait)
 
+    @ensure_not_stopped
+    def log_metrics(
+        self,
+        metrics: Dict[str, Any],
+        step: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        wait: bool = False,
+    ) -> None:
+        """Appends one value to each of many float series at once, such as all metrics of a training step.
+
+        Compared to `append` with a dictionary, the lock is taken once and all the values are sent
+        to the queue as a single operation.
+
+        Args:
+            metrics: Dictionary of values, possibly nested, keyed by field paths.
+            step: Optional index of the entries being appended, shared by all the series. Must be strictly increasing.
+            timestamp: Optional time index of the entries being appended, in Unix time format.
+                If None, the current time (obtained with `time.time()`) is used.
+            wait: If True, the client sends all tracked metadata to the server before executing the call.
+                For details, see https://docs.neptune.ai/api/universal/#wait
+
+        Example:
+            >>> import neptune.new as neptune
+            >>> run = neptune.init_run()
+            >>> for step, batch in enumerate(loader):
+            ...     ... # Your training loop
+            ...     run.log_metrics({"train/loss": loss, "train/lr": lr}, step=step)
+        """
+        self._get_root_handler().log_metrics(metrics, step=step, timestamp=timestamp, wait=wait)
+
     def _pop_impl(self, parsed_path: List[str], wait: bool):
+        self._attribute_cache.clear()
         self._structure.pop(parsed_path)
+        self._discard_series_aggregators(parsed_path)
+        self._discard_string_series_streams(parsed_path)
+        self._deferred_operations.discard(parsed_path)
         self._op_processor.enqueue_operation(DeleteAttribute(parsed_path), wait)
 
     def lock(self) -> threading.RLock:
@@ -276,6 +343,9 @@ class MetadataContainer(AbstractContextManager):
 
     def wait(self, disk_only=False) -> None:
         with self._lock:
+            self._deferred_operations.flush()
+            self._flush_series_aggregators()
+            self._flush_string_series_streams()
             if disk_only:
                 self._op_processor.flush()
             else:
@@ -283,15 +353,69 @@ class MetadataContainer(AbstractContextManager):
 
     def sync(self, wait: bool = True) -> None:
         with self._lock:
+            self._deferred_operations.flush()
+            self._flush_series_aggregators()
+            self._flush_string_series_streams()
             if wait:
                 self._op_processor.wait()
             attributes = self._backend.get_attributes(self._id, self.container_type)
+            self._attribute_cache.clear()
             self._structure.clear()
             for attribute in attributes:
                 self._define_attribute(parse_path(attribute.path), attribute.type)
 
+    def _get_series_aggregator(self, path: List[str]) -> Optional[SeriesAggregator]:
+        return self._series_aggregators.get(path_to_str(path))
+
+    def _set_series_aggregator(self, path: List[str], aggregator: Optional[SeriesAggregator]) -> None:
+        previous = self._series_aggregators.pop(path_to_str(path), None)
+        if previous is not None:
+            for op in previous.close():
+                self._op_processor.enqueue_operation(op, False)
+        if aggregator is not None:
+            self._series_aggregators[path_to_str(path)] = aggregator
+
+    def _flush_series_aggregators(self, final: bool = False) -> None:
+        for aggregator in self._series_aggregators.values():
+            for op in aggregator.close() if final else aggregator.flush():
+                self._op_processor.enqueue_operation(op, False)
+
+    def _discard_series_aggregators(self, path: List[str]) -> None:
+        prefix = path_to_str(path)
+        for aggregated_path in list(self._series_aggregators):
+            if aggregated_path == prefix or aggregated_path.startswith(prefix + "/"):
+                self._series_aggregators.pop(aggregated_path).discard()
+
+    def _get_string_series_stream(self, path: List[str]) -> Optional[StringSeriesStream]:
+        return self._string_series_streams.get(path_to_str(path))
+
+    def _set_string_series_stream(self, path: List[str], stream: Optional[StringSeriesStream]) -> None:
+        previous = self._string_series_streams.pop(path_to_str(path), None)
+        if previous is not None:
+            for op in previous.flush(final=True):
+                self._op_processor.enqueue_operation(op, False)
+        if stream is not None:
+            self._string_series_streams[path_to_str(path)] = stream
+            if self._string_series_flusher is None:
+                self._string_series_flusher = StringSeriesStreamFlusher(self)
+                self._string_series_flusher.start()
+
+    def _flush_string_series_streams(self, due_only: bool = False, final: bool = False) -> None:
+        for stream in self._string_series_streams.values():
+            if due_only and not stream.is_due():
+                continue
+            for op in stream.flush(final=final):
+                self._op_processor.enqueue_operation(op, False)
+
+    def _discard_string_series_streams(self, path: List[str]) -> None:
+        prefix = path_to_str(path)
+        for streamed_path in list(self._string_series_streams):
+            if streamed_path == prefix or streamed_path.startswith(prefix + "/"):
+                self._string_series_streams.pop(streamed_path).reset()
+
     def _define_attribute(self, _path: List[str], _type: AttributeType):
         attr = create_attribute_from_type(_type, self, _path)
+        self._attribute_cache.clear()
         self._structure.set(_path, attr)
 
     def _get_root_handler(self):
@@ -322,21 +446,30 @@ class MetadataContainer(AbstractContextManager):
     def _shutdown_hook(self):
         self.stop()
 
-    def _fetch_entries(self, child_type: ContainerType, query: NQLQuery, columns: Optional[Iterable[str]]) -> Table:
+    def _fetch_entries(
+        self,
+        child_type: ContainerType,
+        query: NQLQuery,
+        columns: Optional[Iterable[str]],
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Table:
         if columns is not None:
             # always return entries with `sys/id` column when filter applied
             columns = set(columns)
             columns.add("sys/id")
 
-        leaderboard_entries = self._backend.search_leaderboard_entries(
+        pages = self._backend.iter_leaderboard_entries(
             project_id=self._project_id,
             types=[child_type],
             query=query,
             columns=columns,
+            progress_callback=progress_callback,
         )
 
+        # the first page is fetched right away, so that errors of the query are raised here
         return Table(
             backend=self._backend,
             container_type=child_type,
-            entries=leaderboard_entries,
+            entries=list(next(pages, [])),
+            pages=pages,
         )
@@ -13,19 +13,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["TableEntry", "LeaderboardHandler", "Table"]
+__all__ = ["TableEntry", "LeaderboardHandler", "Table", "FileDownloadResult"]
 
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Iterator,
     List,
     Optional,
+    Set,
+    Tuple,
     Union,
 )
 
-from neptune.new.exceptions import MetadataInconsistency
+import numpy
+
+from neptune.new.envs import NEPTUNE_DOWNLOAD_WORKERS
+from neptune.new.exceptions import (
+    MetadataInconsistency,
+    NeptuneMissingRequirementException,
+)
 from neptune.new.internal.backends.api_model import (
     AttributeType,
     AttributeWithProperties,
@@ -33,11 +50,15 @@ from neptune.new.internal.backends.api_model import (
 )
 from neptune.new.internal.backends.neptune_backend import NeptuneBackend
 from neptune.new.internal.container_type import ContainerType
+from neptune.new.internal.utils import verify_type
 from neptune.new.internal.utils.paths import (
     join_paths,
     parse_path,
 )
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,82 +74,87 @@ class TableEntry:
         self._container_type = container_type
         self._id = _id
         self._attributes = attributes
+        self._attributes_by_path: Optional[Dict[str, AttributeWithProperties]] = None
 
     def __getitem__(self, path: str) -> "LeaderboardHandler":
         return LeaderboardHandler(table_entry=self, path=path)
 
+    def _get_attribute(self, path: str) -> AttributeWithProperties:
+        if self._attributes_by_path is None:
+            # the first attribute of a path wins, as with a linear scan
+            self._attributes_by_path = {attr.path: attr for attr in reversed(self._attributes)}
+        try:
+            return self._attributes_by_path[path]
+        except KeyError:
+            raise ValueError("Could not find {} attribute".format(path)) from None
+
+    def _get_sys_id(self) -> str:
+        try:
+            return self.get_attribute_value("sys/id")
+        except ValueError:
+            return self._id
+
     def get_attribute_type(self, path: str) -> AttributeType:
-        for attr in self._attributes:
-            if attr.path == path:
-                return attr.type
-        raise ValueError("Could not find {} attribute".format(path))
+        return self._get_attribute(path).type
 
     def get_attribute_value(self, path: str) -> Any:
-        for attr in self._attributes:
-            if attr.path == path:
-                _type = attr.type
-                if _type == AttributeType.RUN_STATE:
-                    return attr.properties.value
-                if _type in (
-                    AttributeType.FLOAT,
-                    AttributeType.INT,
-                    AttributeType.BOOL,
-                    AttributeType.STRING,
-                    AttributeType.DATETIME,
-                ):
-                    return attr.properties.value
-                if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
-                    return attr.properties.last
-                if _type == AttributeType.IMAGE_SERIES:
-                    raise MetadataInconsistency("Cannot get value for image series.")
-                if _type == AttributeType.FILE:
-                    raise MetadataInconsistency("Cannot get value for file attribute. Use download() instead.")
-                if _type == AttributeType.FILE_SET:
-                    raise MetadataInconsistency("Cannot get value for file set attribute. Use download() instead.")
-                if _type == AttributeType.STRING_SET:
-                    return set(attr.properties.values)
-                if _type == AttributeType.GIT_REF:
-                    return attr.properties.commit.commitId
-                if _type == AttributeType.NOTEBOOK_REF:
-                    return attr.properties.notebookName
-                if _type == AttributeType.ARTIFACT:
-                    return attr.properties.hash
-                logger.error(
-                    "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
-                    _type,
-                )
-                return None
-        raise ValueError("Could not find {} attribute".format(path))
+        attr = self._get_attribute(path)
+        _type = attr.type
+        if _type == AttributeType.RUN_STATE:
+            return attr.properties.value
+        if _type in (
+            AttributeType.FLOAT,
+            AttributeType.INT,
+            AttributeType.BOOL,
+            AttributeType.STRING,
+            AttributeType.DATETIME,
+        ):
+            return attr.properties.value
+        if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
+            return attr.properties.last
+        if _type == AttributeType.IMAGE_SERIES:
+            raise MetadataInconsistency("Cannot get value for image series.")
+        if _type == AttributeType.FILE:
+            raise MetadataInconsistency("Cannot get value for file attribute. Use download() instead.")
+        if _type == AttributeType.FILE_SET:
+            raise MetadataInconsistency("Cannot get value for file set attribute. Use download() instead.")
+        if _type == AttributeType.STRING_SET:
+            return set(attr.properties.values)
+        if _type == AttributeType.GIT_REF:
+            return attr.properties.commit.commitId
+        if _type == AttributeType.NOTEBOOK_REF:
+            return attr.properties.notebookName
+        if _type == AttributeType.ARTIFACT:
+            return attr.properties.hash
+        logger.error(
+            "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
+            _type,
+        )
+        return None
 
     def download_file_attribute(self, path: str, destination: Optional[str]):
-        for attr in self._attributes:
-            if attr.path == path:
-                _type = attr.type
-                if _type == AttributeType.FILE:
-                    self._backend.download_file(
-                        container_id=self._id,
-                        container_type=self._container_type,
-                        path=parse_path(path),
-                        destination=destination,
-                    )
-                    return
-                raise MetadataInconsistency("Cannot download file from attribute of type {}".format(_type))
-        raise ValueError("Could not find {} attribute".format(path))
+        _type = self._get_attribute(path).type
+        if _type == AttributeType.FILE:
+            self._backend.download_file(
+                container_id=self._id,
+                container_type=self._container_type,
+                path=parse_path(path),
+                destination=destination,
+            )
+            return
+        raise MetadataInconsistency("Cannot download file from attribute of type {}".format(_type))
 
     def download_file_set_attribute(self, path: str, destination: Optional[str]):
-        for attr in self._attributes:
-            if attr.path == path:
-                _type = attr.type
-                if _type == AttributeType.FILE_SET:
-                    self._backend.download_file_set(
-                        container_id=self._id,
-                        container_type=self._container_type,
-                        path=parse_path(path),
-                        destination=destination,
-                    )
-                    return
-                raise MetadataInconsistency("Cannot download ZIP archive from attribute of type {}".format(_type))
-        raise ValueError("Could not find {} attribute".format(path))
+        _type = self._get_attribute(path).type
+        if _type == AttributeType.FILE_SET:
+            self._backend.download_file_set(
+                container_id=self._id,
+                container_type=self._container_type,
+                path=parse_path(path),
+                destination=destination,
+            )
+            return
+        raise MetadataInconsistency("Cannot download ZIP archive from attribute of type {}".format(_type))
 
 
 class LeaderboardHandler:
@@ -151,75 +177,166 @@ class LeaderboardHandler:
         raise MetadataInconsistency("Cannot download file from attribute of type {}".format(attr_type))
 
 
+@dataclass
+class FileDownloadResult:
+    """Outcome of downloading a file attribute of a single table entry"""
+
+    sys_id: str
+    destination: str
+    skipped: bool = False
+    error: Optional[Exception] = None
+
+
 class Table:
+    """Entries of a table fetched from Neptune servers.
+
+    If `pages` are given, `entries` hold the entries fetched so far and the following ones are fetched from
+    `pages` on demand: `iter_rows()` and `iter_batches()` emit entries as they arrive, while `to_rows()`,
+    `to_pandas()` and `to_arrow()` fetch all of them first.
+    """
+
     def __init__(
         self,
         backend: NeptuneBackend,
         container_type: ContainerType,
         entries: List[LeaderboardEntry],
+        pages: Optional[Iterator[List[LeaderboardEntry]]] = None,
     ):
         self._backend = backend
         self._entries = entries
         self._container_type = container_type
+        self._pages = pages
 
     def to_rows(self) -> List[TableEntry]:
-        return [
-            TableEntry(
-                backend=self._backend,
-                container_type=self._container_type,
-                _id=e.id,
-                attributes=e.attributes,
-            )
-            for e in self._entries
-        ]
+        return list(self.iter_rows())
+
+    def iter_rows(self) -> Iterator[TableEntry]:
+        """Yields the entries of the table, fetching them as they are needed"""
+        for page in self._iter_pages():
+            for e in page:
+                yield TableEntry(
+                    backend=self._backend,
+                    container_type=self._container_type,
+                    _id=e.id,
+                    attributes=e.attributes,
+                )
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator["Table"]:
+        """Yields tables of up to `batch_size` consecutive entries, fetching the entries as they are needed.
+
+        Each batch can be converted with `to_rows()`, `to_pandas()` or `to_arrow()` on its own, e.g. to write
+        a large table to files without keeping all of it in memory as a data frame.
+        """
+        verify_type("batch_size", batch_size, int)
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive number of entries")
+        batch: List[LeaderboardEntry] = []
+        for page in self._iter_pages():
+            batch.extend(page)
+            while len(batch) >= batch_size:
+                yield self._with_entries(batch[:batch_size])
+                batch = batch[batch_size:]
+        if batch:
+            yield self._with_entries(batch)
+
+    def _with_entries(self, entries: List[LeaderboardEntry]) -> "Table":
+        return Table(backend=self._backend, container_type=self._container_type, entries=entries)
+
+    def _iter_pages(self) -> Iterator[List[LeaderboardEntry]]:
+        index = 0
+        while True:
+            if index < len(self._entries):
+                page = self._entries[index:]
+                index += len(page)
+                yield page
+                continue
+            if self._pages is None:
+                return
+            page = next(self._pages, None)
+            if page is None:
+                self._pages = None
+                return
+            self._entries.extend(page)
+
+    def _fetch_all_entries(self) -> List[LeaderboardEntry]:
+        if self._pages is not None:
+            for page in self._pages:
+                self._entries.extend(page)
+            self._pages = None
+        return self._entries
+
+    def download_files(
+        self, path: str, destination: Optional[str] = None, workers: Optional[int] = None
+    ) -> List[FileDownloadResult]:
+        """Downloads the file or file set attribute at `path` of all the entries concurrently.
+
+        The files of an entry are stored in the `<destination>/<sys/id>/<path>` directory; entries without
+        the attribute or whose directory already holds a file are skipped. The downloads run in a pool of `workers`
+        threads, configured with the `NEPTUNE_DOWNLOAD_WORKERS` environment variable by default. A failed download
+        doesn't stop the others: its error is recorded in the result of the entry.
+        """
+        verify_type("path", path, str)
+        verify_type("destination", destination, (str, type(None)))
+        verify_type("workers", workers, (int, type(None)))
+        destination = destination or os.getcwd()
+        workers = workers or int(os.getenv(NEPTUNE_DOWNLOAD_WORKERS, "8"))
+
+        rows = self.to_rows()
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            results = list(executor.map(lambda row: _download_entry_file(row, path, destination), rows))
+
+        failed = [result for result in results if result.error is not None]
+        if failed:
+            logger.warning("Failed to download %s of %d entries: %s", path, len(failed), failed[0].error)
+        return results
 
     def to_pandas(self):
+        """Returns the table as a data frame with a row per entry and a column per attribute path.
+
+        Columns are built directly from the attribute values, with a dtype following the attribute type:
+        float, int, bool and datetime columns are typed (int columns with missing values are floats and bool
+        columns with missing values are objects); other attributes are kept as objects.
+        """
         import pandas as pd
 
-        def make_attribute_value(
-            attribute: AttributeWithProperties,
-        ) -> Optional[Union[str, float, datetime]]:
-            _type = attribute.type
-            _properties = attribute.properties
-            if _type == AttributeType.RUN_STATE:
-                return _properties.value
-            if _type in (
-                AttributeType.FLOAT,
-                AttributeType.INT,
-                AttributeType.BOOL,
-                AttributeType.STRING,
-                AttributeType.DATETIME,
-            ):
-                return _properties.value
-            if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
-                return _properties.last
-            if _type == AttributeType.IMAGE_SERIES:
-                return None
-            if _type == AttributeType.FILE or _type == AttributeType.FILE_SET:
-                return None
-            if _type == AttributeType.STRING_SET:
-                return ",".join(_properties.values)
-            if _type == AttributeType.GIT_REF:
-                return _properties.commit.commitId
-            if _type == AttributeType.NOTEBOOK_REF:
-                return _properties.notebookName
-            if _type == AttributeType.ARTIFACT:
-                return _properties.hash
-            logger.error(
-                "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
-                _type,
-            )
-            return None
+        size, columns = self._build_columns()
+        return pd.DataFrame(
+            {path: column.to_array(size) for path, column in columns.items()},
+            index=pd.RangeIndex(size),
+        )
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Returns the table as a `pyarrow.Table` with a row per entry and a column per attribute path.
+
+        Missing values are nulls, so int and bool columns keep their types. Requires `pyarrow` to be installed.
+        """
+        try:
+            import pyarrow
+        except ModuleNotFoundError:
+            raise NeptuneMissingRequirementException("pyarrow", "Table.to_arrow()") from None
+
+        size, columns = self._build_columns()
+        return pyarrow.table({path: column.to_arrow_array(size) for path, column in columns.items()})
 
-        def make_row(
-            entry: LeaderboardEntry,
-        ) -> Dict[str, Optional[Union[str, float, datetime]]]:
-            row: Dict[str, Union[str, float, datetime]] = dict()
+    def _build_columns(self) -> Tuple[int, Dict[str, "_Column"]]:
+        entries = self._fetch_all_entries()
+        columns: Dict[str, _Column] = dict()
+        for row, entry in enumerate(entries):
             for attr in entry.attributes:
-                value = make_attribute_value(attr)
-                if value is not None:
-                    row[attr.path] = value
-            return row
+                column = columns.get(attr.path)
+                if column is None:
+                    column = columns[attr.path] = _Column(attr.type)
+                elif attr.type is not column.type:
+                    column.set_type(attr.type)
+                value = column.get_value(attr.properties)
+                if value is None:
+                    continue
+                if column.rows and column.rows[-1] == row:
+                    # the last attribute of a path wins within an entry
+                    column.values[-1] = value
+                else:
+                    column.rows.append(row)
+                    column.values.append(value)
 
         def sort_key(attr):
             domain = attr.split("/")[0]
@@ -229,8 +346,148 @@ class Table:
                 return 2, attr
             return 1, attr
 
-        rows = dict((n, make_row(entry)) for (n, entry) in enumerate(self._entries))
+        return len(entries), {path: columns[path] for path in sorted(columns, key=sort_key) if columns[path].rows}
+
+
+_FLOAT_TYPES = {AttributeType.FLOAT, AttributeType.INT, AttributeType.FLOAT_SERIES}
+
+
+class _Column:
+    """Values of a single attribute path across the entries of a table"""
+
+    __slots__ = ("type", "types", "get_value", "rows", "values")
+
+    def __init__(self, _type: AttributeType):
+        self.type = _type
+        self.types: Set[AttributeType] = {_type}
+        self.get_value = _get_value_getter(_type)
+        self.rows: List[int] = []
+        self.values: List[Any] = []
+
+    def set_type(self, _type: AttributeType) -> None:
+        self.type = _type
+        self.types.add(_type)
+        self.get_value = _get_value_getter(_type)
+
+    def to_array(self, size: int):
+        complete = len(self.rows) == size
+        if self.types == {AttributeType.INT} and complete:
+            return numpy.array(self.values, dtype=numpy.int64)
+        if self.types == {AttributeType.BOOL} and complete:
+            return numpy.array(self.values, dtype=bool)
+        if self.types <= _FLOAT_TYPES:
+            array = numpy.full(size, numpy.nan)
+            array[self.rows] = self.values
+            return array
+
+        array = numpy.full(size, numpy.nan, dtype=object)
+        array[self.rows] = self.values
+        if self.types == {AttributeType.DATETIME}:
+            import pandas as pd
+
+            return pd.Series(array.tolist())
+        return array
+
+    def to_arrow_array(self, size: int):
+        import pyarrow
+
+        missing = numpy.ones(size, dtype=bool)
+        missing[self.rows] = False
+        for types, dtype in (
+            ({AttributeType.INT}, numpy.int64),
+            ({AttributeType.BOOL}, bool),
+            (_FLOAT_TYPES, numpy.float64),
+        ):
+            if self.types <= types:
+                values = numpy.zeros(size, dtype=dtype)
+                values[self.rows] = self.values
+                return pyarrow.array(values, mask=missing)
+        try:
+            return pyarrow.array(self.to_array(size), from_pandas=True)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # values of different types under the same path are kept as strings
+            values = numpy.full(size, None, dtype=object)
+            values[self.rows] = [str(value) for value in self.values]
+            return pyarrow.array(values, type=pyarrow.string())
+
+
+def _none(_properties) -> None:
+    return None
+
+
+def _get_value_getter(_type: AttributeType) -> Callable[[Any], Optional[Union[str, float, datetime]]]:
+    """Returns the function making the data frame value of an attribute of a type from its properties"""
+    if _type == AttributeType.RUN_STATE:
+        return attrgetter("value")
+    if _type in (
+        AttributeType.FLOAT,
+        AttributeType.INT,
+        AttributeType.BOOL,
+        AttributeType.STRING,
+        AttributeType.DATETIME,
+    ):
+        return attrgetter("value")
+    if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
+        return attrgetter("last")
+    if _type == AttributeType.IMAGE_SERIES:
+        return _none
+    if _type == AttributeType.FILE or _type == AttributeType.FILE_SET:
+        return _none
+    if _type == AttributeType.STRING_SET:
+        return lambda properties: ",".join(properties.values)
+    if _type == AttributeType.GIT_REF:
+        return attrgetter("commit.commitId")
+    if _type == AttributeType.NOTEBOOK_REF:
+        return attrgetter("notebookName")
+    if _type == AttributeType.ARTIFACT:
+        return attrgetter("hash")
+
+    def unsupported(_properties) -> None:
+        logger.error(
+            "Attribute type %s not supported in this version, yielding None. Recommended client upgrade.",
+            _type,
+        )
+
+    return unsupported
+
+
+def _download_entry_file(entry: TableEntry, path: str, destination: str) -> FileDownloadResult:
+    sys_id = entry._get_sys_id()
+    target_dir = os.path.join(destination, sys_id, *parse_path(path))
+    result = FileDownloadResult(sys_id=sys_id, destination=target_dir)
+    try:
+        try:
+            attribute_type = entry.get_attribute_type(path)
+        except ValueError:
+            # entries that don't have the attribute have nothing to download
+            result.skipped = True
+            return result
+        if attribute_type not in (AttributeType.FILE, AttributeType.FILE_SET):
+            raise MetadataInconsistency("Cannot download files of attribute of type {}".format(attribute_type))
+
+        if _holds_file(target_dir):
+            result.skipped = True
+            return result
+
+        # files appear in the target directory only once they're complete
+        os.makedirs(target_dir, exist_ok=True)
+        download_dir = tempfile.mkdtemp(prefix=".download-", dir=target_dir)
+        try:
+            if attribute_type == AttributeType.FILE_SET:
+                entry.download_file_set_attribute(path, download_dir)
+            else:
+                entry.download_file_attribute(path, download_dir)
+            for name in os.listdir(download_dir):
+                os.replace(os.path.join(download_dir, name), os.path.join(target_dir, name))
+        finally:
+            shutil.rmtree(download_dir, ignore_errors=True)
+    except Exception as e:
+        result.error = e
+    return result
+
 
-        df = pd.DataFrame.from_dict(data=rows, orient="index")
-        df = df.reindex(sorted(df.columns, key=sort_key), axis="columns")
-        return df
+def _holds_file(dir_path: str) -> bool:
+    try:
+        return any(entry.is_file() and not entry.name.startswith(".") for entry in os.scandir(dir_path))
+    except FileNotFoundError:
+        return False
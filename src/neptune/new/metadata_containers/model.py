@@ -16,6 +16,7 @@
 __all__ = ["Model"]
 
 from typing import (
+    Callable,
     Iterable,
     Optional,
 )
@@ -64,7 +65,11 @@ class Model(MetadataContainer):
     def _metadata_url(self) -> str:
         return self._url.rstrip("/") + "/metadata"
 
-    def fetch_model_versions_table(self, columns: Optional[Iterable[str]] = None) -> Table:
+    def fetch_model_versions_table(
+        self,
+        columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Table:
         """Retrieve all versions of the given model.
 
         Args:
@@ -74,6 +79,9 @@ class Model(MetadataContainer):
                     Fields: `["params/lr", "params/batch", "val/acc"]` - these fields are included as columns.
                     Namespaces: `["params", "val"]` - all the fields inside the namespaces are included as columns.
                 If `None` (default), all the columns of the model versions table are included.
+            progress_callback: Function called with the number of fetched entries and the total number of matching
+                entries (`None` if unknown) as the entries are fetched. Useful for tables with many entries.
+                Defaults to `None`.
 
         Returns:
             `Table` object containing `ModelVersion` objects that match the specified criteria.
@@ -127,4 +135,5 @@ class Model(MetadataContainer):
                 aggregator=NQLAggregator.AND,
             ),
             columns=columns,
+            progress_callback=progress_callback,
         )
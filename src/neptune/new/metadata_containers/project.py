@@ -17,13 +17,19 @@ __all__ = ["Project"]
 
 import threading
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
+    List,
     Optional,
+    Tuple,
     Union,
 )
 
+from neptune.new.attributes.series.fetchable_series import FetchableSeries
+from neptune.new.internal.backends.api_model import AttributeType
 from neptune.new.internal.backends.neptune_backend import NeptuneBackend
 from neptune.new.internal.backends.nql import (
     NQLAggregator,
@@ -31,6 +37,7 @@ from neptune.new.internal.backends.nql import (
     NQLAttributeType,
     NQLQueryAggregate,
     NQLQueryAttribute,
+    build_filter_queries,
 )
 from neptune.new.internal.background_job import BackgroundJob
 from neptune.new.internal.container_type import ContainerType
@@ -39,11 +46,27 @@ from neptune.new.internal.id_formats import (
     UniqueId,
 )
 from neptune.new.internal.operation_processors.operation_processor import OperationProcessor
-from neptune.new.internal.utils import as_list
+from neptune.new.internal.utils import (
+    as_list,
+    verify_type,
+)
 from neptune.new.metadata_containers import MetadataContainer
-from neptune.new.metadata_containers.metadata_containers_table import Table
+from neptune.new.metadata_containers.metadata_containers_table import (
+    FileDownloadResult,
+    Table,
+)
+from neptune.new.metadata_containers.series_fetcher import (
+    SERIES_FORMATS,
+    SeriesFetcher,
+    SeriesRequest,
+)
+from neptune.new.metadata_containers.table_snapshot import TableSnapshot
 from neptune.new.types.mode import Mode
 
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
 
 class Project(MetadataContainer):
     """A class for managing a Neptune project and retrieving information from it.
@@ -103,7 +126,7 @@ class Project(MetadataContainer):
         return self._url.rstrip("/") + "/metadata"
 
     @staticmethod
-    def _prepare_nql_query(ids, states, owners, tags):
+    def _prepare_nql_query(ids, states, owners, tags, filters=None):
         query_items = [
             NQLQueryAttribute(
                 name="sys/trashed",
@@ -177,6 +200,9 @@ class Project(MetadataContainer):
                 )
             )
 
+        if filters:
+            query_items.extend(build_filter_queries(filters))
+
         query = NQLQueryAggregate(items=query_items, aggregator=NQLAggregator.AND)
         return query
 
@@ -187,6 +213,8 @@ class Project(MetadataContainer):
         owner: Optional[Union[str, Iterable[str]]] = None,
         tag: Optional[Union[str, Iterable[str]]] = None,
         columns: Optional[Iterable[str]] = None,
+        filters: Optional[Iterable[Tuple[Any, ...]]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> Table:
         """Retrieve runs matching the specified criteria.
 
@@ -218,6 +246,19 @@ class Project(MetadataContainer):
                     Fields: `["params/lr", "params/batch", "train/acc"]` - these fields are included as columns.
                     Namespaces: `["params", "train"]` - all the fields inside the namespaces are included as columns.
                 If `None` (default), all the columns of the runs table are included.
+            filters: Conditions on attributes, as `(path, operator, value)` or `(path, operator, value, type)` tuples,
+                which runs must all satisfy.
+                Runs are filtered by Neptune servers, so only the matching ones are transferred.
+                Operators "=", "!=", ">", ">=", "<" and "<=" compare with `value`. The attribute type is named by
+                `type`, e.g. "integer", or inferred from the Python type of `value`: bool, float (for int and float),
+                datetime (naive ones are in local time) or str.
+                "between" matches values in the inclusive range given as a `(lower, upper)` pair.
+                "exists" matches runs having the attribute of the type named by `value`, e.g. "float".
+                Example: `[("val/acc", ">", 0.9), ("sys/creation_time", ">=", week_ago)]`.
+                Defaults to `None`.
+            progress_callback: Function called with the number of fetched entries and the total number of matching
+                entries (`None` if unknown) as the entries are fetched. Useful for tables with many entries.
+                Defaults to `None`.
 
         Returns:
             `Table` object containing `Run` objects matching the specified criteria.
@@ -257,6 +298,20 @@ class Project(MetadataContainer):
             >>> # You can combine conditions. Runs satisfying all conditions will be fetched
             ... runs_table_df = project.fetch_runs_table(state="idle", tag="Exploration").to_pandas()
 
+            >>> # Fetch only runs with validation accuracy above 0.9, created in the last week
+            ... from datetime import datetime, timedelta
+            ... week_ago = datetime.now() - timedelta(days=7)
+            ... runs_table_df = project.fetch_runs_table(
+            ...     filters=[("val/acc", ">", 0.9), ("sys/creation_time", ">=", week_ago)]
+            ... ).to_pandas()
+
+            Large tables can be processed while they're being fetched:
+
+            >>> # Write the runs table to Parquet files of 10000 runs each (requires pyarrow)
+            ... import pyarrow.parquet as pq
+            ... for i, batch in enumerate(project.fetch_runs_table().iter_batches(10000)):
+            ...     pq.write_table(batch.to_arrow(), f"runs-{i}.parquet")
+
         You may also want to check the API reference in the docs:
             https://docs.neptune.ai/api/project#fetch_runs_table
         """
@@ -265,16 +320,187 @@ class Project(MetadataContainer):
         owners = as_list("owner", owner)
         tags = as_list("tag", tag)
 
-        nql_query = self._prepare_nql_query(ids, states, owners, tags)
+        nql_query = self._prepare_nql_query(ids, states, owners, tags, filters)
 
         return MetadataContainer._fetch_entries(
             self,
             child_type=ContainerType.RUN,
             query=nql_query,
             columns=columns,
+            progress_callback=progress_callback,
         )
 
-    def fetch_models_table(self, columns: Optional[Iterable[str]] = None) -> Table:
+    def sync_runs_table(
+        self,
+        snapshot_path: str,
+        id: Optional[Union[str, Iterable[str]]] = None,
+        state: Optional[Union[str, Iterable[str]]] = None,
+        owner: Optional[Union[str, Iterable[str]]] = None,
+        tag: Optional[Union[str, Iterable[str]]] = None,
+        columns: Optional[Iterable[str]] = None,
+        filters: Optional[Iterable[Tuple[Any, ...]]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Table:
+        """Retrieve runs matching the specified criteria, keeping a local snapshot of the runs table up to date.
+
+        The snapshot is an SQLite database at `snapshot_path`. The first call fetches all the matching runs;
+        the following calls with the same criteria and columns fetch only the runs modified since the previous
+        call and merge them into the snapshot. Runs which don't match the criteria anymore, e.g. trashed runs,
+        are removed from it. Runs deleted permanently are not detected; delete the snapshot file to fetch
+        the whole table again.
+
+        Args:
+            snapshot_path: Path of the snapshot file. It's created if it doesn't exist.
+            id, state, owner, tag, columns, filters, progress_callback: The same as in `fetch_runs_table()`.
+
+        Returns:
+            `Table` object containing `Run` objects matching the specified criteria.
+
+        Examples:
+            >>> import neptune.new as neptune
+
+            >>> # Fetch project "jackie/sandbox"
+            ... project = neptune.init_project(mode="read-only", name="jackie/sandbox")
+
+            >>> # Fetch the parameters and the accuracy of all runs; later calls fetch only the modified runs
+            ... runs_table_df = project.sync_runs_table("runs.sqlite", columns=["params", "val/acc"]).to_pandas()
+        """
+        ids = as_list("id", id)
+        states = as_list("state", state)
+        owners = as_list("owner", owner)
+        tags = as_list("tag", tag)
+        verify_type("snapshot_path", snapshot_path, str)
+
+        nql_query = self._prepare_nql_query(ids, states, owners, tags, filters)
+        entries = TableSnapshot(snapshot_path).sync(
+            self._backend,
+            project_id=self._project_id,
+            container_type=ContainerType.RUN,
+            query=nql_query,
+            columns=columns,
+            progress_callback=progress_callback,
+        )
+        return Table(backend=self._backend, container_type=ContainerType.RUN, entries=entries)
+
+    def download_files(
+        self,
+        path: str,
+        destination: Optional[str] = None,
+        id: Optional[Union[str, Iterable[str]]] = None,
+        state: Optional[Union[str, Iterable[str]]] = None,
+        owner: Optional[Union[str, Iterable[str]]] = None,
+        tag: Optional[Union[str, Iterable[str]]] = None,
+        filters: Optional[Iterable[Tuple[Any, ...]]] = None,
+        workers: Optional[int] = None,
+    ) -> List[FileDownloadResult]:
+        """Downloads a file or file set attribute of all the runs matching the specified criteria concurrently.
+
+        Args:
+            path: Path of the file or file set attribute. Example: `"predictions"`.
+            destination: Directory in which the files are stored, in a `<run ID>/<path>` subdirectory per run.
+                Runs without the attribute or whose subdirectory already holds a file are skipped.
+                Defaults to `None`, which means the current working directory.
+            id, state, owner, tag, filters: The same as in `fetch_runs_table()`.
+            workers: Number of concurrent downloads. Defaults to `None`, which means 8
+                or the value of the `NEPTUNE_DOWNLOAD_WORKERS` environment variable.
+
+        Returns:
+            `FileDownloadResult` per run, in the order of the runs table, with the directory of the run's files
+            and the error if the download failed.
+
+        Examples:
+            >>> import neptune.new as neptune
+            >>> project = neptune.init_project(mode="read-only", name="jackie/sandbox")
+            >>> results = project.download_files("predictions", "predictions", state="idle")
+            >>> failed = [result.sys_id for result in results if result.error is not None]
+        """
+        verify_type("path", path, str)
+        table = self.fetch_runs_table(id=id, state=state, owner=owner, tag=tag, columns=[path], filters=filters)
+        return table.download_files(path, destination=destination, workers=workers)
+
+    def fetch_series(
+        self,
+        ids: Union[str, Iterable[str]],
+        paths: Union[str, Iterable[str]],
+        include_timestamp: bool = True,
+        page_size: Optional[int] = None,
+        format: str = "long",
+    ) -> Union["pandas.DataFrame", Dict[Tuple[str, str], Dict[str, "numpy.ndarray"]]]:
+        """Fetches the values of float or string series of many runs at once.
+
+        Unlike opening each run with `init_run(with_id=..., mode="read-only")` and calling `fetch_values()`,
+        the runs are looked up with a single query and the pages of all the series are fetched concurrently.
+
+        Args:
+            ids: Neptune ID of a run, or list of several IDs.
+                Example: `"SAN-1"` or `["SAN-1", "SAN-2"]`.
+            paths: Path of a series, or list of several paths.
+                Example: `"train/loss"` or `["train/loss", "eval/loss"]`.
+                Runs without a series under a given path are skipped for that path.
+            include_timestamp: Whether the fetched data should include the timestamps of the values.
+                Defaults to `True`.
+            page_size: Number of values fetched in a single request. Defaults to `None`, which means 1000
+                or the value of the `NEPTUNE_FETCH_SERIES_PAGE_SIZE` environment variable.
+            format: Layout of the result:
+                * "long" (default): `pandas.DataFrame` with "sys/id", "path", "step", "value"
+                  and "timestamp" columns, and a row per value.
+                * "wide": `pandas.DataFrame` indexed by step, with a column of values per run
+                  (per run and path, if several paths are fetched).
+                * "dict": dictionary of NumPy arrays keyed by "step", "value" and "timestamp",
+                  per (run ID, path) pair.
+
+        Returns:
+            Values of the series in the chosen format.
+
+        Examples:
+            >>> import neptune.new as neptune
+            >>> project = neptune.init_project(mode="read-only", name="jackie/sandbox")
+            >>> losses = project.fetch_series(["SAN-1", "SAN-2", "SAN-3"], "train/loss", format="wide")
+        """
+        # each series is fetched once, and becomes a single column of a wide data frame
+        ids = list(dict.fromkeys(as_list("ids", ids)))
+        paths = list(dict.fromkeys(as_list("paths", paths)))
+        verify_type("include_timestamp", include_timestamp, bool)
+        if format not in SERIES_FORMATS:
+            raise ValueError(f"Unknown format {format}, expected one of {SERIES_FORMATS}")
+        page_size = FetchableSeries._get_page_size(page_size)
+
+        entries = (
+            self._backend.search_leaderboard_entries(
+                project_id=self._id,
+                types=[ContainerType.RUN],
+                query=self._prepare_nql_query(ids, None, None, None),
+                columns=["sys/id", *paths],
+            )
+            if ids and paths
+            else []
+        )
+        entries_by_sys_id = dict()
+        for entry in entries:
+            attributes = {attribute.path: attribute for attribute in entry.attributes}
+            if "sys/id" in attributes:
+                entries_by_sys_id[attributes["sys/id"].properties.value] = (entry.id, attributes)
+
+        requests = []
+        for sys_id in ids:
+            container_id, attributes = entries_by_sys_id.get(sys_id, (None, {}))
+            for path in paths:
+                attribute = attributes.get(path)
+                if attribute is not None and attribute.type in (
+                    AttributeType.FLOAT_SERIES,
+                    AttributeType.STRING_SERIES,
+                ):
+                    requests.append(SeriesRequest(sys_id, container_id, path, attribute.type))
+
+        fetcher = SeriesFetcher(self._backend, ContainerType.RUN, page_size=page_size)
+        return SeriesFetcher.to_output(requests, fetcher.fetch(requests), format, include_timestamp)
+
+    def fetch_models_table(
+        self,
+        columns: Optional[Iterable[str]] = None,
+        filters: Optional[Iterable[Tuple[Any, ...]]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Table:
         """Retrieve models stored in the project.
 
         Args:
@@ -284,6 +510,19 @@ class Project(MetadataContainer):
                     Fields: `["datasets/test", "info/size"]` - these fields are included as columns.
                     Namespaces: `["datasets", "info"]` - all the fields inside the namespaces are included as columns.
                 If `None` (default), all the columns of the models table are included.
+            filters: Conditions on attributes, as `(path, operator, value)` or `(path, operator, value, type)` tuples,
+                which models must all satisfy.
+                Models are filtered by Neptune servers, so only the matching ones are transferred.
+                Operators "=", "!=", ">", ">=", "<" and "<=" compare with `value`. The attribute type is named by
+                `type`, e.g. "integer", or inferred from the Python type of `value`: bool, float (for int and float),
+                datetime (naive ones are in local time) or str.
+                "between" matches values in the inclusive range given as a `(lower, upper)` pair.
+                "exists" matches models having the attribute of the type named by `value`, e.g. "float".
+                Example: `[("info/size", "between", (100, 1000))]`.
+                Defaults to `None`.
+            progress_callback: Function called with the number of fetched entries and the total number of matching
+                entries (`None` if unknown) as the entries are fetched. Useful for tables with many entries.
+                Defaults to `None`.
 
         Returns:
             `Table` object containing `Model` objects.
@@ -318,13 +557,20 @@ class Project(MetadataContainer):
         return MetadataContainer._fetch_entries(
             self,
             child_type=ContainerType.MODEL,
-            query=NQLQueryAttribute(
-                name="sys/trashed",
-                type=NQLAttributeType.BOOLEAN,
-                operator=NQLAttributeOperator.EQUALS,
-                value=False,
+            query=NQLQueryAggregate(
+                items=[
+                    NQLQueryAttribute(
+                        name="sys/trashed",
+                        type=NQLAttributeType.BOOLEAN,
+                        operator=NQLAttributeOperator.EQUALS,
+                        value=False,
+                    ),
+                    *build_filter_queries(filters or []),
+                ],
+                aggregator=NQLAggregator.AND,
             ),
             columns=columns,
+            progress_callback=progress_callback,
         )
 
     def assign(self, value, wait: bool = False) -> None:
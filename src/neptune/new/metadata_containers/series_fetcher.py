@@ -0,0 +1,147 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "SeriesFetcher",
+    "SeriesRequest",
+    "SERIES_FORMATS",
+]
+
+import os
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy
+
+from neptune.new.attributes.series.fetchable_series import (
+    columns_to_data_frame,
+    concatenate_columns,
+    page_to_columns,
+    to_local_datetimes,
+)
+from neptune.new.envs import NEPTUNE_FETCH_SERIES_WORKERS
+from neptune.new.internal.backends.api_model import AttributeType
+from neptune.new.internal.backends.neptune_backend import NeptuneBackend
+from neptune.new.internal.backends.series_cache import Columns
+from neptune.new.internal.container_type import ContainerType
+from neptune.new.internal.utils.paths import parse_path
+
+if TYPE_CHECKING:
+    import pandas
+
+SERIES_FORMATS = ("long", "wide", "dict")
+
+
+@dataclass(frozen=True)
+class SeriesRequest:
+    sys_id: str
+    container_id: str
+    path: str
+    type: AttributeType
+
+
+class SeriesFetcher:
+    """Fetches many series of many containers at once.
+
+    The first pages of all the series are requested through a shared pool of `workers` threads; once the length
+    of a series is known, the requests of its remaining pages are scheduled in the same pool.
+    """
+
+    def __init__(
+        self, backend: NeptuneBackend, container_type: ContainerType, page_size: int, workers: Optional[int] = None
+    ):
+        self._backend = backend
+        self._container_type = container_type
+        self._page_size = page_size
+        self._workers = workers or int(os.getenv(NEPTUNE_FETCH_SERIES_WORKERS, "8"))
+
+    def fetch(self, requests: List[SeriesRequest]) -> List[Columns]:
+        if not requests:
+            return []
+        pages: List[List[Future]] = [[] for _ in requests]
+        with ThreadPoolExecutor(max_workers=max(self._workers, 1)) as executor:
+            first_pages = {
+                executor.submit(self._fetch_page, request, 0): index for index, request in enumerate(requests)
+            }
+            for future in as_completed(first_pages):
+                index = first_pages[future]
+                total_count, _ = future.result()
+                pages[index].append(future)
+                pages[index].extend(
+                    executor.submit(self._fetch_page, requests[index], offset)
+                    for offset in range(self._page_size, total_count, self._page_size)
+                )
+            return [concatenate_columns([page.result()[1] for page in series_pages]) for series_pages in pages]
+
+    def _fetch_page(self, request: SeriesRequest, offset: int) -> Tuple[int, Columns]:
+        if request.type == AttributeType.FLOAT_SERIES:
+            page = self._backend.get_float_series_values(
+                request.container_id, self._container_type, parse_path(request.path), offset, self._page_size
+            )
+            return page.totalItemCount, page_to_columns(page, float)
+        page = self._backend.get_string_series_values(
+            request.container_id, self._container_type, parse_path(request.path), offset, self._page_size
+        )
+        return page.totalItemCount, page_to_columns(page, object)
+
+    @staticmethod
+    def to_output(
+        requests: List[SeriesRequest], series: List[Columns], output_format: str, include_timestamp: bool
+    ) -> Union["pandas.DataFrame", Dict[Tuple[str, str], Dict[str, numpy.ndarray]]]:
+        if output_format == "dict":
+            result = dict()
+            for request, (steps, values, timestamps) in zip(requests, series):
+                columns = {"step": steps, "value": values}
+                if include_timestamp:
+                    columns["timestamp"] = to_local_datetimes(timestamps)
+                result[(request.sys_id, request.path)] = columns
+            return result
+
+        import pandas as pd
+
+        frames = []
+        for request, columns in zip(requests, series):
+            frame = columns_to_data_frame([columns], include_timestamp)
+            frame.insert(0, "sys/id", request.sys_id)
+            frame.insert(1, "path", request.path)
+            frames.append(frame)
+        if frames:
+            long = pd.concat(frames, ignore_index=True)
+        else:
+            empty = (numpy.empty(0), numpy.empty(0, dtype=object), numpy.empty(0, dtype=numpy.int64))
+            long = columns_to_data_frame([empty], include_timestamp)
+            long.insert(0, "sys/id", [])
+            long.insert(1, "path", [])
+        if output_format == "long":
+            return long
+
+        # columns are kept in the order of the requested ids and paths
+        if len({request.path for request in requests}) <= 1:
+            wide = long.pivot(index="step", columns="sys/id", values="value")
+            return wide[list(dict.fromkeys(request.sys_id for request in requests))]
+        wide = long.pivot(index="step", columns=["sys/id", "path"], values="value")
+        return wide[[(request.sys_id, request.path) for request in requests]]
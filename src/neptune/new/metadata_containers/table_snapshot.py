@@ -0,0 +1,215 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["TableSnapshot"]
+
+import json
+import sqlite3
+from contextlib import closing
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+from neptune.new.internal.backends.api_model import (
+    AttributeType,
+    AttributeWithProperties,
+    LeaderboardEntry,
+)
+from neptune.new.internal.backends.neptune_backend import NeptuneBackend
+from neptune.new.internal.backends.nql import (
+    NQLAggregator,
+    NQLAttributeOperator,
+    NQLAttributeType,
+    NQLQuery,
+    NQLQueryAggregate,
+    NQLQueryAttribute,
+)
+from neptune.new.internal.container_type import ContainerType
+from neptune.new.internal.id_formats import UniqueId
+
+MODIFICATION_TIME_PATH = "sys/modification_time"
+
+# entries modified shortly before the previous sync may become searchable only after it, so they're fetched again
+SYNC_OVERLAP = timedelta(minutes=5)
+
+_VALUE_TYPES = {
+    AttributeType.FLOAT,
+    AttributeType.INT,
+    AttributeType.BOOL,
+    AttributeType.STRING,
+    AttributeType.DATETIME,
+    AttributeType.RUN_STATE,
+}
+
+
+class TableSnapshot:
+    """Local copy of a table of entries, kept in an SQLite database at `path`.
+
+    The first sync fetches all the entries matching the query. The following ones fetch only the entries
+    modified since the previous sync: the matching ones replace their previous versions, while the ones
+    which don't match the query anymore, e.g. trashed runs, are removed. Entries deleted permanently are
+    not detected; delete the snapshot file to start over. If the project, the query or the columns change,
+    the snapshot is replaced.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def sync(
+        self,
+        backend: NeptuneBackend,
+        project_id: UniqueId,
+        container_type: ContainerType,
+        query: NQLQuery,
+        columns: Optional[Iterable[str]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> List[LeaderboardEntry]:
+        columns = sorted(set(columns)) if columns is not None else None
+        key = json.dumps({"project": project_id, "type": container_type.value, "query": str(query), "columns": columns})
+        fetched_columns = sorted({"sys/id", MODIFICATION_TIME_PATH, *columns}) if columns is not None else None
+
+        with closing(sqlite3.connect(self._path)) as connection, connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (id TEXT PRIMARY KEY, sys_id TEXT, attributes TEXT)")
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            last_modification_time = None
+            if meta.get("key") == key and meta.get("modification_time"):
+                last_modification_time = datetime.fromisoformat(meta["modification_time"])
+
+            if last_modification_time is None:
+                connection.execute("DELETE FROM entries")
+                changed = backend.search_leaderboard_entries(
+                    project_id=project_id,
+                    types=[container_type],
+                    query=query,
+                    columns=fetched_columns,
+                    progress_callback=progress_callback,
+                )
+                removed_ids: Set[str] = set()
+            else:
+                modified_query = NQLQueryAttribute(
+                    name=MODIFICATION_TIME_PATH,
+                    type=NQLAttributeType.DATETIME,
+                    operator=NQLAttributeOperator.GREATER_THAN_OR_EQUAL,
+                    value=last_modification_time - SYNC_OVERLAP,
+                )
+                changed = backend.search_leaderboard_entries(
+                    project_id=project_id,
+                    types=[container_type],
+                    query=NQLQueryAggregate(items=[query, modified_query], aggregator=NQLAggregator.AND),
+                    columns=fetched_columns,
+                    progress_callback=progress_callback,
+                )
+                modified = backend.search_leaderboard_entries(
+                    project_id=project_id,
+                    types=[container_type],
+                    query=modified_query,
+                    columns=["sys/id"],
+                )
+                removed_ids = {entry.id for entry in modified} - {entry.id for entry in changed}
+
+            for entry in changed:
+                attributes = {attr.path: attr for attr in entry.attributes}
+                modification_time = attributes.get(MODIFICATION_TIME_PATH)
+                if modification_time is not None and modification_time.properties.value is not None:
+                    value = _as_utc(modification_time.properties.value)
+                    if last_modification_time is None or value > last_modification_time:
+                        last_modification_time = value
+                if columns is not None and MODIFICATION_TIME_PATH not in columns:
+                    attributes.pop(MODIFICATION_TIME_PATH, None)
+                sys_id = attributes.get("sys/id")
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (id, sys_id, attributes) VALUES (?, ?, ?)",
+                    (
+                        entry.id,
+                        sys_id.properties.value if sys_id is not None else None,
+                        _dump_attributes(attributes.values()),
+                    ),
+                )
+            connection.executemany("DELETE FROM entries WHERE id = ?", [(entry_id,) for entry_id in removed_ids])
+
+            meta = {
+                "key": key,
+                "modification_time": last_modification_time.isoformat() if last_modification_time else "",
+            }
+            connection.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items())
+
+            return [
+                LeaderboardEntry(entry_id, _load_attributes(attributes))
+                for entry_id, attributes in connection.execute("SELECT id, attributes FROM entries ORDER BY sys_id")
+            ]
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _properties_to_dict(attr: AttributeWithProperties) -> Dict[str, Any]:
+    """Keeps the properties of an attribute which tables use"""
+    _type, properties = attr.type, attr.properties
+    if _type in _VALUE_TYPES:
+        return {"value": properties.value}
+    if _type == AttributeType.FLOAT_SERIES or _type == AttributeType.STRING_SERIES:
+        return {"last": properties.last}
+    if _type == AttributeType.STRING_SET:
+        return {"values": list(properties.values)}
+    if _type == AttributeType.GIT_REF:
+        commit = properties.commit
+        return {"commit": {"commitId": commit.commitId} if commit is not None else None}
+    if _type == AttributeType.NOTEBOOK_REF:
+        return {"notebookName": properties.notebookName}
+    if _type == AttributeType.ARTIFACT:
+        return {"hash": properties.hash}
+    return {}
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    if "$datetime" in obj:
+        return datetime.fromisoformat(obj["$datetime"])
+    return SimpleNamespace(**obj)
+
+
+def _dump_attributes(attributes: Iterable[AttributeWithProperties]) -> str:
+    return json.dumps(
+        [{"path": attr.path, "type": attr.type.value, "properties": _properties_to_dict(attr)} for attr in attributes],
+        default=_encode,
+    )
+
+
+def _load_attributes(data: str) -> List[AttributeWithProperties]:
+    return [
+        AttributeWithProperties(attr.path, AttributeType(attr.type), attr.properties)
+        for attr in json.loads(data, object_hook=_decode)
+    ]
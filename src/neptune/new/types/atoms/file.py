@@ -17,22 +17,28 @@ __all__ = [
     "File",
 ]
 
+from concurrent.futures import Future
 from io import IOBase
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
     Optional,
     TypeVar,
     Union,
 )
 
 from neptune.new.internal.types.file_types import (
+    DeferredComposite,
     FileComposite,
     InMemoryComposite,
     LocalFileComposite,
     StreamComposite,
 )
 from neptune.new.internal.utils import verify_type
+from neptune.new.internal.utils.deferred_rendering import get_deferred_renderer
 from neptune.new.internal.utils.images import (
+    ImageOptions,
     get_html_content,
     get_image_content,
     get_pickle_content,
@@ -86,6 +92,13 @@ class File(Atom):
     def _save(self, path):
         self._file_composite.save(path)
 
+    @property
+    def _rendered(self) -> Optional[Future]:
+        """Content being rendered in the background, if the file was created with `defer=True`"""
+        if isinstance(self._file_composite, DeferredComposite):
+            return self._file_composite.rendered
+        return None
+
     def __str__(self):
         return str(self._file_composite)
 
@@ -170,7 +183,15 @@ class File(Atom):
         return File(file_composite=file_composite)
 
     @staticmethod
-    def as_image(image) -> "File":
+    def as_image(
+        image,
+        *,
+        format: str = "png",
+        quality: Optional[int] = None,
+        compress_level: Optional[int] = None,
+        max_size: Optional[int] = None,
+        defer: bool = False,
+    ) -> "File":
         """Static method for converting image objects or image-like objects to an image File value object.
 
         This way you can upload `Matplotlib` figures, `PIL` images, `NumPy` arrays, as static images.
@@ -178,7 +199,20 @@ class File(Atom):
         Args:
             image: Image-like object to be converted.
                 Supported are `PyTorch` tensors, `TensorFlow/Keras` tensors, `NumPy` arrays, `PIL` images
-                and `Matplotlib` figures.
+                and `Matplotlib` figures. Arrays and tensors of `uint8` type are interpreted as pixel values
+                in the [0, 255] range, other ones are expected to be in the [0, 1] range.
+            format (str, optional): Encoding of the image, one of "png", "jpeg" and "webp".
+                Defaults to "png".
+            quality (int, optional): Quality (1-100) of the lossy "jpeg" and "webp" encodings.
+                Defaults to `None` - encoder's default.
+            compress_level (int, optional): Compression level (0-9) of the "png" encoding.
+                Defaults to `None` - encoder's default.
+            max_size (int, optional): If given, larger images are scaled down to at most `max_size` pixels
+                on the longer side, keeping the aspect ratio.
+                Defaults to `None` - image is not scaled.
+            defer (bool, optional): If `True`, the image is converted in a background thread. Uploading it doesn't
+                block; it's uploaded once converted. Matplotlib figures must not be modified until then.
+                Defaults to `False`.
 
         Returns:
             ``File``: value object with converted image
@@ -201,16 +235,23 @@ class File(Atom):
 
             >>> run["dataset/data_sample/img2"].upload(pil_image)
 
+            Log a downscaled JPEG preview of a large image
+
+            >>> run["train/previews"].log(File.as_image(numpy_array, format="jpeg", quality=80, max_size=256))
+
         You may also want to check `as_image docs page`_.
 
         .. _as_image docs page:
            https://docs.neptune.ai/api/field_types#as_image
         """
-        content_bytes = get_image_content(image)
-        return File.from_content(content_bytes if content_bytes is not None else b"", extension="png")
+        options = ImageOptions(format=format, quality=quality, compress_level=compress_level, max_size=max_size)
+        if defer:
+            return File._render_deferred(lambda obj: get_image_content(obj, options), image, extension=format)
+        content_bytes = get_image_content(image, options)
+        return File.from_content(content_bytes if content_bytes is not None else b"", extension=format)
 
     @staticmethod
-    def as_html(chart) -> "File":
+    def as_html(chart, defer: bool = False) -> "File":
         """Converts an object to an HTML File value object.
 
         This way you can upload `Altair`, `Bokeh`, `Plotly`, `Matplotlib` interactive charts
@@ -220,6 +261,9 @@ class File(Atom):
             chart: An object to be converted.
                 Supported are `Altair`, `Bokeh`, `Plotly`, `Matplotlib` interactive charts,
                 and `Pandas` `DataFrame` objects.
+            defer (bool, optional): If `True`, the chart is exported in a background thread. Uploading it doesn't
+                block; it's uploaded once exported. Matplotlib figures must not be modified until then.
+                Defaults to `False`.
 
         Returns:
             ``File``: value object with converted object.
@@ -242,14 +286,25 @@ class File(Atom):
 
             >>> run["dataset/data_sample/img2"].upload(altair_chart)
 
+            Export a large Plotly chart without blocking the training loop
+
+            >>> run["train/embeddings"].upload(File.as_html(plotly_chart, defer=True))
+
         You may also want to check `as_html docs page`_.
 
         .. _as_html docs page:
            https://docs.neptune.ai/api/field_types#as_html
         """
+        if defer:
+            return File._render_deferred(get_html_content, chart, extension="html")
         content = get_html_content(chart)
         return File.from_content(content if content is not None else "", extension="html")
 
+    @staticmethod
+    def _render_deferred(render: Callable[[Any], Union[str, bytes, None]], obj, extension: str) -> "File":
+        rendered = get_deferred_renderer().submit(render, obj)
+        return File(file_composite=DeferredComposite(rendered, extension=extension))
+
     @staticmethod
     def as_pickle(obj) -> "File":
         """Pickles a Python object and stores it in `File` value object.
@@ -23,6 +23,10 @@ from typing import (
 )
 
 from neptune.new.internal.utils import is_collection
+from neptune.new.internal.utils.arrays import (
+    as_float_array,
+    is_array_like,
+)
 from neptune.new.internal.utils.stringify_value import extract_if_stringify_value
 from neptune.new.types.series.series import Series
 
@@ -40,9 +44,12 @@ class FloatSeries(Series):
         max: Optional[Union[float, int]] = None,
         unit: Optional[str] = None,
     ):
-        if not is_collection(values):
+        if is_array_like(values):
+            self._values = as_float_array("values", values).tolist()
+        elif is_collection(values):
+            self._values = [float(extract_if_stringify_value(value)) for value in values]
+        else:
             raise TypeError("`values` is not a collection")
-        self._values = [float(extract_if_stringify_value(value)) for value in values]
         self._min = min
         self._max = max
         self._unit = unit
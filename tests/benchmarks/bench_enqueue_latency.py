@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures the latency of enqueueing operations in async mode while they're being synchronized.
+
+The backend takes a fixed time to execute each batch, so the consumer thread keeps acknowledging
+operations while the producer logs, holding the container lock like attributes do.
+
+Run with: python -m tests.benchmarks.bench_enqueue_latency [number_of_operations] [batch_latency_ms]
+"""
+import sys
+import threading
+import time
+import uuid
+from tempfile import TemporaryDirectory
+
+from mock import patch
+
+from neptune.new.internal.container_type import ContainerType
+from neptune.new.internal.operation import LogFloats
+from neptune.new.internal.operation_processors.async_operation_processor import AsyncOperationProcessor
+
+
+class _SlowBackend:
+    def __init__(self, batch_latency: float):
+        self._batch_latency = batch_latency
+
+    def execute_operations(self, container_id, container_type, operations):
+        time.sleep(self._batch_latency)
+        return len(operations), []
+
+
+def _percentile(sorted_values, percentile: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percentile / 100))]
+
+
+def main(operations: int = 50_000, batch_latency_ms: int = 5) -> None:
+    lock = threading.RLock()
+    with TemporaryDirectory() as tmp_dir, patch.object(
+        AsyncOperationProcessor, "_init_data_path", return_value=tmp_dir
+    ):
+        processor = AsyncOperationProcessor(
+            str(uuid.uuid4()), ContainerType.RUN, _SlowBackend(batch_latency_ms / 1000), lock, sleep_time=0.01
+        )
+        processor.start()
+
+        latencies = []
+        for i in range(operations):
+            op = LogFloats(["train", "loss"], [LogFloats.ValueType(i * 0.5, step=i, ts=time.time())])
+            start = time.perf_counter()
+            with lock:
+                processor.enqueue_operation(op, wait=False)
+            latencies.append(time.perf_counter() - start)
+
+        processor.stop()
+
+    latencies.sort()
+    print(f"{operations} operations enqueued while syncing ({batch_latency_ms}ms per batch)")
+    for percentile in (50, 90, 99, 99.9):
+        print(f"  p{percentile}: {_percentile(latencies, percentile) * 1e6:.1f}us")
+    print(f"  max:  {latencies[-1] * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
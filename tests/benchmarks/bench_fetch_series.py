@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares fetching a series of many runs one run at a time and with `Project.fetch_series`.
+
+The backend is a local stand-in which answers every request after a fixed latency. Opening a run
+in read-only mode is approximated by the requests it makes: the project and container lookups and
+the listing of the run attributes.
+
+Run with: python -m tests.benchmarks.bench_fetch_series [number_of_runs] [points_per_run] [latency_ms]
+"""
+import sys
+import threading
+import time
+
+from mock import Mock
+
+from neptune.new.attributes.series.fetchable_series import FetchableSeries
+from neptune.new.internal.backends.api_model import (
+    AttributeType,
+    AttributeWithProperties,
+    FloatPointValue,
+    FloatSeriesValues,
+    LeaderboardEntry,
+)
+from neptune.new.metadata_containers.project import Project
+
+PATH = "train/loss"
+
+
+class _LatencyBackend:
+    def __init__(self, runs: int, points: int, latency: float):
+        self._latency = latency
+        self._points = [FloatPointValue(1_600_000_000_000 + i, float(i), i * 0.5) for i in range(points)]
+        self._sys_ids = {f"uuid-{i}": f"RUN-{i}" for i in range(runs)}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def _request(self) -> None:
+        with self._lock:
+            self.requests += 1
+        time.sleep(self._latency)
+
+    def get_project(self, *_):
+        self._request()
+
+    def get_metadata_container(self, *_):
+        self._request()
+
+    def get_attributes(self, *_):
+        self._request()
+
+    def get_float_series_values(self, container_id, container_type, path, offset, limit):
+        self._request()
+        return FloatSeriesValues(len(self._points), self._points[offset : offset + limit])
+
+    def search_leaderboard_entries(self, *_, **__):
+        self._request()
+        return [
+            LeaderboardEntry(
+                container_id,
+                [
+                    AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value=sys_id)),
+                    AttributeWithProperties(PATH, AttributeType.FLOAT_SERIES, Mock()),
+                ],
+            )
+            for container_id, sys_id in self._sys_ids.items()
+        ]
+
+
+class _Series(FetchableSeries):
+    _values_dtype = float
+
+    def __init__(self, backend: _LatencyBackend, container_id: str):
+        self._backend = backend
+        self._container_id = container_id
+
+    def _fetch_values_from_backend(self, offset, limit):
+        return self._backend.get_float_series_values(self._container_id, None, PATH.split("/"), offset, limit)
+
+
+def _fetch_in_loop(backend: _LatencyBackend, runs: int) -> int:
+    values = 0
+    for i in range(runs):
+        backend.get_project()
+        backend.get_metadata_container()
+        backend.get_attributes()
+        values += len(_Series(backend, f"uuid-{i}").fetch_values())
+    return values
+
+
+def _fetch_in_bulk(backend: _LatencyBackend, runs: int) -> int:
+    project = Mock(_id="project-id", _backend=backend, _prepare_nql_query=Mock())
+    return len(Project.fetch_series(project, [f"RUN-{i}" for i in range(runs)], PATH))
+
+
+def main(runs: int = 100, points: int = 5000, latency_ms: int = 20) -> None:
+    print(f"{runs} runs with {points} points each, {latency_ms}ms per request")
+    for name, fetch in (("loop over runs", _fetch_in_loop), ("fetch_series", _fetch_in_bulk)):
+        backend = _LatencyBackend(runs, points, latency_ms / 1000)
+        start = time.perf_counter()
+        values = fetch(backend, runs)
+        elapsed = time.perf_counter() - start
+        print(f"  {name}: {elapsed:.2f}s, {backend.requests} requests, {values / elapsed:,.0f} points/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,55 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares encoding a batch of images logged with `extend` on one thread and in the encoding pool.
+
+Run with: python -m tests.benchmarks.bench_file_series_extend [number_of_images] [image_size]
+"""
+import sys
+import time
+
+import numpy
+from PIL import Image
+
+from neptune.new import init_run
+from neptune.new.attributes.series.file_series import FileSeries
+
+
+def _measure(run, path: str, images: list) -> float:
+    start = time.perf_counter()
+    run[path].extend(images, steps=list(range(len(images))))
+    return time.perf_counter() - start
+
+
+def main(count: int = 64, size: int = 512) -> None:
+    images = [Image.fromarray(numpy.random.randint(0, 255, (size, size, 3), dtype=numpy.uint8)) for _ in range(count)]
+    workers = FileSeries.max_encoding_workers
+
+    with init_run(mode="offline") as run:
+        FileSeries.max_encoding_workers = 1
+        serial_time = _measure(run, "serial", images)
+        FileSeries.max_encoding_workers = workers
+        parallel_time = _measure(run, "parallel", images)
+
+    print(f"{count} images of {size}x{size} pixels")
+    print(f"  1 worker:  {serial_time * 1e3:.0f}ms, {count / serial_time:.1f} images/s")
+    print(
+        f"  {workers} workers: {parallel_time * 1e3:.0f}ms, {count / parallel_time:.1f} images/s"
+        f" ({serial_time / parallel_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares `extend` of a float series with NumPy arrays and with lists.
+
+Run with: python -m tests.benchmarks.bench_float_series_extend [number_of_points]
+"""
+import sys
+import time
+
+import numpy
+
+from neptune.new import init_run
+
+
+def _measure(run, path, values, steps) -> float:
+    start = time.perf_counter()
+    run[path].extend(values, steps=steps)
+    return time.perf_counter() - start
+
+
+def main(points: int = 1_000_000) -> None:
+    values = numpy.random.rand(points)
+    steps = numpy.arange(points)
+
+    with init_run(mode="offline") as run:
+        list_time = _measure(run, "bench/list", values.tolist(), steps.tolist())
+        array_time = _measure(run, "bench/array", values, steps)
+
+    print(f"extend() of {points} points")
+    print(f"  list input:    {list_time:.3f}s")
+    print(f"  ndarray input: {array_time:.3f}s ({list_time / array_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
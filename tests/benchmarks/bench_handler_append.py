@@ -0,0 +1,55 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures the per-call overhead of `run[path].append(value)` in a tight logging loop.
+
+The overhead is measured with operations dropped instead of enqueued, so that only the handler,
+path resolution and attribute work is timed. `extend([value])` goes through the full extend machinery
+and is shown for comparison.
+
+Run with: python -m tests.benchmarks.bench_handler_append [number_of_calls]
+"""
+import sys
+import time
+
+from neptune.new import init_run
+
+PATH = "train/batch/loss"
+
+
+def _measure(log, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        log(i * 0.5)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(calls: int = 100_000) -> None:
+    with init_run(mode="offline") as run:
+        run[PATH].append(0.0)
+        enqueue_time = _measure(lambda value: run[PATH].append(value), calls)
+
+        run._op_processor.enqueue_operation = lambda op, wait: None
+        append_overhead = _measure(lambda value: run[PATH].append(value), calls)
+        extend_overhead = _measure(lambda value: run[PATH].extend([value]), calls)
+
+    print(f"{calls} calls of run[{PATH!r}]")
+    print(f"  append(), offline mode:       {enqueue_time:.2f}us per call")
+    print(f"  append() overhead:            {append_overhead:.2f}us per call")
+    print(f"  extend([value]) overhead:     {extend_overhead:.2f}us per call")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
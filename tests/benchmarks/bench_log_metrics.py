@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares logging many metrics per step with `append` of a dictionary and with `log_metrics`.
+
+Run with: python -m tests.benchmarks.bench_log_metrics [number_of_steps] [metrics_per_step]
+"""
+import random
+import sys
+import time
+
+from neptune.new import init_run
+
+
+def _measure(log, steps: int, keys: int) -> float:
+    metrics = {f"layer_{i}/grad_norm": random.random() for i in range(keys)}
+    start = time.perf_counter()
+    for step in range(steps):
+        log(metrics, step)
+    return time.perf_counter() - start
+
+
+def main(steps: int = 500, keys: int = 200) -> None:
+    with init_run(mode="offline") as run:
+        append_time = _measure(lambda metrics, step: run["append"].append(metrics, step=step), steps, keys)
+        bulk_time = _measure(lambda metrics, step: run["bulk"].log_metrics(metrics, step=step), steps, keys)
+
+    print(f"{steps} steps of {keys} metrics")
+    print(f"  append(dict):  {append_time / steps * 1e3:.2f}ms per step, {steps * keys / append_time:.0f} values/s")
+    print(
+        f"  log_metrics(): {bulk_time / steps * 1e3:.2f}ms per step, {steps * keys / bulk_time:.0f} values/s"
+        f" ({append_time / bulk_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
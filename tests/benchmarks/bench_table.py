@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures building a data frame from a runs table and reading values of its entries.
+
+The row-dict construction which `Table.to_pandas` used before is measured alongside for comparison.
+Every entry has a mix of float, int, string and datetime attributes; a tenth of the columns is missing
+in every other entry.
+
+Run with: python -m tests.benchmarks.bench_table [number_of_entries] [number_of_columns]
+"""
+import sys
+import time
+from datetime import (
+    datetime,
+    timezone,
+)
+
+from neptune.new.internal.backends.api_model import (
+    AttributeType,
+    AttributeWithProperties,
+    LeaderboardEntry,
+)
+from neptune.new.metadata_containers.metadata_containers_table import (
+    Table,
+    _get_value_getter,
+)
+
+_TYPES = (AttributeType.FLOAT, AttributeType.INT, AttributeType.STRING, AttributeType.DATETIME)
+
+
+class _Properties:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _value(attribute_type: AttributeType, row: int):
+    if attribute_type == AttributeType.FLOAT:
+        return row * 0.5
+    if attribute_type == AttributeType.INT:
+        return row
+    if attribute_type == AttributeType.STRING:
+        return f"value-{row % 100}"
+    return datetime.fromtimestamp(1_600_000_000 + row, tz=timezone.utc)
+
+
+def _entries(rows: int, columns: int):
+    types = [_TYPES[column % len(_TYPES)] for column in range(columns)]
+    return [
+        LeaderboardEntry(
+            f"uuid-{row}",
+            [AttributeWithProperties("sys/id", AttributeType.STRING, _Properties(f"RUN-{row}"))]
+            + [
+                AttributeWithProperties(f"params/p{column}", attribute_type, _Properties(_value(attribute_type, row)))
+                for column, attribute_type in enumerate(types)
+                if row % 2 == 0 or column % 10 != 0
+            ],
+        )
+        for row in range(rows)
+    ]
+
+
+def _to_pandas_from_rows(entries):
+    import pandas as pd
+
+    rows = dict()
+    for n, entry in enumerate(entries):
+        row = dict()
+        for attr in entry.attributes:
+            value = _get_value_getter(attr.type)(attr.properties)
+            if value is not None:
+                row[attr.path] = value
+        rows[n] = row
+    df = pd.DataFrame.from_dict(data=rows, orient="index")
+    return df.reindex(sorted(df.columns), axis="columns")
+
+
+def _measure(name: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"  {name}: {time.perf_counter() - start:.2f}s")
+    return result
+
+
+def main(rows: int = 10_000, columns: int = 100) -> None:
+    print(f"{rows} entries with {columns} columns")
+    entries = _entries(rows, columns)
+    table = Table(backend=None, container_type=None, entries=entries)
+
+    before = _measure("to_pandas from row dicts", lambda: _to_pandas_from_rows(entries))
+    after = _measure("to_pandas", table.to_pandas)
+    for name, df in (("row dicts", before), ("columns", after)):
+        print(f"  frame memory ({name}): {df.memory_usage(deep=True).sum() / 2 ** 20:,.1f}MB")
+
+    paths = [f"params/p{column}" for column in range(1, columns, max(columns // 10, 1))]
+    _measure(
+        f"to_rows and get() of {len(paths)} attributes",
+        lambda: [entry[path].get() for entry in table.to_rows() for path in paths],
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
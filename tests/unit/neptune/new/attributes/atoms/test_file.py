@@ -14,7 +14,9 @@
 # limitations under the License.
 #
 import os
+import time
 import unittest
+from concurrent.futures import Future
 from io import (
     BytesIO,
     StringIO,
@@ -37,7 +39,10 @@ from neptune.new.internal.operation import (
     UploadFile,
     UploadFileSet,
 )
-from neptune.new.internal.types.file_types import FileType
+from neptune.new.internal.types.file_types import (
+    DeferredComposite,
+    FileType,
+)
 from tests.e2e.utils import tmp_context
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
@@ -95,6 +100,35 @@ class TestFile(TestAttributeBase):
 
                 processor.enqueue_operation.assert_called_once_with(operation_factory(path, tmp_uploaded_file), wait)
 
+    @unittest.skipIf(IS_WINDOWS, "Windows behaves strangely")
+    def test_assign_deferred(self):
+        with tmp_context() as tmp_upload_dir:
+            processor = MagicMock()
+            processor._operation_storage = PropertyMock(upload_path=Path(tmp_upload_dir))
+            exp, path = self._create_run(processor), self._random_path()
+            var = File(exp, path)
+            rendered = Future()
+
+            # when
+            var.assign(FileVal(file_composite=DeferredComposite(rendered, extension="html")))
+            var.assign(FileVal("other/file.txt"))
+
+            # then
+            processor.enqueue_operation.assert_not_called()
+
+            # when
+            rendered.set_result("<html></html>")
+            deadline = time.monotonic() + 5
+            while processor.enqueue_operation.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            # then
+            (deferred_op, _), (second_op, _) = [c.args for c in processor.enqueue_operation.call_args_list]
+            self.assertEqual(("html", True), (deferred_op.ext, deferred_op.clean_after_upload))
+            with open(deferred_op.file_path) as uploaded_file:
+                self.assertEqual("<html></html>", uploaded_file.read())
+            self.assertEqual(UploadFile(path, ext="txt", file_path=os.getcwd() + "/other/file.txt"), second_op)
+
     def test_assign_type_error(self):
         values = [55, None, []]
         for value in values:
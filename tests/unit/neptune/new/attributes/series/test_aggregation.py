@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from mock import patch
+
+from neptune.new.attributes.series.aggregation import (
+    SeriesAggregation,
+    SeriesAggregator,
+)
+from neptune.new.internal.operation import LogFloats
+
+PATH = ["train", "loss"]
+
+
+def _points(values, first_step=0):
+    return [(value, float(first_step + i), 1000.0 + i) for i, value in enumerate(values)]
+
+
+def _values(ops):
+    return [(value.value, value.step) for op in ops for value in op.values]
+
+
+class TestSeriesAggregator(unittest.TestCase):
+    def test_statistics(self):
+        values = [3.0, 1.0, 2.0, 6.0, 5.0, 4.0, 7.0]
+        expected = {
+            "mean": [(2.0, 2.0), (5.0, 5.0)],
+            "min": [(1.0, 2.0), (4.0, 5.0)],
+            "max": [(3.0, 2.0), (6.0, 5.0)],
+            "last": [(2.0, 2.0), (4.0, 5.0)],
+        }
+        for method, expected_values in expected.items():
+            with self.subTest(method):
+                aggregator = SeriesAggregator(PATH, SeriesAggregation(method, window=3))
+
+                ops = aggregator.add(_points(values))
+
+                self.assertEqual(expected_values, _values(ops))
+                self.assertEqual([(7.0, 6.0)], _values(aggregator.close()))
+
+    def test_operations_are_batched(self):
+        aggregator = SeriesAggregator(PATH, SeriesAggregation("last", window=1), max_batch_size=4)
+
+        ops = aggregator.add(_points(range(10)))
+
+        self.assertEqual([4, 4, 2], [len(op.values) for op in ops])
+        self.assertTrue(all(isinstance(op, LogFloats) and op.path == PATH for op in ops))
+
+    def test_flush_emits_incomplete_window(self):
+        aggregator = SeriesAggregator(PATH, SeriesAggregation("mean", window=10))
+
+        self.assertEqual([], aggregator.add(_points([1.0, 2.0])))
+        self.assertEqual([(1.5, 1.0)], _values(aggregator.flush()))
+        self.assertEqual([], aggregator.flush())
+
+    def test_interval(self):
+        aggregator = SeriesAggregator(PATH, SeriesAggregation("max", window=1000, interval=5))
+
+        with patch("time.monotonic", return_value=100.0):
+            self.assertEqual([], aggregator.add(_points([1.0, 4.0])))
+        with patch("time.monotonic", return_value=105.0):
+            self.assertEqual([(5.0, 0.0)], _values(aggregator.add(_points([5.0]))))
+
+    def test_reset_drops_buffered_points(self):
+        aggregator = SeriesAggregator(PATH, SeriesAggregation("mean", window=10))
+        aggregator.add(_points([1.0, 2.0]))
+
+        aggregator.reset()
+
+        self.assertEqual([], aggregator.close())
+
+    def test_lttb_keeps_peaks(self):
+        values = [0.0, 0.0, 0.0, 0.0, 9.0, 0.0, 0.0, 0.0, -9.0, 0.0, 0.0, 0.0, 1.0]
+        aggregator = SeriesAggregator(PATH, SeriesAggregation("lttb", window=4))
+
+        emitted = aggregator.add(_points(values)) + aggregator.close()
+
+        self.assertEqual([(0.0, 0.0), (0.0, 3.0), (9.0, 4.0), (-9.0, 8.0), (1.0, 12.0)], _values(emitted))
+
+    def test_lttb_flush_emits_pending_selection(self):
+        aggregator = SeriesAggregator(PATH, SeriesAggregation("lttb", window=4))
+
+        self.assertEqual([(0.0, 0.0)], _values(aggregator.add(_points([0.0, 0.0, 9.0, 0.0]))))
+        self.assertEqual([(9.0, 2.0), (0.0, 3.0)], _values(aggregator.flush()))
+        self.assertEqual([], aggregator.flush())
+
+        # later windows are selected against the flushed point
+        emitted = aggregator.add(_points([0.0, -9.0, 0.0, 0.0, 1.0], first_step=4)) + aggregator.close()
+        self.assertEqual([(-9.0, 5.0), (1.0, 8.0)], _values(emitted))
+
+    def test_raw_values_are_saved(self):
+        with TemporaryDirectory() as tmp_dir:
+            raw_path = os.path.join(tmp_dir, "loss.csv")
+            aggregator = SeriesAggregator(PATH, SeriesAggregation("mean", window=2, raw_path=raw_path))
+
+            aggregator.add([(1.0, None, 10.0), (2.5, 3.0, 11.0)])
+            aggregator.close()
+
+            with open(raw_path) as raw_file:
+                self.assertEqual(["step,timestamp,value", ",10.0,1.0", "3.0,11.0,2.5"], raw_file.read().splitlines())
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            SeriesAggregation("median")
+        with self.assertRaises(ValueError):
+            SeriesAggregation(window=0)
+        with self.assertRaises(ValueError):
+            SeriesAggregation(interval=-1)
+        with self.assertRaises(TypeError):
+            SeriesAggregation.create(5)
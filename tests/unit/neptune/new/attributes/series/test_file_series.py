@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import hashlib
 import io
+import os
+from tempfile import TemporaryDirectory
 from unittest import mock
 
 import numpy
@@ -23,6 +26,7 @@ from mock import (
     call,
     patch,
 )
+from PIL import Image
 
 from neptune.new.attributes.series.file_series import FileSeries
 from neptune.new.exceptions import OperationNotSupported
@@ -31,6 +35,7 @@ from neptune.new.internal.operation import (
     ImageValue,
     LogImages,
 )
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
 from neptune.new.internal.utils import base64_encode
 from neptune.new.types import File
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
@@ -39,6 +44,17 @@ from tests.unit.neptune.new.utils.file_helpers import create_file
 
 @patch("time.time", new=TestAttributeBase._now)
 class TestFileSeries(TestAttributeBase):
+    def setUp(self):
+        self._blob_dir = TemporaryDirectory()
+        self._blob_storage = BlobStorage(self._blob_dir.name)
+
+    def tearDown(self):
+        self._blob_dir.cleanup()
+
+    def _blob_image_value(self, content: bytes, name=None, description=None) -> ImageValue:
+        blob_path = f"{self._blob_storage.dir_path.name}/{hashlib.sha1(content).hexdigest()}"
+        return ImageValue(None, name, description, blob_path=blob_path)
+
     def test_assign_type_error(self):
         values = [[5.0], ["text"], 55, "string", None]
         for value in values:
@@ -55,7 +71,7 @@ class TestFileSeries(TestAttributeBase):
         # given
         wait = self._random_wait()
         path = self._random_path()
-        op_processor = MagicMock()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
         exp = self._create_run(processor=op_processor)
         attr = FileSeries(exp, path)
 
@@ -77,7 +93,7 @@ class TestFileSeries(TestAttributeBase):
                 path,
                 [
                     LogImages.ValueType(
-                        ImageValue(base64_encode(file.content), "nazwa", "opis"),
+                        self._blob_image_value(file.content, "nazwa", "opis"),
                         3,
                         self._now(),
                     )
@@ -90,7 +106,7 @@ class TestFileSeries(TestAttributeBase):
         # given
         wait = self._random_wait()
         path = self._random_path()
-        op_processor = MagicMock()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
         exp = self._create_run(processor=op_processor)
         attr = FileSeries(exp, path)
 
@@ -108,7 +124,7 @@ class TestFileSeries(TestAttributeBase):
                         path,
                         [
                             LogImages.ValueType(
-                                ImageValue(base64_encode(file.content), None, None),
+                                self._blob_image_value(file.content),
                                 None,
                                 self._now(),
                             )
@@ -123,7 +139,7 @@ class TestFileSeries(TestAttributeBase):
         # given
         wait = self._random_wait()
         path = self._random_path()
-        op_processor = MagicMock()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
         exp = self._create_run(processor=op_processor)
         attr = FileSeries(exp, path)
 
@@ -148,15 +164,16 @@ class TestFileSeries(TestAttributeBase):
             )
 
             # then
-            def generate_expected_call(wait, step):
+            def generate_expected_call(wait, steps):
                 log_operation = LogImages(
                     path=path,
                     values=[
                         LogImages.ValueType(
-                            value=ImageValue(base64_encode(file.content), None, "something"),
+                            value=self._blob_image_value(file.content, description="something"),
                             step=step,
                             ts=self._now(),
                         )
+                        for step in steps
                     ],
                 )
                 return call(
@@ -166,16 +183,99 @@ class TestFileSeries(TestAttributeBase):
 
             op_processor.enqueue_operation.assert_has_calls(
                 [
-                    generate_expected_call(wait, step=3),
-                    generate_expected_call(wait, step=None),
-                    generate_expected_call(wait, step=None),
+                    generate_expected_call(wait, steps=[3]),
+                    generate_expected_call(wait, steps=[None, None]),
                 ]
             )
 
+    def test_log_content_without_blob_storage(self):
+        # given
+        wait = self._random_wait()
+        path = self._random_path()
+        op_processor = MagicMock(blob_storage=None)
+        exp = self._create_run(processor=op_processor)
+        attr = FileSeries(exp, path)
+
+        file = File.as_image(numpy.random.rand(10, 10) * 255)
+
+        # when
+        attr.log(file, step=3, timestamp=self._now(), wait=wait)
+
+        # then
+        op_processor.enqueue_operation.assert_called_once_with(
+            LogImages(
+                path,
+                [LogImages.ValueType(ImageValue(base64_encode(file.content), None, None), 3, self._now())],
+            ),
+            wait,
+        )
+
+    def test_log_stores_image_once(self):
+        # given
+        path = self._random_path()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
+        exp = self._create_run(processor=op_processor)
+        attr = FileSeries(exp, path)
+
+        file = File.as_image(numpy.random.rand(10, 10) * 255)
+
+        # when
+        attr.log([file, file])
+
+        # then
+        ((op, _),) = [c.args for c in op_processor.enqueue_operation.call_args_list]
+        first_blob, second_blob = op.blob_paths()
+        self.assertEqual(first_blob, second_blob)
+        self.assertEqual(1, len(list(self._blob_storage.dir_path.iterdir())))
+        # queued operations reference blobs relative to the execution directory
+        op.resolve_blob_paths(self._blob_storage.base_path)
+        self.assertEqual(base64_encode(file.content), op.values[0].value.get_data())
+
+    def test_extend_encodes_images_in_batches(self):
+        # given
+        path = self._random_path()
+        op_processor = MagicMock(blob_storage=None)
+        exp = self._create_run(processor=op_processor)
+        attr = FileSeries(exp, path)
+
+        images = [Image.fromarray(numpy.full((10, 10), i * 10, dtype=numpy.uint8)) for i in range(20)]
+
+        # when
+        attr.extend(images, steps=list(range(20)), timestamps=[self._now()] * 20)
+
+        # then
+        ops = [c.args[0] for c in op_processor.enqueue_operation.call_args_list]
+        self.assertEqual([16, 4], [len(op.values) for op in ops])
+        values = [value for op in ops for value in op.values]
+        self.assertEqual(list(range(20)), [value.step for value in values])
+        self.assertEqual(
+            [base64_encode(File.as_image(image).content) for image in images],
+            [value.value.data for value in values],
+        )
+
+    def test_operations_are_limited_by_size(self):
+        # given
+        path = self._random_path()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
+        exp = self._create_run(processor=op_processor)
+        attr = FileSeries(exp, path)
+
+        files = [File.as_image(numpy.random.rand(10, 10) * 255) for _ in range(5)]
+        max_batch_bytes = 2 * max(len(file.content) for file in files)
+
+        # when
+        with patch.object(FileSeries, "max_batch_bytes", max_batch_bytes):
+            attr.extend(files, steps=list(range(5)))
+
+        # then
+        ops = [c.args[0] for c in op_processor.enqueue_operation.call_args_list]
+        self.assertEqual([2, 2, 1], [len(op.values) for op in ops])
+        self.assertEqual(list(range(5)), [value.step for op in ops for value in op.values])
+
     def test_log_raise_not_image(self):
         # given
         path = self._random_path()
-        op_processor = MagicMock()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
         exp = self._create_run(processor=op_processor)
         attr = FileSeries(exp, path)
 
@@ -192,10 +292,25 @@ class TestFileSeries(TestAttributeBase):
             with self.assertRaises(OperationNotSupported):
                 attr.log(stream)
 
+    def test_extend_releases_blobs_when_an_image_is_invalid(self):
+        # given
+        op_processor = MagicMock(blob_storage=self._blob_storage)
+        exp = self._create_run(processor=op_processor)
+        attr = FileSeries(exp, self._random_path())
+        image = File.as_image(numpy.random.rand(10, 10))
+
+        # when
+        with self.assertRaises(OperationNotSupported):
+            attr.extend([image, File.from_content("some text")])
+
+        # then
+        op_processor.enqueue_operation.assert_not_called()
+        self.assertEqual([], list(self._blob_storage.dir_path.iterdir()))
+
     def test_assign_raise_not_image(self):
         # given
         path = self._random_path()
-        op_processor = MagicMock()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
         exp = self._create_run(processor=op_processor)
         attr = FileSeries(exp, path)
 
@@ -217,11 +332,11 @@ class TestFileSeries(TestAttributeBase):
         """Test if we prohibit logging images greater than mocked 1KB limit size"""
         # given
         path = self._random_path()
-        op_processor = MagicMock()
+        op_processor = MagicMock(blob_storage=self._blob_storage)
         exp = self._create_run(processor=op_processor)
         attr = FileSeries(exp, path)
 
-        file = File.as_image(numpy.random.rand(100, 100) * 255)
+        file = File.as_image(numpy.random.rand(100, 100))
         with create_file(file.content, binary_mode=True) as tmp_filename:
             saved_file = File(tmp_filename)
 
@@ -230,3 +345,46 @@ class TestFileSeries(TestAttributeBase):
                 attr.assign([file])
             with pytest.warns(expected_warning=UserWarning, match=".* Neptune supports logging images smaller than .*"):
                 attr.assign([saved_file])
+
+    def test_download(self):
+        # given
+        container = MagicMock()
+        backend = container._backend
+        backend.get_image_series_values.return_value = MagicMock(totalItemCount=10)
+        downloaded = []
+
+        def download_file_series_by_index(container_id, container_type, path, index, destination):
+            downloaded.append(index)
+            with open(os.path.join(destination, f"{index}.png"), "wb"):
+                pass
+
+        backend.download_file_series_by_index.side_effect = download_file_series_by_index
+        attr = FileSeries(container, self._random_path())
+
+        with TemporaryDirectory() as destination:
+            for name in ("2.png", ".4.png.part"):
+                with open(os.path.join(destination, name), "wb"):
+                    pass
+
+            # when
+            attr.download(destination, start=1, end=-2, workers=3)
+
+            # then
+            self.assertEqual([1, 3, 4, 5, 6, 7], sorted(downloaded))
+
+            # when
+            downloaded.clear()
+            attr.download(destination, step=3)
+
+            # then
+            self.assertEqual([0, 9], sorted(downloaded))
+
+            # when
+            downloaded.clear()
+            attr.download(destination, start=-2, skip_existing=False)
+
+            # then
+            self.assertEqual([8, 9], sorted(downloaded))
+
+        with self.assertRaises(ValueError):
+            attr.download(None, step=0)
@@ -13,12 +13,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
+from datetime import datetime
+from tempfile import TemporaryDirectory
+
+import numpy
+import pandas
 from mock import (
     MagicMock,
+    call,
     patch,
 )
 
+from neptune.new.attributes.series.aggregation import SeriesAggregation
 from neptune.new.attributes.series.float_series import FloatSeries
+from neptune.new.envs import (
+    NEPTUNE_SERIES_CACHE,
+    NEPTUNE_SERIES_CACHE_DIR,
+)
+from neptune.new.internal.operation import (
+    ClearFloatLog,
+    LogFloatColumns,
+    LogFloats,
+)
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
 
@@ -51,3 +68,203 @@ class TestFloatSeries(TestAttributeBase):
         values = list(var.fetch_values()["value"].array)
         expected = list(range(0, 5000))
         self.assertEqual(len(set(expected)), len(set(values)))
+
+    def test_extend_array(self):
+        processor = MagicMock()
+        exp, path, wait = self._create_run(processor), self._random_path(), self._random_wait()
+        var = FloatSeries(exp, path)
+
+        var.extend(numpy.arange(250, dtype=numpy.int32), steps=numpy.arange(250) * 2, wait=wait)
+
+        processor.enqueue_operation.assert_has_calls(
+            [
+                call(
+                    LogFloatColumns(
+                        path,
+                        values=[float(i) for i in range(start, min(start + 100, 250))],
+                        steps=[float(2 * i) for i in range(start, min(start + 100, 250))],
+                        timestamps=[self._now()] * (min(start + 100, 250) - start),
+                    ),
+                    wait,
+                )
+                for start in (0, 100, 200)
+            ]
+        )
+        self.assertEqual(3, processor.enqueue_operation.call_count)
+
+    def test_extend_pandas_series_with_timestamps(self):
+        exp, path = self._create_run(), self._random_path()
+        var = FloatSeries(exp, path)
+
+        var.extend(pandas.Series([1.5, 2.5, 3.5]), timestamps=numpy.array([100.0, 200.0, 300.0]))
+
+        self.assertEqual([1.5, 2.5, 3.5], list(var.fetch_values()["value"].array))
+        self.assertEqual(3.5, var.fetch_last())
+
+    def test_extend_array_skips_non_finite_values(self):
+        processor = MagicMock()
+        exp, path = self._create_run(processor), self._random_path()
+        var = FloatSeries(exp, path)
+
+        var.extend(numpy.array([1.0, numpy.nan, 3.0, numpy.inf]), steps=numpy.array([1, 2, 3, 4]))
+
+        processor.enqueue_operation.assert_called_once_with(
+            LogFloatColumns(path, values=[1.0, 3.0], steps=[1.0, 3.0], timestamps=[self._now()] * 2), False
+        )
+
+    def test_extend_array_validation(self):
+        var = FloatSeries(self._create_run(MagicMock()), self._random_path())
+
+        with self.assertRaises(ValueError):
+            var.extend(numpy.arange(3), steps=numpy.array([1, 3, 2]))
+        with self.assertRaises(ValueError):
+            var.extend(numpy.arange(3), steps=numpy.arange(4))
+        with self.assertRaises(ValueError):
+            var.extend(numpy.arange(3), timestamps=numpy.array([1.0, numpy.nan, 2.0]))
+        with self.assertRaises(ValueError):
+            var.extend(numpy.ones((2, 2)))
+        with self.assertRaises(TypeError):
+            var.extend(numpy.array(["a", "b"]))
+
+    def test_extend_list_skips_non_finite_values(self):
+        processor = MagicMock()
+        exp, path = self._create_run(processor), self._random_path()
+        var = FloatSeries(exp, path)
+
+        var.extend([1.0, float("nan"), 3.0, float("inf")], steps=[1, 2, 3, 4])
+        var.append(float("-inf"))
+        var.log(float("nan"), step=5)
+
+        processor.enqueue_operation.assert_called_once_with(
+            LogFloats(path, [LogFloats.ValueType(1.0, 1, self._now()), LogFloats.ValueType(3.0, 3, self._now())]),
+            False,
+        )
+
+    def test_extend_list_validation(self):
+        var = FloatSeries(self._create_run(MagicMock()), self._random_path())
+
+        with self.assertRaises(ValueError):
+            var.extend([0, 1, 2], steps=[1, 3, 2])
+        with self.assertRaises(ValueError):
+            var.extend([0, 1], steps=[1, 1])
+        with self.assertRaises(ValueError):
+            var.extend([0, 1, 2], steps=[1, float("nan"), 3])
+        with self.assertRaises(ValueError):
+            var.extend([0, 1, 2], timestamps=[1.0, float("nan"), 2.0])
+
+    def test_aggregate(self):
+        processor = MagicMock()
+        exp, path = self._create_run(processor), self._random_path()
+        var = FloatSeries(exp, path)
+        var.configure(aggregate=SeriesAggregation("mean", window=4))
+
+        var.extend([1, 2, 3, 4, 5, 6], steps=[1, 2, 3, 4, 5, 6])
+        var.log(10, step=7)
+
+        processor.enqueue_operation.assert_called_once_with(
+            LogFloats(path, [LogFloats.ValueType(2.5, 4, self._now())]), False
+        )
+
+        exp.wait()
+
+        processor.enqueue_operation.assert_called_with(
+            LogFloats(path, [LogFloats.ValueType(7.0, 7, self._now())]), False
+        )
+        self.assertEqual(2, processor.enqueue_operation.call_count)
+
+    def test_aggregate_clear_drops_buffered_values(self):
+        processor = MagicMock()
+        exp, path = self._create_run(processor), self._random_path()
+        var = FloatSeries(exp, path)
+        var.configure(aggregate="max")
+
+        var.extend(numpy.array([1.0, 2.0]))
+        var.clear()
+        var.log(3)
+        exp.stop()
+
+        processor.enqueue_operation.assert_has_calls(
+            [
+                call(ClearFloatLog(path), False),
+                call(LogFloats(path, [LogFloats.ValueType(3.0, None, self._now())]), False),
+            ]
+        )
+        self.assertEqual(2, processor.enqueue_operation.call_count)
+
+    def test_aggregate_off(self):
+        processor = MagicMock()
+        exp, path = self._create_run(processor), self._random_path()
+        var = FloatSeries(exp, path)
+        var.configure(aggregate="last")
+        var.extend([1, 2])
+
+        var.configure(aggregate=False)
+        var.log(3)
+
+        processor.enqueue_operation.assert_has_calls(
+            [
+                call(LogFloats(path, [LogFloats.ValueType(2.0, None, self._now())]), False),
+                call(LogFloats(path, [LogFloats.ValueType(3.0, None, self._now())]), False),
+            ]
+        )
+
+    def test_fetch_values_in_pages(self):
+        exp, path = self._create_run(), self._random_path()
+        var = FloatSeries(exp, path)
+        var.extend([float(value) for value in range(25)])
+
+        with patch.object(exp._backend, "get_float_series_values", wraps=exp._backend.get_float_series_values) as get:
+            values = var.fetch_values(page_size=10)
+
+        self.assertEqual(["step", "value", "timestamp"], list(values.columns))
+        self.assertEqual(list(range(25)), list(values["step"]))
+        self.assertEqual([float(value) for value in range(25)], list(values["value"]))
+        self.assertEqual(
+            [datetime.fromtimestamp(42.342)] * 25, [timestamp.to_pydatetime() for timestamp in values["timestamp"]]
+        )
+        self.assertEqual([0, 10, 20], sorted(args[3] for args, _ in get.call_args_list))
+        self.assertEqual(["step", "value"], list(var.fetch_values(include_timestamp=False).columns))
+
+    def test_iter_values(self):
+        exp, path = self._create_run(), self._random_path()
+        var = FloatSeries(exp, path)
+        var.extend([float(value) for value in range(25)])
+
+        pages = list(var.iter_values(include_timestamp=False, page_size=10))
+
+        self.assertEqual([10, 10, 5], [len(page) for page in pages])
+        self.assertEqual([float(value) for value in range(25)], list(pandas.concat(pages)["value"]))
+        with self.assertRaises(ValueError):
+            next(var.iter_values(page_size=0))
+
+    def test_fetch_values_of_empty_series(self):
+        var = FloatSeries(self._create_run(), self._random_path())
+        var.log(1.0)
+        var.clear()
+
+        self.assertTrue(var.fetch_values().empty)
+
+    def test_fetch_values_with_cache(self):
+        exp, path = self._create_run(), self._random_path()
+        var = FloatSeries(exp, path)
+        var.extend([float(value) for value in range(25)])
+
+        with TemporaryDirectory() as cache_dir, patch.dict(
+            "os.environ", {NEPTUNE_SERIES_CACHE: "True", NEPTUNE_SERIES_CACHE_DIR: cache_dir}
+        ), patch.object(exp._backend, "get_float_series_values", wraps=exp._backend.get_float_series_values) as get:
+            var.fetch_values(page_size=10)
+            var.extend([25.0, 26.0])
+            get.reset_mock()
+
+            values = var.fetch_values(page_size=10)
+
+            self.assertEqual([float(value) for value in range(27)], list(values["value"]))
+            self.assertEqual([24], [args[3] for args, _ in get.call_args_list])
+
+            var.clear()
+            self.assertEqual([], os.listdir(cache_dir))
+            var.extend([5.0, 6.0])
+            get.reset_mock()
+
+            self.assertEqual([5.0, 6.0], list(var.fetch_values(page_size=10)["value"]))
+            self.assertEqual([0], [args[3] for args, _ in get.call_args_list])
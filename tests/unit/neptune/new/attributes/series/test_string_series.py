@@ -15,10 +15,15 @@
 #
 from mock import (
     MagicMock,
+    call,
     patch,
 )
 
 from neptune.new.attributes.series.string_series import StringSeries
+from neptune.new.internal.operation import (
+    LogStringColumns,
+    LogStrings,
+)
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
 
@@ -45,3 +50,36 @@ class TestStringSeries(TestAttributeBase):
         values = list(var.fetch_values()["value"].array)
         expected = list(range(0, 5000))
         self.assertEqual(len(set(expected)), len(set(values)))
+
+    def test_stream(self):
+        op_processor = MagicMock()
+        exp, path = self._create_run(processor=op_processor), self._random_path()
+        var = StringSeries(exp, path)
+
+        var.configure(stream=True)
+        var.log(["a", "b"])
+        var.write("c\nd\n")
+        op_processor.enqueue_operation.assert_not_called()
+        exp.wait()
+
+        op_processor.enqueue_operation.assert_called_once_with(
+            LogStringColumns(path, ["a", "b", "c", "d"], None, [self._now()] * 4), False
+        )
+
+    def test_stream_off_sends_buffered_values(self):
+        op_processor = MagicMock()
+        exp, path = self._create_run(processor=op_processor), self._random_path()
+        var = StringSeries(exp, path)
+        var.configure(stream=True)
+        var.write("line\nunfinished")
+
+        var.configure(stream=False)
+        var.log("next")
+
+        self.assertEqual(
+            [
+                call(LogStringColumns(path, ["line", "unfinished"], None, [self._now()] * 2), False),
+                call(LogStrings(path, [LogStrings.ValueType("next", None, self._now())]), False),
+            ],
+            op_processor.enqueue_operation.call_args_list,
+        )
@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+
+from mock import patch
+
+from neptune.new.attributes.series.string_series_stream import StringSeriesStream
+from neptune.new.internal.operation import LogStringColumns
+from neptune.new.types.series.string_series import MAX_STRING_SERIES_VALUE_LENGTH
+
+PATH = ["sys", "stdout"]
+
+
+def _values(ops):
+    return [value for op in ops for value in op.values]
+
+
+class TestStringSeriesStream(unittest.TestCase):
+    def test_text_is_split_into_lines(self):
+        stream = StringSeriesStream(PATH)
+
+        self.assertEqual([], stream.write("first", 1.0))
+        stream.write(" line\nsecond line\r\nthird", 2.0)
+        ops = stream.flush()
+
+        self.assertEqual([LogStringColumns(PATH, ["first line", "second line"], None, [1.0, 2.0])], ops)
+        self.assertEqual(["third"], _values(stream.flush(final=True)))
+
+    def test_redrawn_lines_are_collapsed(self):
+        stream = StringSeriesStream(PATH)
+
+        stream.write("\r 10%\r 50%\r", 1.0)
+        self.assertEqual([" 50%"], _values(stream.flush()))
+        stream.write("100%\r", 2.0)
+        stream.write("\n", 2.0)
+        stream.write("done\n", 3.0)
+
+        self.assertEqual(["100%", "done"], _values(stream.flush()))
+
+    def test_values_are_sent_in_batches(self):
+        stream = StringSeriesStream(PATH, interval=1.0, max_lines=3)
+
+        self.assertEqual([], stream.add([("a", 1.0, 10.0), ("b", None, 11.0)]))
+        ops = stream.add([("c", 3.0, 12.0), ("d", 4.0, 13.0)])
+
+        self.assertEqual(
+            [
+                LogStringColumns(PATH, ["a", "b", "c"], [1.0, None, 3.0], [10.0, 11.0, 12.0]),
+                LogStringColumns(PATH, ["d"], [4.0], [13.0]),
+            ],
+            ops,
+        )
+        self.assertFalse(stream.is_due())
+
+    def test_values_are_due_after_interval(self):
+        stream = StringSeriesStream(PATH, interval=1.0)
+
+        with patch("time.monotonic", return_value=100.0):
+            stream.add([("a", None, 10.0)])
+            self.assertFalse(stream.is_due())
+        with patch("time.monotonic", return_value=101.0):
+            self.assertTrue(stream.is_due())
+        self.assertEqual(["a"], _values(stream.flush()))
+        self.assertFalse(stream.is_due())
+
+    def test_long_lines_are_truncated(self):
+        stream = StringSeriesStream(PATH)
+
+        stream.write("x" * (MAX_STRING_SERIES_VALUE_LENGTH + 10), 1.0)
+
+        self.assertEqual(["x" * MAX_STRING_SERIES_VALUE_LENGTH], _values(stream.flush()))
+
+    def test_reset(self):
+        stream = StringSeriesStream(PATH)
+        stream.write("line\nunfinished", 1.0)
+
+        stream.reset()
+
+        self.assertEqual([], stream.flush(final=True))
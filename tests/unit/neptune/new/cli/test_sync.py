@@ -14,20 +14,31 @@
 # limitations under the License.
 #
 
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 
 from neptune.new.cli.sync import SyncRunner
 from neptune.new.cli.utils import get_qualified_name
+from neptune.new.constants import OFFLINE_DIRECTORY
 from neptune.new.internal.container_type import ContainerType
-from neptune.new.internal.operation import Operation
+from neptune.new.internal.disk_queue import DiskQueue
+from neptune.new.internal.operation import (
+    ImageValue,
+    LogImages,
+    Operation,
+)
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
+from neptune.new.internal.utils import base64_encode
 from tests.unit.neptune.new.cli.utils import (
+    OPERATIONS,
     execute_operations,
     generate_get_metadata_container,
     prepare_deprecated_run,
     prepare_metadata_container,
 )
+from tests.unit.neptune.new.utils.api_experiments_factory import api_metadata_container
 
 
 @pytest.fixture(name="backend")
@@ -51,7 +62,6 @@ def test_sync_all_runs(tmp_path, mocker, capsys, backend, sync_runner, container
 
     # and
     mocker.patch.object(backend, "get_metadata_container", get_container_impl)
-    mocker.patch.object(Operation, "from_dict", lambda x: x)
 
     # when
     sync_runner.sync_all_containers(tmp_path, "foo")
@@ -72,7 +82,7 @@ def test_sync_all_runs(tmp_path, mocker, capsys, backend, sync_runner, container
     # and
     backend.execute_operations.has_calls(
         [
-            mocker.call(unsynced_container.id, ContainerType.RUN, ["op-1", "op-2"]),
+            mocker.call(unsynced_container.id, ContainerType.RUN, OPERATIONS[1:]),
         ],
         any_order=True,
     )
@@ -90,7 +100,6 @@ def test_sync_all_offline_runs(tmp_path, mocker, capsys, backend, sync_runner):
         "_register_offline_container",
         lambda project, container_type: offline_run,
     )
-    mocker.patch.object(Operation, "from_dict", lambda x: x)
 
     # when
     sync_runner.sync_all_containers(tmp_path, "foo")
@@ -105,12 +114,39 @@ def test_sync_all_offline_runs(tmp_path, mocker, capsys, backend, sync_runner):
     # and
     backend.execute_operations.has_calls(
         [
-            mocker.call(offline_run.id, ContainerType.RUN, ["op-1", "op-2"]),
+            mocker.call(offline_run.id, ContainerType.RUN, OPERATIONS[1:]),
         ],
         any_order=True,
     )
 
 
+def test_sync_offline_run_with_images(tmp_path, mocker, backend, sync_runner):
+    # given
+    offline_run = api_metadata_container(ContainerType.RUN)
+    run_path = tmp_path / OFFLINE_DIRECTORY / f"run__{offline_run.id}"
+    blob_path = BlobStorage(run_path / "blobs").put(b"image content")
+    with DiskQueue(run_path, lambda x: x.to_dict(), Operation.from_dict, threading.RLock()) as queue:
+        queue.put(LogImages(["images"], [LogImages.ValueType(ImageValue(None, None, None, blob_path), 1, 1.0)]))
+
+    # and
+    uploaded = []
+
+    def execute_images(container_id, container_type, operations):
+        uploaded.extend(value.value.get_data() for op in operations for value in op.values)
+        return len(operations), []
+
+    backend.execute_operations.side_effect = execute_images
+    mocker.patch.object(backend, "get_metadata_container", generate_get_metadata_container((offline_run,)))
+    mocker.patch.object(sync_runner, "_register_offline_container", lambda project, container_type: offline_run)
+
+    # when
+    sync_runner.sync_all_containers(tmp_path, "foo")
+
+    # then the offline directory was moved before syncing, with the blobs
+    assert uploaded == [base64_encode(b"image content")]
+    assert not run_path.exists()
+
+
 def test_sync_selected_runs(tmp_path, mocker, capsys, backend, sync_runner):
     # given
     unsync_exp = prepare_metadata_container(
@@ -137,7 +173,6 @@ def test_sync_selected_runs(tmp_path, mocker, capsys, backend, sync_runner):
         "_register_offline_container",
         lambda project, container_type: offline_run,
     )
-    mocker.patch.object(Operation, "from_dict", lambda x: x)
 
     # when
     sync_runner.sync_selected_containers(
@@ -174,12 +209,12 @@ def test_sync_selected_runs(tmp_path, mocker, capsys, backend, sync_runner):
             mocker.call(
                 sync_exp.id,
                 ContainerType.RUN,
-                operations=["op-1", "op-2"],
+                operations=OPERATIONS[1:],
             ),
             mocker.call(
                 offline_run.id,
                 ContainerType.RUN,
-                operations=["op-0", "op-1", "op-2"],
+                operations=OPERATIONS,
             ),
         ],
         any_order=True,
@@ -201,7 +236,6 @@ def test_sync_deprecated_runs(tmp_path, mocker, capsys, backend, sync_runner):
         "_register_offline_container",
         lambda project, container_type: offline_old_run,
     )
-    mocker.patch.object(Operation, "from_dict", lambda x: x)
 
     # when
     sync_runner.sync_all_containers(tmp_path, "foo")
@@ -225,12 +259,12 @@ def test_sync_deprecated_runs(tmp_path, mocker, capsys, backend, sync_runner):
             mocker.call(
                 deprecated_unsynced_run.id,
                 ContainerType.RUN,
-                operations=["op-1", "op-2"],
+                operations=OPERATIONS[1:],
             ),
             mocker.call(
                 offline_old_run.id,
                 ContainerType.RUN,
-                operations=["op-0", "op-1", "op-2"],
+                operations=OPERATIONS,
             ),
         ],
         any_order=True,
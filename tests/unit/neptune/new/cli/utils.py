@@ -27,12 +27,18 @@ from neptune.new.exceptions import MetadataContainerNotFound
 from neptune.new.internal.backends.api_model import ApiExperiment
 from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.disk_queue import DiskQueue
+from neptune.new.internal.operation import (
+    AssignString,
+    Operation,
+)
 from neptune.new.internal.utils.sync_offset_file import SyncOffsetFile
 from tests.unit.neptune.new.utils.api_experiments_factory import (
     api_metadata_container,
     api_run,
 )
 
+OPERATIONS = [AssignString(["key"], f"op-{index}") for index in range(3)]
+
 
 def generate_get_metadata_container(registered_containers):
     def get_metadata_container(container_id, expected_container_type: ContainerType):
@@ -56,13 +62,12 @@ def _prepare_disk_queue(*, exp_path, last_ack_version):
     exp_path.mkdir(parents=True)
     queue = DiskQueue(
         dir_path=exp_path,
-        to_dict=lambda x: x,
-        from_dict=lambda x: x,
+        to_dict=lambda x: x.to_dict(),
+        from_dict=Operation.from_dict,
         lock=threading.RLock(),
     )
-    queue.put("op-0")
-    queue.put("op-1")
-    queue.put("op-2")
+    for op in OPERATIONS:
+        queue.put(op)
 
     SyncOffsetFile(exp_path / "last_put_version").write(3)
     if last_ack_version is not None:
@@ -14,11 +14,13 @@
 # limitations under the License.
 #
 import os
+import tempfile
 import uuid
 from abc import abstractmethod
 from datetime import datetime
 from typing import List
 
+import pandas as pd
 from mock import (
     Mock,
     patch,
@@ -119,6 +121,7 @@ class AbstractTablesTestMixin:
         self.assertEqual(12.5, df["float"][1])
         self.assertEqual("some text", df["string"][1])
         self.assertEqual(now, df["datetime"][1])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["datetime"]))
         self.assertEqual(8.7, df["float/series"][1])
         self.assertEqual("last text", df["string/series"][1])
         self.assertEqual("a,b", df["string/set"][1])
@@ -131,6 +134,152 @@ class AbstractTablesTestMixin:
         with self.assertRaises(KeyError):
             self.assertTrue(df["image/series"])
 
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_as_pandas_dtypes(self, search_leaderboard_entries):
+        # given
+        def entry(index, *attributes):
+            return LeaderboardEntry(
+                str(uuid.uuid4()),
+                [AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value=f"ID-{index}")), *attributes],
+            )
+
+        search_leaderboard_entries.return_value = [
+            entry(
+                0,
+                AttributeWithProperties("epochs", AttributeType.INT, Mock(value=10)),
+                AttributeWithProperties("batch", AttributeType.INT, Mock(value=32)),
+                AttributeWithProperties("flag", AttributeType.BOOL, Mock(value=True)),
+                AttributeWithProperties("mixed", AttributeType.INT, Mock(value=1)),
+            ),
+            entry(
+                1,
+                AttributeWithProperties("epochs", AttributeType.INT, Mock(value=20)),
+                AttributeWithProperties("flag", AttributeType.BOOL, Mock(value=False)),
+                AttributeWithProperties("mixed", AttributeType.STRING, Mock(value="a")),
+            ),
+        ]
+
+        # when
+        df = self.get_table().to_pandas()
+
+        # then
+        self.assertEqual(["sys/id", "batch", "epochs", "flag", "mixed"], list(df.columns))
+        self.assertEqual(["ID-0", "ID-1"], list(df["sys/id"]))
+        self.assertEqual("int64", df["epochs"].dtype)
+        self.assertEqual([10, 20], list(df["epochs"]))
+        self.assertEqual("float64", df["batch"].dtype)
+        self.assertEqual(32.0, df["batch"][0])
+        self.assertTrue(pd.isna(df["batch"][1]))
+        self.assertEqual("bool", df["flag"].dtype)
+        self.assertEqual([1, "a"], list(df["mixed"]))
+
+    @staticmethod
+    def build_entries(count: int) -> List[LeaderboardEntry]:
+        return [
+            LeaderboardEntry(
+                f"uuid-{index}",
+                [
+                    AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value=f"ID-{index}")),
+                    AttributeWithProperties("epochs", AttributeType.INT, Mock(value=index)),
+                ],
+            )
+            for index in range(count)
+        ]
+
+    @patch.object(NeptuneBackendMock, "iter_leaderboard_entries")
+    def test_iter_table_batches(self, iter_leaderboard_entries):
+        # given
+        entries = self.build_entries(7)
+        fetched_pages = []
+
+        def pages():
+            for start in range(0, len(entries), 3):
+                fetched_pages.append(start)
+                yield entries[start : start + 3]
+
+        iter_leaderboard_entries.return_value = pages()
+
+        # when
+        table = self.get_table()
+        batches = table.iter_batches(batch_size=2)
+        first_batch = next(batches)
+
+        # then
+        self.assertEqual(["ID-0", "ID-1"], [row["sys/id"].get() for row in first_batch.to_rows()])
+        self.assertEqual([0], fetched_pages)
+
+        # when
+        rest = [list(batch.to_pandas()["sys/id"]) for batch in batches]
+
+        # then
+        self.assertEqual([["ID-2", "ID-3"], ["ID-4", "ID-5"], ["ID-6"]], rest)
+        self.assertEqual([0, 3, 6], fetched_pages)
+        self.assertEqual([f"ID-{index}" for index in range(7)], [row["sys/id"].get() for row in table.iter_rows()])
+        self.assertEqual(list(range(7)), list(table.to_pandas()["epochs"]))
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_as_arrow(self, search_leaderboard_entries):
+        # given
+        now = datetime.now()
+        entries = self.build_entries(2)
+        entries[0].attributes.extend(self.build_attributes_leaderboard(now))
+        search_leaderboard_entries.return_value = entries
+
+        # when
+        table = self.get_table().to_arrow()
+
+        # then
+        self.assertEqual(2, table.num_rows)
+        self.assertEqual("string", str(table.schema.field("sys/id").type))
+        self.assertEqual("int64", str(table.schema.field("epochs").type))
+        self.assertEqual("double", str(table.schema.field("float").type))
+        self.assertEqual([12.5, None], table.column("float").to_pylist())
+        self.assertEqual(["a,b", None], table.column("string/set").to_pylist())
+        self.assertEqual([now, None], table.column("datetime").to_pylist())
+        self.assertNotIn("file", table.column_names)
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    @patch.object(NeptuneBackendMock, "download_file")
+    def test_download_files(self, download_file, search_leaderboard_entries):
+        # given
+        entries = self.build_entries(4)
+        for entry in entries[:3]:
+            entry.attributes.append(AttributeWithProperties("data/predictions", AttributeType.FILE, None))
+        search_leaderboard_entries.return_value = entries
+
+        def download(container_id, container_type, path, destination):
+            if container_id == "uuid-1":
+                raise ConnectionError("connection reset")
+            with open(os.path.join(destination, "predictions.csv"), "w") as file:
+                file.write(container_id)
+
+        download_file.side_effect = download
+
+        with tempfile.TemporaryDirectory() as destination:
+            os.makedirs(os.path.join(destination, "ID-2", "data", "predictions"))
+            with open(os.path.join(destination, "ID-2", "data", "predictions", "predictions.csv"), "w"):
+                pass
+
+            # when
+            results = self.get_table().download_files("data/predictions", destination, workers=2)
+
+            # then
+            self.assertEqual(["ID-0", "ID-1", "ID-2", "ID-3"], [result.sys_id for result in results])
+            self.assertEqual(
+                [os.path.join(destination, f"ID-{index}", "data", "predictions") for index in range(4)],
+                [result.destination for result in results],
+            )
+            self.assertEqual([False, False, True, True], [result.skipped for result in results])
+            self.assertIsNone(results[0].error)
+            self.assertIsInstance(results[1].error, ConnectionError)
+            self.assertIsNone(results[3].error)
+            self.assertFalse(os.path.exists(os.path.join(destination, "ID-3")))
+            self.assertEqual(["predictions.csv"], os.listdir(results[0].destination))
+            self.assertEqual([], os.listdir(results[1].destination))
+            with open(os.path.join(results[0].destination, "predictions.csv")) as file:
+                self.assertEqual("uuid-0", file.read())
+            self.assertEqual(2, download_file.call_count)
+
     @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
     @patch.object(NeptuneBackendMock, "download_file")
     @patch.object(NeptuneBackendMock, "download_file_set")
@@ -15,8 +15,16 @@
 #
 import os
 import unittest
+from datetime import (
+    datetime,
+    timezone,
+)
+from tempfile import TemporaryDirectory
 
-from mock import patch
+from mock import (
+    Mock,
+    patch,
+)
 
 from neptune.common.exceptions import NeptuneException
 from neptune.new import (
@@ -31,7 +39,13 @@ from neptune.new.exceptions import NeptuneMissingProjectNameException
 from neptune.new.internal.backends.api_model import (
     Attribute,
     AttributeType,
+    AttributeWithProperties,
+    FloatPointValue,
+    FloatSeriesValues,
     IntAttribute,
+    LeaderboardEntry,
+    StringPointValue,
+    StringSeriesValues,
 )
 from neptune.new.internal.backends.neptune_backend_mock import NeptuneBackendMock
 from tests.unit.neptune.new.client.abstract_experiment_test_mixin import AbstractExperimentTestMixin
@@ -99,3 +113,141 @@ class TestClientProject(AbstractExperimentTestMixin, unittest.TestCase):
 
             self.assertEqual(42, project["some/variable"].fetch())
             self.assertNotIn(str(project._id), os.listdir(".neptune"))
+
+    @patch.object(NeptuneBackendMock, "get_string_series_values")
+    @patch.object(NeptuneBackendMock, "get_float_series_values")
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_series(self, search_leaderboard_entries, get_float_series_values, get_string_series_values):
+        search_leaderboard_entries.return_value = [
+            _leaderboard_entry(
+                "uuid-1", "SAN-1", {"loss": AttributeType.FLOAT_SERIES, "log": AttributeType.STRING_SERIES}
+            ),
+            _leaderboard_entry("uuid-2", "SAN-2", {"loss": AttributeType.FLOAT_SERIES}),
+        ]
+        float_values = {"uuid-1": [float(value) for value in range(25)], "uuid-2": [0.5, 1.5]}
+        get_float_series_values.side_effect = _series_pages(FloatSeriesValues, FloatPointValue, float_values)
+        get_string_series_values.side_effect = _series_pages(StringSeriesValues, StringPointValue, {"uuid-1": ["a"]})
+
+        with init_project(name=self.PROJECT_NAME, mode="read-only") as project:
+            long = project.fetch_series(["SAN-1", "SAN-2", "SAN-3"], ["loss", "log"], page_size=10)
+            wide = project.fetch_series(["SAN-2", "SAN-1", "SAN-2"], ["loss", "loss"], page_size=10, format="wide")
+            arrays = project.fetch_series("SAN-2", "loss", include_timestamp=False, format="dict")
+
+        self.assertEqual(["sys/id", "path", "step", "value", "timestamp"], list(long.columns))
+        self.assertEqual(
+            [("SAN-1", "loss")] * 25 + [("SAN-1", "log"), ("SAN-2", "loss"), ("SAN-2", "loss")],
+            list(zip(long["sys/id"], long["path"])),
+        )
+        self.assertEqual(float_values["uuid-1"] + ["a"] + float_values["uuid-2"], list(long["value"]))
+        self.assertEqual(["SAN-2", "SAN-1"], list(wide.columns))
+        self.assertEqual([0.5, 1.5], list(wide["SAN-2"].dropna()))
+        self.assertEqual(list(range(25)), list(wide.index))
+        self.assertEqual([("SAN-2", "loss")], list(arrays))
+        self.assertEqual([0.0, 1.0], list(arrays[("SAN-2", "loss")]["step"]))
+        self.assertEqual({"step", "value"}, set(arrays[("SAN-2", "loss")]))
+        self.assertEqual(["sys/id", "loss", "log"], search_leaderboard_entries.call_args_list[0][1]["columns"])
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_fetch_tables_with_filters(self, search_leaderboard_entries):
+        with init_project(name=self.PROJECT_NAME, mode="read-only") as project:
+            project.fetch_runs_table(
+                state="idle", filters=[("val/acc", ">", 0.9), ("epochs", "between", (5, 10), "integer")]
+            )
+            project.fetch_models_table(filters=[("info/size", "exists", "integer")])
+
+        runs_query, models_query = [str(call[1]["query"]) for call in search_leaderboard_entries.call_args_list]
+        self.assertIn('(`sys/state`:experimentState = "idle")', runs_query)
+        self.assertIn("(`val/acc`:float > 0.9) AND ((`epochs`:integer >= 5) AND (`epochs`:integer <= 10))", runs_query)
+        self.assertEqual("((`sys/trashed`:bool = false) AND (`info/size`:integer EXISTS))", models_query)
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    @patch.object(NeptuneBackendMock, "download_file")
+    def test_download_files(self, download_file, search_leaderboard_entries):
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(
+                "uuid-1",
+                [
+                    AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value="SAN-1")),
+                    AttributeWithProperties("predictions", AttributeType.FILE, None),
+                ],
+            )
+        ]
+
+        with TemporaryDirectory() as tmp_dir, init_project(name=self.PROJECT_NAME, mode="read-only") as project:
+            results = project.download_files("predictions", tmp_dir, state="idle")
+
+            self.assertEqual(["SAN-1"], [result.sys_id for result in results])
+            self.assertIsNone(results[0].error)
+            self.assertTrue(os.path.isdir(os.path.join(tmp_dir, "SAN-1", "predictions")))
+
+        self.assertEqual({"sys/id", "predictions"}, set(search_leaderboard_entries.call_args[1]["columns"]))
+        self.assertIn('(`sys/state`:experimentState = "idle")', str(search_leaderboard_entries.call_args[1]["query"]))
+        self.assertEqual("uuid-1", download_file.call_args[1]["container_id"])
+        self.assertEqual(["predictions"], download_file.call_args[1]["path"])
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_sync_runs_table(self, search_leaderboard_entries):
+        def run(container_id, sys_id, modified_minute, accuracy):
+            modification_time = datetime(2022, 10, 1, 12, modified_minute, tzinfo=timezone.utc)
+            return LeaderboardEntry(
+                container_id,
+                [
+                    AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value=sys_id)),
+                    AttributeWithProperties(
+                        "sys/modification_time", AttributeType.DATETIME, Mock(value=modification_time)
+                    ),
+                    AttributeWithProperties("acc", AttributeType.FLOAT, Mock(value=accuracy)),
+                    AttributeWithProperties("tags", AttributeType.STRING_SET, Mock(values=["a"])),
+                ],
+            )
+
+        with TemporaryDirectory() as tmp_dir, init_project(name=self.PROJECT_NAME, mode="read-only") as project:
+            snapshot_path = os.path.join(tmp_dir, "runs.sqlite")
+
+            search_leaderboard_entries.side_effect = [
+                [run("uuid-2", "SAN-2", 20, 0.5), run("uuid-1", "SAN-1", 10, 0.1)]
+            ]
+            initial = project.sync_runs_table(snapshot_path, columns=["acc", "tags"]).to_pandas()
+
+            # SAN-1 is trashed and SAN-2 is modified
+            search_leaderboard_entries.side_effect = [
+                [run("uuid-2", "SAN-2", 30, 0.7)],
+                [run("uuid-1", "SAN-1", 25, 0.1), run("uuid-2", "SAN-2", 30, 0.7)],
+            ]
+            synced = project.sync_runs_table(snapshot_path, columns=["acc", "tags"]).to_pandas()
+
+            search_leaderboard_entries.side_effect = [[run("uuid-3", "SAN-3", 40, 0.9)]]
+            replaced = project.sync_runs_table(snapshot_path, columns=["acc"]).to_pandas()
+
+        self.assertEqual(["sys/id", "acc", "tags"], list(initial.columns))
+        self.assertEqual(["SAN-1", "SAN-2"], list(initial["sys/id"]))
+        self.assertEqual(["a", "a"], list(initial["tags"]))
+        self.assertEqual(["SAN-2"], list(synced["sys/id"]))
+        self.assertEqual([0.7], list(synced["acc"]))
+        self.assertEqual(["SAN-3"], list(replaced["sys/id"]))
+
+        queries = [str(call[1]["query"]) for call in search_leaderboard_entries.call_args_list]
+        self.assertNotIn("sys/modification_time", queries[0])
+        self.assertIn('(`sys/modification_time`:datetime >= "2022-10-01T12:15:00.000Z")', queries[1])
+        self.assertIn("sys/trashed", queries[1])
+        self.assertEqual('(`sys/modification_time`:datetime >= "2022-10-01T12:15:00.000Z")', queries[2])
+        self.assertNotIn("sys/modification_time", queries[3])
+        self.assertEqual(
+            ["acc", "sys/id", "sys/modification_time", "tags"],
+            search_leaderboard_entries.call_args_list[0][1]["columns"],
+        )
+
+
+def _leaderboard_entry(container_id, sys_id, series_types):
+    attributes = [AttributeWithProperties("sys/id", AttributeType.STRING, Mock(value=sys_id))]
+    attributes.extend(AttributeWithProperties(path, attr_type, Mock()) for path, attr_type in series_types.items())
+    return LeaderboardEntry(container_id, attributes)
+
+
+def _series_pages(values_cls, point_cls, values_by_container):
+    def get_series_values(container_id, container_type, path, offset, limit):
+        values = values_by_container[container_id]
+        points = [point_cls(1000 * index, float(index), value) for index, value in enumerate(values)]
+        return values_cls(len(values), points[offset : offset + limit])
+
+    return get_series_values
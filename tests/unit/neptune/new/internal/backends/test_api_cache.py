@@ -0,0 +1,225 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import threading
+import unittest
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from bravado.requests_client import RequestsClient
+from bravado_core.spec import Spec
+from mock import patch
+
+from neptune.common.backends.api_model import MultipartConfig
+from neptune.new.envs import (
+    NEPTUNE_API_CACHE_DIR,
+    NEPTUNE_API_CACHE_TTL,
+)
+from neptune.new.exceptions import (
+    ClientHttpError,
+    Forbidden,
+    InternalServerError,
+)
+from neptune.new.internal.backends import utils
+from neptune.new.internal.backends.api_cache import ApiCache
+from neptune.new.internal.backends.api_model import (
+    ClientConfig,
+    VersionInfo,
+)
+from neptune.new.internal.backends.hosted_client import get_client_config
+from neptune.new.internal.credentials import Credentials
+
+API_TOKEN = (
+    "eyJhcGlfYWRkcmVzcyI6Imh0dHBzOi8vYXBwLnN0YWdlLm5lcHR1bmUubWwiLCJ"
+    "hcGlfa2V5IjoiOTJhNzhiOWQtZTc3Ni00ODlhLWI5YzEtNzRkYmI1ZGVkMzAyIn0="
+)
+
+SWAGGER_SPEC = {
+    "swagger": "2.0",
+    "info": {"title": "test", "version": "1.0"},
+    "basePath": "/api",
+    "paths": {},
+}
+
+
+class _SwaggerSpecHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    etag = '"spec-v1"'
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.headers.get("If-None-Match"))
+        if self.server.status != 200:
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(SWAGGER_SPEC).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestApiCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_entries_expire(self):
+        fresh_cache = ApiCache(Path(self.tmp_dir.name), ttl=3600)
+        stale_cache = ApiCache(Path(self.tmp_dir.name), ttl=0)
+
+        fresh_cache.put("kind", "https://app.neptune.ai/spec.json", {"a": 1}, etag='"x"')
+
+        entry = fresh_cache.get("kind", "https://app.neptune.ai/spec.json")
+        self.assertEqual({"a": 1}, entry.data)
+        self.assertEqual('"x"', entry.etag)
+        self.assertTrue(entry.fresh)
+        self.assertFalse(stale_cache.get("kind", "https://app.neptune.ai/spec.json").fresh)
+        self.assertIsNone(fresh_cache.get("kind", "https://other.neptune.ai/spec.json"))
+        self.assertIsNone(fresh_cache.get("other-kind", "https://app.neptune.ai/spec.json"))
+
+    def test_unreadable_entry_is_ignored(self):
+        cache = ApiCache(Path(self.tmp_dir.name), ttl=3600)
+        cache.put("kind", "url", {"a": 1})
+        for entry_path in Path(self.tmp_dir.name).iterdir():
+            entry_path.write_text("{not json")
+
+        self.assertIsNone(cache.get("kind", "url"))
+
+    def test_client_config_round_trip(self):
+        client_config = ClientConfig(
+            api_url="https://app.neptune.ai",
+            display_url="https://app.neptune.ai",
+            _missing_features=frozenset(["artifacts"]),
+            version_info=VersionInfo.build("0.16.0", "0.10.0", None),
+            multipart_config=MultipartConfig.get_default(),
+        )
+
+        self.assertEqual(client_config, ClientConfig.from_dict(json.loads(json.dumps(client_config.to_dict()))))
+
+    @patch("neptune.new.internal.backends.hosted_client._fetch_client_config")
+    def test_client_config_is_fetched_once(self, fetch_client_config):
+        fetch_client_config.return_value = ClientConfig(
+            api_url="https://app.neptune.ai",
+            display_url="https://app.neptune.ai",
+            _missing_features=frozenset(),
+            version_info=VersionInfo.build(None, None, None),
+            multipart_config=None,
+        )
+        credentials = Credentials.from_token(API_TOKEN)
+
+        with patch.dict("os.environ", {NEPTUNE_API_CACHE_DIR: self.tmp_dir.name}):
+            get_client_config.cache_clear()
+            first = get_client_config(credentials=credentials, ssl_verify=True, proxies={})
+            get_client_config.cache_clear()
+            second = get_client_config(credentials=credentials, ssl_verify=True, proxies={})
+        get_client_config.cache_clear()
+
+        self.assertEqual(first, second)
+        fetch_client_config.assert_called_once()
+
+
+class TestSwaggerSpecCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SwaggerSpecHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.status = 200
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.url = "http://127.0.0.1:{}/api/backend/swagger.json".format(self.server.server_address[1])
+        utils._swagger_specs.clear()
+        self.addCleanup(utils._swagger_specs.clear)
+
+    def _create_client(self):
+        return utils.create_swagger_client(self.url, RequestsClient())
+
+    def test_spec_is_reused_in_process(self):
+        with patch.dict("os.environ", {NEPTUNE_API_CACHE_DIR: self.tmp_dir.name}):
+            first = self._create_client()
+            second = self._create_client()
+
+        self.assertEqual([None], self.server.requests)
+        self.assertEqual(SWAGGER_SPEC["info"], first.swagger_spec.spec_dict["info"])
+        self.assertEqual(SWAGGER_SPEC["info"], second.swagger_spec.spec_dict["info"])
+
+    def test_built_spec_is_reused_with_other_http_clients(self):
+        http_client = RequestsClient()
+        other_http_client = RequestsClient()
+
+        with patch.object(Spec, "build", autospec=True, side_effect=Spec.build) as build:
+            first = utils.create_swagger_client(self.url, http_client)
+            second = utils.create_swagger_client(self.url, http_client)
+            other = utils.create_swagger_client(self.url, other_http_client)
+
+        build.assert_called_once()
+        self.assertIs(first.swagger_spec, second.swagger_spec)
+        self.assertIs(other_http_client, other.swagger_spec.http_client)
+        self.assertIs(http_client, first.swagger_spec.http_client)
+
+    def test_spec_is_fetched_with_timeout(self):
+        http_client = RequestsClient()
+        with patch.object(http_client.session, "get", wraps=http_client.session.get) as get:
+            utils.create_swagger_client(self.url, http_client)
+
+        self.assertIsNotNone(get.call_args[1]["timeout"])
+
+    def test_spec_fetch_errors(self):
+        for status, exception in ((404, ClientHttpError), (403, Forbidden), (501, InternalServerError)):
+            with self.subTest(status=status):
+                self.server.status = status
+                with self.assertRaises(exception):
+                    self._create_client()
+
+    def test_fresh_spec_is_read_from_disk(self):
+        with patch.dict("os.environ", {NEPTUNE_API_CACHE_DIR: self.tmp_dir.name}):
+            self._create_client()
+            utils._swagger_specs.clear()
+            swagger_client = self._create_client()
+
+        self.assertEqual([None], self.server.requests)
+        self.assertEqual("/api", swagger_client.swagger_spec.spec_dict["basePath"])
+
+    def test_stale_spec_is_revalidated_with_etag(self):
+        with patch.dict("os.environ", {NEPTUNE_API_CACHE_DIR: self.tmp_dir.name, NEPTUNE_API_CACHE_TTL: "0"}):
+            self._create_client()
+            utils._swagger_specs.clear()
+            swagger_client = self._create_client()
+
+        self.assertEqual([None, _SwaggerSpecHandler.etag], self.server.requests)
+        self.assertEqual("/api", swagger_client.swagger_spec.spec_dict["basePath"])
@@ -0,0 +1,103 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+
+from mock import patch
+
+from neptune.new.envs import (
+    NEPTUNE_HTTP_POOL_BLOCK,
+    NEPTUNE_HTTP_POOL_MAXSIZE,
+)
+from neptune.new.internal.backends.connection_pool import ConnectionPoolConfig
+from neptune.new.internal.backends.hosted_client import (
+    create_http_client,
+    get_connection_stats,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.accepted_connections += 1
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.accepted_connections = 0
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.url = "http://127.0.0.1:{}/".format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sequential_requests_reuse_connection(self):
+        http_client = create_http_client(ssl_verify=True, proxies={})
+
+        for _ in range(20):
+            self.assertEqual(200, http_client.session.get(self.url).status_code)
+
+        stats = get_connection_stats(http_client)
+        self.assertEqual(20, stats.requests)
+        self.assertEqual(1, stats.new_connections)
+        self.assertEqual(19, stats.reused_connections)
+        self.assertEqual(1, self.server.accepted_connections)
+
+    def test_concurrent_requests_are_bounded_by_blocking_pool(self):
+        http_client = create_http_client(
+            ssl_verify=True, proxies={}, pool_config=ConnectionPoolConfig(pool_maxsize=4, pool_block=True)
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(lambda _: http_client.session.get(self.url).status_code, range(200)))
+
+        self.assertEqual([200] * 200, statuses)
+        stats = get_connection_stats(http_client)
+        self.assertEqual(200, stats.requests)
+        self.assertLessEqual(stats.new_connections, 4)
+        self.assertLessEqual(self.server.accepted_connections, 4)
+
+    @patch.dict("os.environ", {NEPTUNE_HTTP_POOL_MAXSIZE: "7", NEPTUNE_HTTP_POOL_BLOCK: "true"})
+    def test_config_from_env(self):
+        config = ConnectionPoolConfig.from_env()
+
+        self.assertEqual(7, config.pool_maxsize)
+        self.assertTrue(config.pool_block)
+        self.assertTrue(config.keep_alive)
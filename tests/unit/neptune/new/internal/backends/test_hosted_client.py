@@ -50,6 +50,7 @@ from neptune.management.exceptions import (
     UserNotExistsOrWithoutAccess,
     WorkspaceNotFound,
 )
+from neptune.new.envs import NEPTUNE_API_CACHE
 from neptune.new.internal.backends.hosted_client import (
     _get_token_client,
     create_artifacts_client,
@@ -71,6 +72,7 @@ API_TOKEN = (
 @patch("neptune.new.internal.backends.hosted_client.RequestsClient", new=MagicMock())
 @patch("neptune.new.internal.backends.hosted_client.NeptuneAuthenticator", new=MagicMock())
 @patch("bravado.client.SwaggerClient.from_url")
+@patch.dict("os.environ", {NEPTUNE_API_CACHE: "False"})
 @patch("platform.platform", new=lambda: "testPlatform")
 @patch("platform.python_version", new=lambda: "3.9.test")
 class TestHostedClient(unittest.TestCase, BackendTestMixin):
@@ -35,6 +35,7 @@ from neptune.common.utils import IS_WINDOWS
 from neptune.new.internal.backends.api_model import ClientConfig
 from neptune.new.internal.backends.hosted_file_operations import (
     _get_content_disposition_filename,
+    _store_response_as_file,
     download_file_attribute,
     download_file_set_attribute,
     upload_file_attribute,
@@ -141,6 +142,32 @@ class TestCommonHostedFileOperations(HostedFileOperationsHelper):
         )
         store_response_mock.assert_called_once_with(download_raw.return_value, None)
 
+    def test_store_response_as_file(self):
+        # given
+        response_mock = MagicMock()
+        response_mock.iter_content.return_value = [b"some ", b"content"]
+
+        with TemporaryDirectory() as tmp_dir:
+            target_file = os.path.join(tmp_dir, "file.txt")
+
+            # when
+            _store_response_as_file(response_mock, target_file)
+
+            # then
+            self.assertEqual(["file.txt"], os.listdir(tmp_dir))
+            with open(target_file, "rb") as f:
+                self.assertEqual(b"some content", f.read())
+
+            # given
+            response_mock.iter_content.side_effect = ConnectionError("connection reset")
+
+            # when
+            with self.assertRaises(ConnectionError):
+                _store_response_as_file(response_mock, os.path.join(tmp_dir, "other.txt"))
+
+            # then
+            self.assertEqual(["file.txt"], os.listdir(tmp_dir))
+
 
 class TestNewUploadFileOperations(HostedFileOperationsHelper, BackendTestMixin):
     def __init__(self, *args, **kwargs):
@@ -19,7 +19,6 @@ import uuid
 from unittest.mock import call
 
 from bravado.exception import (
-    HTTPNotFound,
     HTTPPaymentRequired,
     HTTPUnprocessableEntity,
 )
@@ -29,7 +28,9 @@ from mock import (
 )
 from packaging.version import Version
 
+from neptune.new.envs import NEPTUNE_API_CACHE
 from neptune.new.exceptions import (
+    ArtifactUploadingError,
     CannotResolveHostname,
     FileUploadError,
     MetadataInconsistency,
@@ -45,13 +46,17 @@ from neptune.new.internal.backends.hosted_client import (
     create_leaderboard_client,
     get_client_config,
 )
-from neptune.new.internal.backends.hosted_neptune_backend import HostedNeptuneBackend
+from neptune.new.internal.backends.hosted_neptune_backend import (
+    MAX_SERVER_OFFSET,
+    HostedNeptuneBackend,
+)
 from neptune.new.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
 from neptune.new.internal.backends.utils import verify_host_resolution
 from neptune.new.internal.container_type import ContainerType
 from neptune.new.internal.credentials import Credentials
 from neptune.new.internal.operation import (
     AssignString,
+    DeleteAttribute,
     LogFloats,
     TrackFilesToArtifact,
     UploadFile,
@@ -72,6 +77,7 @@ credentials = Credentials.from_token(API_TOKEN)
 @patch("neptune.new.internal.backends.hosted_client.RequestsClient", new=MagicMock())
 @patch("neptune.new.internal.backends.hosted_client.NeptuneAuthenticator", new=MagicMock())
 @patch("bravado.client.SwaggerClient.from_url")
+@patch.dict("os.environ", {NEPTUNE_API_CACHE: "False"})
 @patch("platform.platform", new=lambda: "testPlatform")
 @patch("platform.python_version", new=lambda: "3.9.test")
 class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
@@ -283,6 +289,71 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                     any_order=True,
                 )
 
+    @patch("neptune.new.internal.backends.hosted_neptune_backend.upload_file_attribute")
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_skip_upload_of_unchanged_file(self, upload_mock, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        upload_mock.return_value = None
+        content = b"some: config"
+
+        def upload(file_content: bytes, path=("config",)):
+            backend.execute_operations(
+                container_id=container_uuid,
+                container_type=ContainerType.RUN,
+                operations=[UploadFileContent(path=list(path), ext="yaml", file_content=base64_encode(file_content))],
+            )
+
+        # when
+        upload(content)
+        upload(content)
+
+        # then
+        self.assertEqual(1, upload_mock.call_count)
+        self.assertEqual(1, backend._upload_cache.stats.skipped_uploads)
+        self.assertEqual(len(content), backend._upload_cache.stats.saved_bytes)
+
+        # when
+        upload(b"some: other config")
+        upload(content)
+
+        # then
+        self.assertEqual(3, upload_mock.call_count)
+
+        # when
+        backend.execute_operations(
+            container_id=container_uuid,
+            container_type=ContainerType.RUN,
+            operations=[DeleteAttribute(["config"])],
+        )
+        upload(content)
+
+        # then
+        self.assertEqual(4, upload_mock.call_count)
+
+    @patch("neptune.new.internal.backends.hosted_neptune_backend.upload_file_attribute")
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_upload_is_repeated_after_failure(self, upload_mock, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        upload_mock.return_value = [FileUploadError("config", "error")]
+        operation = UploadFileContent(path=["config"], ext="yaml", file_content=base64_encode(b"some: config"))
+
+        # when
+        for _ in range(2):
+            backend.execute_operations(
+                container_id=container_uuid,
+                container_type=ContainerType.RUN,
+                operations=[operation],
+            )
+
+        # then
+        self.assertEqual(2, upload_mock.call_count)
+
     @patch("neptune.new.internal.backends.hosted_neptune_backend.track_to_new_artifact")
     @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
     def test_track_to_new_artifact(self, track_to_new_artifact_mock, swagger_client_factory):
@@ -295,7 +366,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
         response_error = MagicMock()
         response_error.errorDescription = "error1"
         swagger_client.api.executeOperations.return_value.response.return_value.result = [response_error]
-        swagger_client.api.getArtifactAttribute.side_effect = HTTPNotFound(response=response_mock())
+        swagger_client.api.getExperimentAttributes.return_value.response.return_value.result.attributes = []
         swagger_client_wrapper = SwaggerClientWrapper(swagger_client)
 
         for container_type in self.container_types:
@@ -383,7 +454,9 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
         response_error = MagicMock()
         response_error.errorDescription = "error1"
         swagger_client.api.executeOperations.return_value.response.return_value.result = [response_error]
-        swagger_client.api.getArtifactAttribute.return_value.response.return_value.result.hash = "dummyHash"
+        swagger_client.api.getExperimentAttributes.return_value.response.return_value.result.attributes = [
+            self._artifact_attribute(path, "dummyHash") for path in ("sub/one", "sub/two", "sub/three")
+        ] + [MagicMock(type="string")]
         swagger_client_wrapper = SwaggerClientWrapper(swagger_client)
 
         for container_type in self.container_types:
@@ -465,6 +538,50 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                     any_order=True,
                 )
 
+    @patch("neptune.new.internal.backends.hosted_neptune_backend.track_to_existing_artifact")
+    @patch("neptune.new.internal.backends.hosted_neptune_backend.track_to_new_artifact")
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_track_artifacts_errors(
+        self, track_to_new_artifact_mock, track_to_existing_artifact_mock, swagger_client_factory
+    ):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_id = str(uuid.uuid4())
+        project_id = str(uuid.uuid4())
+
+        swagger_client.api.executeOperations.return_value.response.return_value.result = []
+        swagger_client.api.getExperimentAttributes.return_value.response.return_value.result.attributes = [
+            self._artifact_attribute("existing", "dummyHash")
+        ]
+        error = ArtifactUploadingError("failed")
+        track_to_new_artifact_mock.side_effect = error
+        track_to_existing_artifact_mock.return_value = None
+
+        # when
+        _, errors = backend.execute_operations(
+            container_id=container_id,
+            container_type=ContainerType.RUN,
+            operations=[
+                TrackFilesToArtifact(path=["existing"], project_id=project_id, entries=[("/path/to/file", None)]),
+                TrackFilesToArtifact(path=["new"], project_id=project_id, entries=[("/path/to/file", None)]),
+            ],
+        )
+
+        # then
+        self.assertEqual([error], errors)
+        swagger_client.api.getExperimentAttributes.assert_called_once()
+        track_to_new_artifact_mock.assert_called_once()
+        self.assertEqual(["new"], track_to_new_artifact_mock.call_args.kwargs["path"])
+        self.assertEqual("dummyHash", track_to_existing_artifact_mock.call_args.kwargs["artifact_hash"])
+
+    @staticmethod
+    def _artifact_attribute(path: str, artifact_hash: str):
+        attribute = MagicMock(type="artifact")
+        attribute.name = path
+        attribute.artifactProperties.hash = artifact_hash
+        return attribute
+
     @patch(
         "neptune.new.internal.backends.hosted_client.neptune_client_version",
         Version("0.5.13"),
@@ -575,3 +692,84 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             LogFloats(["float1"], [LogFloats.ValueType(1, 2, 3)]),
                         ],
                     )
+
+
+class TestGetAllItems(unittest.TestCase):
+    def _get_portion(self, keys, with_count=True):
+        requests = []
+
+        def get_portion(limit, offset, search_after, by_key):
+            requests.append((limit, offset, search_after, by_key))
+            if offset + limit > MAX_SERVER_OFFSET:
+                raise HTTPUnprocessableEntity(response=None)
+            matching = sorted(keys) if by_key else keys
+            matching = [key for key in matching if search_after is None or key > search_after]
+            return matching[offset : offset + limit], len(matching) if with_count else None
+
+        return get_portion, requests
+
+    def test_fetch_beyond_max_server_offset(self):
+        keys = [f"RUN-{i:05d}" for i in range(25_000)]
+        for with_count in (True, False):
+            with self.subTest(with_count=with_count):
+                get_portion, requests = self._get_portion(keys, with_count)
+                progress = []
+
+                items = HostedNeptuneBackend._get_all_items(
+                    get_portion,
+                    step=1000,
+                    get_key=lambda key: key,
+                    max_workers=4,
+                    progress_callback=lambda fetched, total: progress.append((fetched, total)),
+                )
+
+                self.assertEqual(keys, items)
+                self.assertEqual([None, "RUN-09999", "RUN-19999"], sorted({r[2] for r in requests}, key=str))
+                self.assertEqual([(1000, 0, None, False)], [r for r in requests if not r[3]])
+                self.assertEqual((25_000, 25_000 if with_count else None), progress[-1])
+                self.assertEqual(sorted(progress), progress)
+
+    def test_fetch_window_of_exact_size(self):
+        keys = [f"RUN-{i:05d}" for i in range(MAX_SERVER_OFFSET)]
+        get_portion, requests = self._get_portion(keys)
+
+        items = HostedNeptuneBackend._get_all_items(get_portion, step=1000, get_key=lambda key: key)
+
+        self.assertEqual(keys, items)
+        self.assertEqual(10, len(requests))
+        self.assertFalse(any(request[3] for request in requests))
+
+    def test_fetch_in_server_order_within_max_server_offset(self):
+        # the server returns the most recent entries first, which is not the order of keys
+        keys = [f"SAN-{i}" for i in range(2500, 0, -1)]
+        for with_count in (True, False):
+            with self.subTest(with_count=with_count):
+                get_portion, requests = self._get_portion(keys, with_count)
+
+                items = HostedNeptuneBackend._get_all_items(get_portion, step=1000, get_key=lambda key: key)
+
+                if with_count:
+                    self.assertEqual(keys, items)
+                    self.assertEqual([False] * 3, [request[3] for request in requests])
+                else:
+                    self.assertEqual(sorted(keys), items)
+
+    def test_fetch_prefetches_few_portions(self):
+        keys = [f"RUN-{i:05d}" for i in range(MAX_SERVER_OFFSET)]
+        get_portion, requests = self._get_portion(keys)
+
+        portions = HostedNeptuneBackend._iter_all_items(get_portion, step=1000, get_key=lambda key: key, max_workers=2)
+        self.assertEqual(keys[:1000], next(portions))
+        self.assertEqual(keys[1000:2000], next(portions))
+        portions.close()
+
+        # the first portion, the consumed one and at most two following ones
+        self.assertLessEqual(len(requests), 4)
+
+    def test_fetch_stops_without_key(self):
+        keys = [f"RUN-{i:05d}" for i in range(12_000)]
+        get_portion, _ = self._get_portion(keys)
+
+        items = HostedNeptuneBackend._get_all_items(get_portion, step=1000, get_key=lambda _: None)
+
+        self.assertEqual(keys[:MAX_SERVER_OFFSET], items)
@@ -13,7 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
+import time
 import unittest
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from unittest.mock import patch
 
 from neptune.new.internal.backends.nql import (
     NQLAggregator,
@@ -21,6 +29,8 @@ from neptune.new.internal.backends.nql import (
     NQLAttributeType,
     NQLQueryAggregate,
     NQLQueryAttribute,
+    build_filter_queries,
+    build_filter_query,
 )
 
 
@@ -70,6 +80,28 @@ class TestNQL(unittest.TestCase):
             ),
             "(`sys/trashed`:bool = false)",
         )
+        self.assertEqual(
+            str(
+                NQLQueryAttribute(
+                    name="sys/id",
+                    type=NQLAttributeType.STRING,
+                    operator=NQLAttributeOperator.GREATER_THAN,
+                    value="RUN-12",
+                )
+            ),
+            '(`sys/id`:string > "RUN-12")',
+        )
+        self.assertEqual(
+            str(
+                NQLQueryAttribute(
+                    name="sys/modification_time",
+                    type=NQLAttributeType.DATETIME,
+                    operator=NQLAttributeOperator.GREATER_THAN_OR_EQUAL,
+                    value="2022-10-01T12:00:00.000Z",
+                )
+            ),
+            '(`sys/modification_time`:datetime >= "2022-10-01T12:00:00.000Z")',
+        )
 
     def test_multiple_attribute_values(self):
         self.assertEqual(
@@ -126,3 +158,68 @@ class TestNQL(unittest.TestCase):
             '(((`sys/owner`:string = "user1") OR (`sys/owner`:string = "user2")) AND '
             '((`sys/tags`:stringSet CONTAINS "tag1") OR (`sys/tags`:stringSet CONTAINS "tag2")))',
         )
+
+    def test_filters(self):
+        week_ago = datetime(2022, 10, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+        self.assertEqual(
+            [
+                "(`val/acc`:float > 0.9)",
+                "(`epochs`:integer != 10)",
+                "(`val/acc`:float > 1.0)",
+                '(`sys/creation_time`:datetime >= "2022-10-01T12:30:00.000Z")',
+                "(`sys/failed`:bool = false)",
+                '(`sys/owner`:string = "user1")',
+                "((`val/loss`:float >= 0.1) AND (`val/loss`:float <= 0.5))",
+                "(`val/loss`:float <= 1.5)",
+                "(`val/loss`:float < 1.5)",
+                "(`val/acc`:float EXISTS)",
+            ],
+            [
+                str(query)
+                for query in build_filter_queries(
+                    [
+                        ("val/acc", ">", 0.9),
+                        ("epochs", "!=", 10, "integer"),
+                        ("val/acc", ">", 1),
+                        ("sys/creation_time", ">=", week_ago),
+                        ("sys/failed", "==", False),
+                        ("sys/owner", "=", "user1"),
+                        ("val/loss", "between", (0.1, 0.5)),
+                        ("val/loss", "between", (None, 1.5)),
+                        ("val/loss", "<", 1.5),
+                        ("val/acc", "exists", "float"),
+                    ]
+                )
+            ],
+        )
+
+    def test_string_filters_are_escaped(self):
+        self.assertEqual(
+            '(`sys/name`:string = "say \\"hi\\" \\\\o/")',
+            str(build_filter_query("sys/name", "=", 'say "hi" \\o/')),
+        )
+
+    @patch.dict(os.environ, {"TZ": "Europe/Warsaw"})
+    def test_naive_datetimes_are_local(self):
+        time.tzset()
+        try:
+            self.assertEqual(
+                '(`sys/creation_time`:datetime >= "2022-10-01T12:30:00.000Z")',
+                str(build_filter_query("sys/creation_time", ">=", datetime(2022, 10, 1, 14, 30))),
+            )
+        finally:
+            time.tzset()
+
+    def test_invalid_filters(self):
+        with self.assertRaises(ValueError):
+            build_filter_query("val/acc", "~", 0.9)
+        with self.assertRaises(ValueError):
+            build_filter_query("val/acc", "between", (None, None))
+        with self.assertRaises(ValueError):
+            build_filter_query("val/acc", "exists", "number")
+        with self.assertRaises(ValueError):
+            build_filter_query("val/acc", ">", 1, "number")
+        with self.assertRaises(TypeError):
+            build_filter_query("val/acc", ">", [0.9])
+        with self.assertRaises(ValueError):
+            build_filter_queries([("val/acc", 0.9)])
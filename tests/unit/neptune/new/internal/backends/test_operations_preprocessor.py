@@ -29,6 +29,7 @@ from neptune.new.internal.operation import (
     DeleteAttribute,
     LogFloats,
     LogImages,
+    LogMultipleFloats,
     LogStrings,
     RemoveStrings,
     TrackFilesToArtifact,
@@ -201,6 +202,34 @@ class TestOperationsPreprocessor(TestAttributeBase):
         )
         self.assertEqual(processor.processed_ops_count, len(operations))
 
+    def test_multiple_floats(self):
+        # given
+        processor = OperationsPreprocessor()
+
+        operations = [
+            LogFloats(["train", "loss"], [FLog(1, 1, 3)]),
+            LogMultipleFloats(["train"], {"loss": 2, "layer/grad_norm": 20}, 2, 4),
+            LogMultipleFloats(["train"], {"loss": 3, "layer/grad_norm": 30}, 3, 5),
+            ClearFloatLog(["train", "layer", "grad_norm"]),
+            LogMultipleFloats([], {"train/layer/grad_norm": 40}, None, 6),
+        ]
+
+        # when
+        processor.process(operations)
+
+        # then
+        result = processor.get_operations()
+        self.assertEqual(
+            result.other_operations,
+            [
+                ClearFloatLog(["train", "layer", "grad_norm"]),
+                LogFloats(["train", "layer", "grad_norm"], [FLog(40, None, 6)]),
+                LogFloats(["train", "loss"], [FLog(1, 1, 3), FLog(2, 2, 4), FLog(3, 3, 5)]),
+            ],
+        )
+        self.assertEqual(result.errors, [])
+        self.assertEqual(processor.processed_ops_count, len(operations))
+
     def test_sets(self):
         # given
         processor = OperationsPreprocessor()
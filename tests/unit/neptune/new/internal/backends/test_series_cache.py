@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy
+from mock import patch
+
+from neptune.new.envs import (
+    NEPTUNE_SERIES_CACHE,
+    NEPTUNE_SERIES_CACHE_DIR,
+)
+from neptune.new.internal.backends.series_cache import (
+    SeriesCache,
+    get_series_cache,
+)
+
+PATH = ["train", "loss"]
+
+
+def _float_columns(first_step, count):
+    steps = numpy.arange(first_step, first_step + count, dtype=float)
+    return steps, steps * 0.5, 1000 + steps.astype(numpy.int64)
+
+
+class TestSeriesCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = SeriesCache(Path(self.tmp_dir.name), max_bytes=1024 * 1024)
+
+    def assertColumnsEqual(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for expected_column, actual_column in zip(expected, actual):
+            self.assertEqual(list(expected_column), list(actual_column))
+
+    def test_values_are_appended(self):
+        self.assertIsNone(self.cache.get("run-id", PATH, float))
+
+        self.cache.append("run-id", PATH, _float_columns(0, 10))
+        self.cache.append("run-id", PATH, _float_columns(10, 5), cached_count=10)
+
+        self.assertColumnsEqual(_float_columns(0, 15), self.cache.get("run-id", PATH, float))
+        self.assertIsNone(self.cache.get("other-run-id", PATH, float))
+
+    def test_string_values(self):
+        values = numpy.array(["a", "zażółć\ngęślą", '"quoted"'], dtype=object)
+        columns = (numpy.array([1.0, numpy.nan, 3.0]), values, numpy.array([10, 11, 12], dtype=numpy.int64))
+
+        self.cache.append("run-id", PATH, columns)
+
+        steps, cached_values, timestamps = self.cache.get("run-id", PATH, object)
+        self.assertEqual(list(values), list(cached_values))
+        self.assertTrue(numpy.isnan(steps[1]))
+        self.assertEqual([10, 11, 12], list(timestamps))
+
+    def test_append_to_outdated_entry_is_ignored(self):
+        self.cache.append("run-id", PATH, _float_columns(0, 10))
+
+        self.cache.append("run-id", PATH, _float_columns(5, 5), cached_count=5)
+
+        self.assertColumnsEqual(_float_columns(0, 10), self.cache.get("run-id", PATH, float))
+
+    def test_interrupted_append_is_dropped(self):
+        self.cache.append("run-id", PATH, _float_columns(0, 10))
+        for file_path in self.cache._entry_path("run-id", PATH).glob("*.bin"):
+            with open(file_path, "ab") as column_file:
+                column_file.write(b"garbage")
+
+        self.assertColumnsEqual(_float_columns(0, 10), self.cache.get("run-id", PATH, float))
+        self.cache.append("run-id", PATH, _float_columns(10, 2), cached_count=10)
+        self.assertColumnsEqual(_float_columns(0, 12), self.cache.get("run-id", PATH, float))
+
+    def test_entry_locked_by_other_process_is_not_changed(self):
+        self.cache.append("run-id", PATH, _float_columns(0, 10))
+        entry_path = self.cache._entry_path("run-id", PATH)
+        lock_path = entry_path.with_name(entry_path.name + ".lock")
+        lock_path.touch()
+
+        self.cache.append("run-id", PATH, _float_columns(10, 5), cached_count=10)
+        self.cache.append("run-id", PATH, _float_columns(0, 3))
+        self.cache.invalidate("run-id", PATH)
+
+        self.assertColumnsEqual(_float_columns(0, 10), self.cache.get("run-id", PATH, float))
+        self.assertTrue(lock_path.exists())
+
+    def test_stale_lock_is_broken(self):
+        self.cache.append("run-id", PATH, _float_columns(0, 10))
+        entry_path = self.cache._entry_path("run-id", PATH)
+        lock_path = entry_path.with_name(entry_path.name + ".lock")
+        lock_path.touch()
+        os.utime(lock_path, (0, 0))
+
+        self.cache.append("run-id", PATH, _float_columns(10, 5), cached_count=10)
+
+        self.assertColumnsEqual(_float_columns(0, 15), self.cache.get("run-id", PATH, float))
+        self.assertFalse(lock_path.exists())
+
+    def test_invalidate(self):
+        self.cache.append("run-id", PATH, _float_columns(0, 10))
+
+        self.cache.invalidate("run-id", PATH)
+
+        self.assertIsNone(self.cache.get("run-id", PATH, float))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        # each entry takes 100 values * 24 bytes
+        cache = SeriesCache(Path(self.tmp_dir.name), max_bytes=2 * 2400)
+        cache.append("run-id", ["a"], _float_columns(0, 100))
+        cache.append("run-id", ["b"], _float_columns(0, 100))
+        os.utime(cache._entry_path("run-id", ["a"]) / "meta.json", (1000, 1000))
+        os.utime(cache._entry_path("run-id", ["b"]) / "meta.json", (2000, 2000))
+        cache.get("run-id", ["a"], float)
+
+        cache.append("run-id", ["c"], _float_columns(0, 100))
+
+        self.assertIsNotNone(cache.get("run-id", ["a"], float))
+        self.assertIsNone(cache.get("run-id", ["b"], float))
+        self.assertIsNotNone(cache.get("run-id", ["c"], float))
+
+    def test_cache_is_opt_in(self):
+        with patch.dict("os.environ", {NEPTUNE_SERIES_CACHE_DIR: self.tmp_dir.name}):
+            self.assertIsNone(get_series_cache())
+            with patch.dict("os.environ", {NEPTUNE_SERIES_CACHE: "True"}):
+                self.assertEqual(Path(self.tmp_dir.name), get_series_cache().dir_path)
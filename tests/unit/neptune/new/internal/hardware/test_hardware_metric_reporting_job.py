@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+
+from mock import (
+    MagicMock,
+    patch,
+)
+
+from neptune.common.hardware.metrics.reports.metric_report import (
+    MetricReport,
+    MetricValue,
+)
+from neptune.new.envs import (
+    NEPTUNE_MONITORING_AGGREGATION,
+    NEPTUNE_MONITORING_SAMPLING_PERIOD,
+)
+from neptune.new.internal.hardware.hardware_metric_reporting_job import HardwareMetricReportingJob
+
+
+class _FakeMetricReporter:
+    def __init__(self, samples):
+        self._samples = iter(samples)
+
+    def report(self, timestamp):
+        cpu, gpu_0, gpu_1 = next(self._samples)
+        return [
+            MetricReport(metric=MagicMock(resource_type="cpu"), values=[MetricValue(timestamp, 0, "cpu", cpu)]),
+            MetricReport(
+                metric=MagicMock(resource_type="gpu"),
+                values=[MetricValue(timestamp, 0, "0", gpu_0), MetricValue(timestamp, 0, "1", gpu_1)],
+            ),
+        ]
+
+
+@patch("time.time", new=lambda: 1000.0)
+class TestHardwareMetricReportingJob(unittest.TestCase):
+    SAMPLES = [(10.0, 1.0, 4.0), (30.0, 3.0, 2.0), (20.0, 8.0, 3.0)]
+
+    def _create_thread(self, job, samples_per_report):
+        job._gauges_in_resource = {"cpu": 1, "gpu": 2}
+        container = MagicMock()
+        thread = HardwareMetricReportingJob.ReportingThread(
+            job, job._sampling_period, samples_per_report, container, _FakeMetricReporter(self.SAMPLES)
+        )
+        return thread, container
+
+    def test_all_gauges_are_logged_at_once(self):
+        thread, container = self._create_thread(HardwareMetricReportingJob(), samples_per_report=1)
+
+        thread.work()
+
+        container.log_metrics.assert_called_once_with(
+            {"monitoring/cpu": 10.0, "monitoring/gpu_0": 1.0, "monitoring/gpu_1": 4.0}, timestamp=1000.0
+        )
+
+    def test_samples_are_aggregated(self):
+        for aggregation, expected in [("mean", (20.0, 4.0, 3.0)), ("max", (30.0, 8.0, 4.0))]:
+            with self.subTest(aggregation):
+                job = HardwareMetricReportingJob(period=3, sampling_period=1, aggregation=aggregation)
+                thread, container = self._create_thread(job, samples_per_report=3)
+
+                thread.work()
+                thread.work()
+                container.log_metrics.assert_not_called()
+                thread.work()
+
+                container.log_metrics.assert_called_once_with(
+                    dict(zip(["monitoring/cpu", "monitoring/gpu_0", "monitoring/gpu_1"], expected)), timestamp=1000.0
+                )
+
+    @patch.dict("os.environ", {NEPTUNE_MONITORING_SAMPLING_PERIOD: "2.5", NEPTUNE_MONITORING_AGGREGATION: "max"})
+    def test_config_from_env(self):
+        job = HardwareMetricReportingJob()
+
+        self.assertEqual(2.5, job._sampling_period)
+        self.assertEqual("max", job._aggregation)
+
+    def test_partial_period_is_reported_on_stop(self):
+        job = HardwareMetricReportingJob(period=3, sampling_period=1)
+        thread, container = self._create_thread(job, samples_per_report=3)
+        thread._sleep_time = 60
+
+        thread.start()
+        thread.interrupt()
+        thread.join()
+
+        container.log_metrics.assert_called_once_with(
+            {"monitoring/cpu": 10.0, "monitoring/gpu_0": 1.0, "monitoring/gpu_1": 4.0}, timestamp=1000.0
+        )
+
+    def test_invalid_config_from_env_falls_back_to_defaults(self):
+        for sampling_period in ("fast", "0", "20"):
+            with self.subTest(sampling_period):
+                with patch.dict(
+                    "os.environ",
+                    {NEPTUNE_MONITORING_SAMPLING_PERIOD: sampling_period, NEPTUNE_MONITORING_AGGREGATION: "median"},
+                ):
+                    job = HardwareMetricReportingJob(period=10)
+
+                self.assertEqual(10, job._sampling_period)
+                self.assertEqual("mean", job._aggregation)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            HardwareMetricReportingJob(period=10, sampling_period=20)
+        with self.assertRaises(ValueError):
+            HardwareMetricReportingJob(aggregation="median")
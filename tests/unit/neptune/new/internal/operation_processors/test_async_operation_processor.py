@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import threading
+import unittest
+import uuid
+from tempfile import TemporaryDirectory
+
+from mock import (
+    MagicMock,
+    patch,
+)
+
+from neptune.new.internal.container_type import ContainerType
+from neptune.new.internal.operation import (
+    AssignFloat,
+    LogFloats,
+)
+from neptune.new.internal.operation_processors.async_operation_processor import AsyncOperationProcessor
+
+
+class TestAsyncOperationProcessor(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        data_path = os.path.join(tmp_dir.name, "exec")
+        patcher = patch.object(AsyncOperationProcessor, "_init_data_path", return_value=data_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.lock = threading.RLock()
+        self.backend = MagicMock()
+        self.backend.execute_operations.side_effect = lambda container_id, container_type, operations: (
+            len(operations),
+            [],
+        )
+        self.processor = AsyncOperationProcessor(
+            str(uuid.uuid4()), ContainerType.RUN, self.backend, self.lock, sleep_time=0.1
+        )
+
+    def _sent_operations(self):
+        return [op for call in self.backend.execute_operations.call_args_list for op in call.kwargs["operations"]]
+
+    def test_operations_are_sent_in_order(self):
+        ops = [AssignFloat(["a"], i) for i in range(50)] + [LogFloats(["b"], [LogFloats.ValueType(1.0, None, 5)])]
+        self.processor.start()
+
+        with self.lock:
+            for op in ops:
+                self.processor.enqueue_operation(op, wait=False)
+            self.processor.wait()
+        self.processor.stop()
+
+        self.assertEqual(ops, self._sent_operations())
+
+    def test_enqueue_does_not_wait_for_disk_writes(self):
+        self.processor.start()
+
+        with self.processor._write_lock:
+            # the writer thread is blocked, as if the disk was slow
+            self.processor.enqueue_operation(AssignFloat(["a"], 1), wait=False)
+            self.processor.enqueue_operation(AssignFloat(["a"], 2), wait=False)
+            self.assertEqual(2, len(self.processor._pending_operations))
+
+        with self.lock:
+            self.processor.wait()
+        self.processor.stop()
+
+        self.assertEqual([AssignFloat(["a"], 1), AssignFloat(["a"], 2)], self._sent_operations())
+
+    def test_ack_does_not_hold_container_lock(self):
+        ack_started, ack_released = threading.Event(), threading.Event()
+        original_ack = self.processor._queue.ack
+
+        def slow_ack(version):
+            ack_started.set()
+            ack_released.wait(5)
+            original_ack(version)
+
+        self.processor._queue.ack = slow_ack
+        self.processor.start()
+        self.processor.enqueue_operation(AssignFloat(["a"], 1), wait=False)
+        self.processor.flush()
+        self.processor._consumer.wake_up()
+        self.assertTrue(ack_started.wait(5))
+
+        # the consumer is in the middle of acknowledging, logging still goes through
+        self.assertTrue(self.lock.acquire(timeout=1))
+        self.processor.enqueue_operation(AssignFloat(["a"], 2), wait=False)
+        self.lock.release()
+
+        ack_released.set()
+        with self.lock:
+            self.processor.wait()
+        self.processor.stop()
+
+        self.assertEqual([AssignFloat(["a"], 1), AssignFloat(["a"], 2)], self._sent_operations())
+
+    def test_disk_write_error_is_raised_on_next_call(self):
+        original_put = self.processor._queue.put
+
+        def failing_put(op):
+            if op == AssignFloat(["a"], 1):
+                raise OSError("No space left on device")
+            return original_put(op)
+
+        self.processor._queue.put = failing_put
+        self.processor.start()
+        self.processor.enqueue_operation(AssignFloat(["a"], 1), wait=False)
+
+        with self.assertRaises(OSError):
+            self.processor.flush()
+
+        # the error is raised once, later operations are still saved
+        self.processor.enqueue_operation(AssignFloat(["a"], 2), wait=False)
+        with self.lock:
+            self.processor.wait()
+        self.processor.stop()
+
+        self.assertEqual([AssignFloat(["a"], 2)], self._sent_operations())
@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import hashlib
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from neptune.new.internal.operation_processors.blob_storage import BlobStorage
+
+
+class TestBlobStorage(unittest.TestCase):
+    def test_put_is_content_addressed(self):
+        with TemporaryDirectory() as dirpath:
+            storage = BlobStorage(Path(dirpath))
+
+            first = storage.put(b"some content")
+            second = storage.put(b"some content")
+            other = storage.put(b"other content")
+
+            self.assertEqual(first, second)
+            self.assertNotEqual(first, other)
+            with open(storage.get_path(first), "rb") as blob:
+                self.assertEqual(b"some content", blob.read())
+
+    def test_put_file(self):
+        with TemporaryDirectory() as dirpath:
+            storage = BlobStorage(Path(dirpath) / "blobs")
+            source = Path(dirpath) / "source.bin"
+            source.write_bytes(b"file content")
+
+            blob_path = storage.put_file(str(source))
+
+            self.assertEqual(storage.put(b"file content"), blob_path)
+            self.assertEqual("blobs/" + hashlib.sha1(b"file content").hexdigest(), blob_path)
+            self.assertEqual([storage.get_path(blob_path)], list(storage.dir_path.iterdir()))
+
+    def test_release_removes_unreferenced_blobs(self):
+        with TemporaryDirectory() as dirpath:
+            storage = BlobStorage(Path(dirpath))
+
+            blob_path = storage.put(b"some content")
+            storage.put(b"some content")
+
+            storage.release([blob_path])
+            self.assertTrue(os.path.exists(storage.get_path(blob_path)))
+
+            storage.release([blob_path])
+            self.assertFalse(os.path.exists(storage.get_path(blob_path)))
+
+    def test_release_keeps_blobs_put_by_other_instances(self):
+        with TemporaryDirectory() as dirpath:
+            blob_path = BlobStorage(Path(dirpath)).put(b"some content")
+            storage = BlobStorage(Path(dirpath))
+
+            storage.release([blob_path])
+
+            self.assertTrue(os.path.exists(storage.get_path(blob_path)))
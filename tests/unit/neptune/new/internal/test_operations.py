@@ -38,8 +38,11 @@ from neptune.new.internal.operation import (
     DeleteAttribute,
     DeleteFiles,
     ImageValue,
+    LogFloatColumns,
     LogFloats,
     LogImages,
+    LogMultipleFloats,
+    LogStringColumns,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -108,6 +111,12 @@ class TestOperations(unittest.TestCase):
                     LogFloats.ValueType(10, 10, 1234),
                 ],
             ),
+            LogFloatColumns(TestOperations._random_path(), [5.0, 3.0, 10.0], [4.0, 6.0, 10.0], [500.0] * 3),
+            LogFloatColumns(TestOperations._random_path(), [5.0, 3.0], None, [500.0, 1000.0]),
+            LogStringColumns(TestOperations._random_path(), ["a", "b\tc"], [1.0, None], [500.0, 501.0]),
+            LogStringColumns(TestOperations._random_path(), ["a"], None, [500.0]),
+            LogMultipleFloats(TestOperations._random_path(), {"loss": 0.5, "layer_1/grad_norm": 3.0}, 7, 500.0),
+            LogMultipleFloats(TestOperations._random_path(), {"lr": 0.001}, None, 1000.0),
             LogStrings(
                 TestOperations._random_path(),
                 [
@@ -122,6 +131,7 @@ class TestOperations(unittest.TestCase):
                 [
                     LogImages.ValueType(ImageValue("base64_image_1", "name1", "description1"), None, 2),
                     LogImages.ValueType(ImageValue("base64_image_2", "name2", "description2"), 0, 5),
+                    LogImages.ValueType(ImageValue(None, "name3", "description3", "blobs/da39a3ee5e6b4b0d"), 1, 7),
                 ],
             ),
             ClearFloatLog(TestOperations._random_path()),
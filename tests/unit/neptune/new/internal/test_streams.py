@@ -20,6 +20,7 @@ from contextlib import redirect_stdout
 from io import StringIO
 from unittest.mock import MagicMock
 
+from neptune.new import init_run
 from neptune.new.internal.streams.std_stream_capture_logger import (
     StdoutCaptureLogger,
     StdStreamCaptureLogger,
@@ -32,9 +33,9 @@ class FakeLogger:
         self._event_to_wait = event_to_wait
         self._real_logger = real_logger
 
-    def log(self, data):
+    def write(self, data):
         self._event_to_wait.wait()
-        self._real_logger.log(data)
+        self._real_logger.write(data)
 
 
 class TestStdStreamCaptureLogger(unittest.TestCase):
@@ -49,7 +50,7 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
             logger.close()
 
             self.assertListEqual(
-                mock_run[attr_name].log.call_args_list,
+                mock_run.get_attribute(attr_name).write.call_args_list,
                 [
                     (("testing",), {}),
                     (("\n",), {}),
@@ -68,7 +69,7 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
             logger.close()
 
             print("testing", file=stdout_fp)
-            mock_run[attr_name].log.assert_not_called()
+            mock_run.get_attribute(attr_name).write.assert_not_called()
         stdout.seek(0)
         self.assertEqual(stdout.read(), "testing\n")
 
@@ -84,17 +85,52 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
         # The logger is blocked in background, the main thread is still awake
         logger.write("testing")
         self.assertListEqual(
-            mock_run[attr_name].log.call_args_list,
+            mock_run.get_attribute(attr_name).write.call_args_list,
             [],
         )
 
         done_waiting.set()
         logger.close()
         self.assertListEqual(
-            mock_run[attr_name].log.call_args_list,
+            mock_run.get_attribute(attr_name).write.call_args_list,
             [
                 (("testing",), {}),
             ],
         )
         stream.seek(0)
         self.assertEqual(stream.read(), "testing")
+
+    def test_output_is_split_into_lines(self):
+        stdout = StringIO()
+        with redirect_stdout(stdout), init_run(mode="debug", flush_period=0.5) as run:
+            attr_name = "sys/stdout"
+            logger = StdoutCaptureLogger(run, attr_name)
+            print("first line")
+            print("second", "line")
+            sys.stdout.write("\rprogress 10%\rprogress 50%\rprogress 100%\n")
+            print("unfinished", end="")
+            logger.close()
+            run.wait()
+
+            self.assertEqual(
+                ["first line", "second line", "progress 100%"],
+                list(run[attr_name].fetch_values().value),
+            )
+        self.assertIn("unfinished", stdout.getvalue())
+
+    def test_streamed_series_is_configured_once(self):
+        mock_run = MagicMock()
+        attr_name = "sys/stdout"
+        logger = NeptuneLogger(mock_run, attr_name, stream=True)
+
+        logger.write("first")
+        logger.write("second")
+        logger.log("third")
+
+        mock_run[attr_name].configure.assert_called_once_with(stream=True)
+        mock_run.lock.assert_called_once_with()
+        self.assertListEqual(
+            mock_run.get_attribute(attr_name).write.call_args_list,
+            [(("first",), {}), (("second",), {})],
+        )
+        mock_run.get_attribute(attr_name).log.assert_called_once_with("third")
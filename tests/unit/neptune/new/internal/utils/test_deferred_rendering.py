@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2022, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+
+import pandas
+
+from neptune.new.internal.utils.deferred_rendering import (
+    DeferredOperations,
+    DeferredRenderer,
+)
+from neptune.new.types import File
+
+
+class TestDeferredRenderer(unittest.TestCase):
+    def test_object_is_snapshotted(self):
+        renderer = DeferredRenderer(workers=1)
+        started, release = threading.Event(), threading.Event()
+
+        renderer.submit(lambda _: started.set() or release.wait(), None)
+        started.wait()
+        values = [1, 2]
+        rendered = renderer.submit(lambda obj: ",".join(map(str, obj)), values)
+        values.append(3)
+        release.set()
+
+        self.assertEqual("1,2", rendered.result(timeout=5))
+
+    def test_submit_blocks_when_too_many_objects_are_pending(self):
+        renderer = DeferredRenderer(workers=1, max_pending=2)
+        release = threading.Event()
+        renderer.submit(lambda _: release.wait(), None)
+        renderer.submit(lambda _: "second", None)
+
+        submitted = threading.Event()
+        thread = threading.Thread(target=lambda: renderer.submit(lambda _: "third", None) and submitted.set())
+        thread.start()
+
+        self.assertFalse(submitted.wait(0.2))
+        release.set()
+        self.assertTrue(submitted.wait(5))
+        thread.join()
+
+    def test_submit_blocks_when_snapshots_take_too_much_memory(self):
+        renderer = DeferredRenderer(workers=1, max_pending_bytes=1000)
+        release = threading.Event()
+        # a single object larger than the limit is accepted
+        renderer.submit(lambda _: release.wait(), b"x" * 2000)
+
+        submitted = threading.Event()
+        thread = threading.Thread(target=lambda: renderer.submit(len, b"y" * 10) and submitted.set())
+        thread.start()
+
+        self.assertFalse(submitted.wait(0.2))
+        release.set()
+        self.assertTrue(submitted.wait(5))
+        thread.join()
+
+    def test_file_as_html_deferred(self):
+        df = pandas.DataFrame({"a": [1, 2]})
+
+        file = File.as_html(df, defer=True)
+
+        self.assertEqual("html", file.extension)
+        self.assertEqual(File.as_html(df).content, file.content)
+
+
+class TestDeferredOperations(unittest.TestCase):
+    def setUp(self):
+        self.enqueued = []
+        self.operations = DeferredOperations(threading.RLock(), self.enqueued.append)
+
+    def tearDown(self):
+        self.operations.stop()
+
+    def wait_for_enqueued(self, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while len(self.enqueued) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_operations_are_enqueued_in_order(self):
+        first, second = Future(), Future()
+        self.operations.add(["a"], first, lambda: "first")
+        self.operations.add(["b"], second, lambda: "second")
+        self.operations.add(["a"], None, lambda: "third")
+
+        second.set_result(None)
+        time.sleep(0.1)
+        self.assertEqual([], self.enqueued)
+        self.assertTrue(self.operations.is_pending(["a"]))
+
+        # enqueued in the background, without further calls
+        first.set_result(None)
+        self.wait_for_enqueued(3)
+        self.assertEqual(["first", "second", "third"], self.enqueued)
+        self.assertFalse(self.operations.is_pending(["a"]))
+
+    def test_rendered_operations_are_enqueued_while_container_lock_is_held(self):
+        container_lock = threading.RLock()
+        operations = DeferredOperations(container_lock, self.enqueued.append)
+        rendered = Future()
+        operations.add(["a"], rendered, lambda: "op")
+
+        with container_lock:
+            # render threads don't wait for the container lock
+            rendered.set_result(None)
+            self.assertEqual([], self.enqueued)
+        self.wait_for_enqueued(1)
+        operations.stop()
+
+        self.assertEqual(["op"], self.enqueued)
+
+    def test_flush_waits_for_rendering(self):
+        rendered = Future()
+        self.operations.add(["a"], rendered, lambda: "op")
+        threading.Timer(0.1, lambda: rendered.set_result(None)).start()
+
+        self.operations.flush()
+
+        self.assertEqual(["op"], self.enqueued)
+
+    def test_flush_with_more_renders_than_workers(self):
+        container_lock = threading.RLock()
+        operations = DeferredOperations(container_lock, self.enqueued.append)
+        renderer = DeferredRenderer(workers=2)
+        release = threading.Event()
+        for i in range(3):
+            rendered = renderer.submit(lambda obj: release.wait() and obj, i)
+            operations.add([str(i)], rendered, lambda i=i: i)
+
+        def flush():
+            # the container lock is held while flushing, like in `wait()`
+            with container_lock:
+                operations.flush()
+
+        thread = threading.Thread(target=flush, daemon=True)
+        thread.start()
+        release.set()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([0, 1, 2], self.enqueued)
+
+    def test_failed_rendering_is_skipped(self):
+        failed, rendered = Future(), Future()
+        self.operations.add(["a"], failed, lambda: "failed")
+        self.operations.add(["b"], rendered, lambda: "op")
+
+        with self.assertLogs("neptune-client", level="ERROR"):
+            failed.set_exception(ValueError("cannot render"))
+            rendered.set_result(None)
+            self.wait_for_enqueued(1)
+
+        self.assertEqual(["op"], self.enqueued)
+
+    def test_discard(self):
+        rendered = Future()
+        self.operations.add(["a", "b"], rendered, lambda: "discarded")
+        self.operations.add(["c"], None, lambda: "op")
+
+        self.operations.discard(["a"])
+
+        self.assertEqual(["op"], self.enqueued)
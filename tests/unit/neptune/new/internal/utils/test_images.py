@@ -19,6 +19,7 @@ import os
 import sys
 import unittest
 from typing import Optional
+from unittest.mock import patch
 from uuid import uuid4
 
 import altair as alt
@@ -37,6 +38,7 @@ from neptune.common.utils import (
     IS_WINDOWS,
 )
 from neptune.new.internal.utils.images import (
+    ImageOptions,
     get_html_content,
     get_image_content,
 )
@@ -72,7 +74,7 @@ class TestImage(unittest.TestCase):
     def test_get_image_content_from_3d_grayscale_array(self):
         # given
         image_array = numpy.array([[[1], [0]], [[-3], [4]], [[5], [6]]])
-        expected_array = numpy.array([[1, 0], [-3, 4], [5, 6]]) * 255
+        expected_array = numpy.array([[255, 0], [0, 255], [255, 255]])
         expected_image = Image.fromarray(expected_array.astype(numpy.uint8))
 
         # expect
@@ -109,6 +111,71 @@ class TestImage(unittest.TestCase):
         # and make sure that original image's size was preserved
         self.assertFalse((image_array * 255 - scaled_array).any())
 
+    def test_get_image_content_from_uint8_array(self):
+        # given
+        image_array = numpy.random.randint(0, 255, (20, 30, 3), dtype=numpy.uint8)
+        expected_image = Image.fromarray(image_array)
+
+        # expect
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(get_image_content(image_array), self._encode_pil_image(expected_image))
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_get_image_content_with_options(self):
+        # given
+        image_array = self._random_image_array(w=200, h=100)
+
+        # when
+        jpeg = Image.open(io.BytesIO(get_image_content(image_array, ImageOptions(format="jpeg", quality=50))))
+        webp = Image.open(io.BytesIO(get_image_content(image_array, ImageOptions(format="webp"))))
+        thumbnail = Image.open(io.BytesIO(get_image_content(image_array, ImageOptions(max_size=50))))
+        gradient = numpy.tile(numpy.linspace(0, 1, 200), (100, 1))
+        uncompressed = get_image_content(gradient, ImageOptions(compress_level=0))
+
+        # then
+        self.assertEqual(("JPEG", (100, 200)), (jpeg.format, jpeg.size))
+        self.assertEqual(("WEBP", (100, 200)), (webp.format, webp.size))
+        self.assertEqual(("PNG", (25, 50)), (thumbnail.format, thumbnail.size))
+        self.assertGreater(len(uncompressed), len(get_image_content(gradient)))
+
+    def test_get_thumbnail_without_reducing_gap(self):
+        # given
+        image_array = self._random_image_array(w=200, h=100)
+        resize = Image.Image.resize
+
+        def resize_without_reducing_gap(image, size, resample=None):
+            return resize(image, size)
+
+        # when
+        with patch.object(Image.Image, "resize", resize_without_reducing_gap):
+            thumbnail = Image.open(io.BytesIO(get_image_content(image_array, ImageOptions(max_size=50))))
+
+        # then
+        self.assertEqual(("PNG", (25, 50)), (thumbnail.format, thumbnail.size))
+
+    def test_get_image_content_from_rgba_array_as_jpeg(self):
+        # given
+        image_array = self._random_image_array(d=4)
+
+        # when
+        image = Image.open(io.BytesIO(get_image_content(image_array, ImageOptions(format="jpeg"))))
+
+        # then
+        self.assertEqual(("JPEG", "RGB"), (image.format, image.mode))
+
+    def test_invalid_image_options(self):
+        with self.assertRaises(ValueError):
+            ImageOptions(format="bmp")
+        with self.assertRaises(ValueError):
+            ImageOptions(quality=0)
+        with self.assertRaises(ValueError):
+            ImageOptions(compress_level=10)
+        with self.assertRaises(ValueError):
+            ImageOptions(max_size=0)
+        with self.assertRaises(TypeError):
+            ImageOptions(max_size="10")
+
     def test_get_image_content_from_figure(self):
         # given
         pyplot.plot([1, 2, 3, 4])
@@ -15,6 +15,7 @@
 #
 import argparse
 import os
+import threading
 import time
 import unittest
 from dataclasses import dataclass
@@ -29,6 +30,8 @@ from io import (
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
+import numpy
+import pandas
 import PIL
 
 from neptune.new import (
@@ -41,7 +44,11 @@ from neptune.new.attributes.atoms.file import File
 from neptune.new.attributes.atoms.float import Float
 from neptune.new.attributes.atoms.integer import Integer
 from neptune.new.attributes.atoms.string import String
-from neptune.new.attributes.series import FileSeries
+from neptune.new.attributes.series import (
+    FileSeries,
+    FloatSeries,
+    StringSeries,
+)
 from neptune.new.attributes.sets.string_set import StringSet
 from neptune.new.envs import (
     API_TOKEN_ENV_NAME,
@@ -51,6 +58,7 @@ from neptune.new.exceptions import (
     FileNotFound,
     NeptuneUserApiInputException,
 )
+from neptune.new.internal.operation import LogMultipleFloats
 from neptune.new.types import File as FileVal
 from neptune.new.types.atoms.artifact import Artifact
 from neptune.new.types.atoms.datetime import Datetime as DatetimeVal
@@ -187,6 +195,29 @@ class TestUpload(unittest.TestCase):
             zip_write_mock.assert_any_call(os.path.abspath("path/to/file.txt"), "path/to/file.txt")
             zip_write_mock.assert_any_call(os.path.abspath("path/to/other/file.txt"), "path/to/other/file.txt")
 
+    def test_download_range_only_for_file_series(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["some/num/attr_name"] = FileVal.from_stream(StringIO("Some test content of the stream"))
+
+            with self.assertRaises(NeptuneUserApiInputException):
+                exp["some/num/attr_name"].download(start=1, workers=2)
+
+    def test_wait_for_more_deferred_renders_than_workers(self):
+        def upload_and_wait():
+            with init_run(mode="debug", flush_period=0.5) as exp:
+                for i in range(3):
+                    exp[f"some/img/{i}"].upload(FileVal.as_image(numpy.random.rand(10, 10), defer=True))
+                exp.wait()
+                uploaded.append([exp[f"some/img/{i}"].fetch_extension() for i in range(3)])
+
+        uploaded = []
+        thread = threading.Thread(target=upload_and_wait, daemon=True)
+        thread.start()
+        thread.join(30)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([["png", "png", "png"]], uploaded)
+
 
 class TestSeries(unittest.TestCase):
     @classmethod
@@ -246,6 +277,59 @@ class TestSeries(unittest.TestCase):
             self.assertEqual(exp["some"]["str"]["val"].fetch_last(), "some text")
             self.assertIsInstance(exp.get_structure()["some"]["img"]["val"], FileSeries)
 
+    def test_append_to_existing_series(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["some/num/val"].append(1, step=1, timestamp=100)
+            exp["some/num/val"].append(2.5, step=2, timestamp=101)
+            exp["some/num/val"].append(4)
+
+            self.assertEqual([1.0, 2.5, 4.0], list(exp["some/num/val"].fetch_values()["value"]))
+
+    def test_append_after_pop(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["some/val"].append(1)
+            exp["some"].pop("val")
+            exp["some/val"].append("text")
+            exp["other"].assign(3)
+            exp["other"].pop()
+            exp["other/num"].append(5)
+
+            self.assertIsInstance(exp.get_structure()["some"]["val"], StringSeries)
+            self.assertEqual(exp["other/num"].fetch_last(), 5)
+
+    def test_log_metrics(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp.log_metrics({"train": {"loss": 2, "acc": 0.5}, "lr": 0.1}, step=1)
+            exp["train"].log_metrics({"loss": 1.5, "acc": numpy.float32(0.75)}, step=2)
+
+            self.assertEqual([2.0, 1.5], list(exp["train/loss"].fetch_values()["value"]))
+            self.assertEqual(exp["train/acc"].fetch_last(), 0.75)
+            self.assertEqual(exp["lr"].fetch_last(), 0.1)
+            self.assertIsInstance(exp.get_structure()["train"]["acc"], FloatSeries)
+
+    def test_log_metrics_enqueues_single_operation(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["train/loss"].append(3)
+            with patch.object(exp._op_processor, "enqueue_operation") as enqueue_operation:
+                exp["train"].log_metrics({"loss": 2, "acc": 0.5}, step=1, timestamp=100)
+
+            enqueue_operation.assert_called_once_with(
+                LogMultipleFloats(["train"], {"loss": 2.0, "acc": 0.5}, 1, 100), False
+            )
+
+    def test_log_metrics_errors(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["some/str"].assign("text")
+
+            with self.assertRaises(TypeError):
+                exp.log_metrics([1, 2])
+            with self.assertRaises(TypeError):
+                exp.log_metrics({"some/num": "1.0"})
+            with self.assertRaises(NeptuneUserApiInputException):
+                exp.log_metrics({"some/num": 1, "some/str": 2})
+
+            self.assertNotIn("num", exp.get_structure()["some"])
+
     def test_append_dict(self):
         with init_run(mode="debug", flush_period=0.5) as exp:
             dict_value = {"key-a": "value-a", "key-b": "value-b"}
@@ -312,6 +396,39 @@ class TestSeries(unittest.TestCase):
             self.assertEqual(exp["some"]["str"]["val"].fetch_last(), "text")
             self.assertIsInstance(exp.get_structure()["some"]["img"]["val"], FileSeries)
 
+    def test_extend_numpy_array(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["some/num/val"].extend(numpy.array([5, 7, 9]), steps=numpy.array([1, 2, 3]))
+            exp["some/num/val"].extend([11.0])
+            exp["some/num/series"].extend(pandas.Series([0.5, 0.25]))
+            self.assertEqual(exp["some"]["num"]["val"].fetch_last(), 11)
+            self.assertEqual(list(exp["some"]["num"]["val"].fetch_values()["value"].array), [5, 7, 9, 11])
+            self.assertEqual(exp["some"]["num"]["series"].fetch_last(), 0.25)
+            self.assertIsInstance(exp.get_structure()["some"]["num"]["val"], FloatSeries)
+
+    def test_configure_aggregation(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["train/loss"].configure(aggregate="mean")
+            for value in range(250):
+                exp["train/loss"].append(value)
+            exp.wait()
+            self.assertEqual(list(exp["train/loss"].fetch_values()["value"].array), [49.5, 149.5, 224.5])
+            self.assertIsInstance(exp.get_structure()["train"]["loss"], FloatSeries)
+
+    def test_configure_stream(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            exp["train/progress"].configure(stream=True)
+            for value in range(250):
+                exp["train/progress"].append(f"step {value}")
+            self.assertIsInstance(exp.get_structure()["train"]["progress"], StringSeries)
+            self.assertEqual(250, len(exp["train/progress"].fetch_values()))
+
+            with self.assertRaises(NeptuneUserApiInputException):
+                exp["train/progress"].configure(aggregate="mean")
+            exp["train/loss"].append(1.0)
+            with self.assertRaises(NeptuneUserApiInputException):
+                exp["train/loss"].configure(stream=True)
+
     def test_extend_dict(self):
         with init_run(mode="debug", flush_period=0.5) as exp:
             dict_value = {"key-a": ["value-a", "value-aa"], "key-b": ["value-b", "value-bb"], "key-c": ["ccc"]}
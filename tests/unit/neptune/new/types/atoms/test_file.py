@@ -177,6 +177,18 @@ class TestFile(unittest.TestCase):
         self.assertEqual(file.extension, "png")
         self.assertEqual(file.content, _get_pil_image_data(expected_image))
 
+    def test_as_image_with_options(self):
+        # given
+        image = Image.fromarray((numpy.random.rand(64, 32, 3) * 255).astype(numpy.uint8))
+
+        # when
+        file = File.as_image(image, format="jpeg", quality=70, max_size=16)
+
+        # then
+        self.assertEqual(file.extension, "jpeg")
+        decoded = Image.open(BytesIO(file.content))
+        self.assertEqual(("JPEG", (8, 16)), (decoded.format, decoded.size))
+
     def test_as_html(self):
         # given
         p = figure(width=400, height=400)